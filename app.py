@@ -3,22 +3,22 @@
 Streamlit 애플리케이션의 메인 진입점입니다.
 """
 
+import time
+_import_start = time.perf_counter()
+
 import streamlit as st
 from pathlib import Path
 
-from src.data_access import DataAccessLayer
-from src.actions import ActionManager
-from src.models import GovernanceBadge
-from src.config_loader import load_governance_config
-from components.global_controls import render_governance_badges
-from components.action_inbox import render_action_inbox
-from components.strategy_overview import render_strategy_overview
-from components.key_initiatives import render_key_initiatives
+from src.startup import record_timing, seconds_since_start
+from components.data_gate import require_data
+from components.perf_panel import start_page_perf, finish_page_perf
 from styles import (
     PYLON_BLUE, PYLON_GREEN, PYLON_ORANGE, PYLON_TEXT, PYLON_BORDER,
     apply_page_style, create_footer
 )
 
+record_timing('imports:app', time.perf_counter() - _import_start)
+
 # Page configuration
 st.set_page_config(
     page_title="PYLON - 에너지 운영 플랫폼",
@@ -27,14 +27,29 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Per-section timings of this rerun
+perf = start_page_perf("홈")
+
 # Initialize
 data_dir = Path("data")
+perf.call('startup:require_data', require_data, data_dir)
+
+# Heavy modules are imported once data is ready (keeps the first response fast)
+from src.data_access import DataAccessLayer
+from components.memory_panel import render_memory_inspector
+from src.actions import ActionManager
+from src.models import GovernanceBadge
+from src.config_loader import load_governance_config
+from components.global_controls import render_governance_badges
+from components.action_inbox import render_action_inbox
+from components.strategy_overview import render_strategy_overview
+from components.key_initiatives import render_key_initiatives
 
 # Cache data loading for better performance
 @st.cache_data(ttl=300)  # Cache for 5 minutes
 def load_app_data():
     """Load all data with caching"""
-    dal = DataAccessLayer(data_dir)
+    dal = DataAccessLayer(data_dir, generate_missing=False)
     bills_df = dal.load_bills()
     return dal, bills_df
 
@@ -44,7 +59,7 @@ def load_governance_data():
     return load_governance_config()
 
 # Load data (cached)
-dal, bills_df = load_app_data()
+dal, bills_df = perf.call('load:app_data', load_app_data)
 action_manager = ActionManager(data_dir)
 gov_config = load_governance_data()
 latest_yymm = bills_df['yymm'].max() if len(bills_df) > 0 else None
@@ -268,6 +283,13 @@ with st.expander("📁 데이터 소스 관리"):
                 st.success("✅ 데이터 업로드 완료! 페이지를 새로고침하세요.")
                 st.rerun()
 
+# Admin memory inspector (only rendered with ?admin=1)
+render_memory_inspector(dal)
+
 # Footer with PYLON branding
 st.markdown(create_footer(), unsafe_allow_html=True)
 
+record_timing('first_render', seconds_since_start())
+
+# Log timings of this rerun (sidebar panel is opt-in)
+finish_page_perf(perf)
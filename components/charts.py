@@ -0,0 +1,223 @@
+"""Plotly chart helpers with bounded payloads for large point counts."""
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from typing import List, Optional, Tuple, Union
+
+
+# Above this many points traces switch from SVG to WebGL
+WEBGL_POINT_THRESHOLD = 5_000
+
+# Above this many points scatters are binned on the server
+MAX_SCATTER_POINTS = 50_000
+
+# Time series are downsampled (LTTB) to at most this many points per trace
+MAX_LINE_POINTS = 2_000
+
+# Grid size of server-side 2-D binning
+DENSITY_BINS = 120
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last point and, per bucket, the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    average, which preserves peaks and troughs.
+
+    Args:
+        x: Numeric x values (sorted)
+        y: y values
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted indices of the kept points
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0] = 0
+    kept[-1] = n - 1
+    prev = 0
+    for b in range(n_out - 2):
+        start, stop = edges[b], edges[b + 1]
+        next_start, next_stop = edges[b + 1], (edges[b + 2] if b + 2 < len(edges) else n)
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = np.nanmean(y[next_start:next_stop]) if next_stop > next_start else y[-1]
+
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:stop] - y[prev]) -
+            (x[prev] - x[start:stop]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.nanargmax(area)) if np.isfinite(area).any() else start
+        kept[b + 1] = prev
+    return kept
+
+
+def downsample_series(x, y, max_points: int = MAX_LINE_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Downsample a time series for display.
+
+    Non-numeric x (e.g. month labels) is downsampled by position.
+
+    Args:
+        x: x values (sorted)
+        y: y values
+        max_points: Maximum number of points
+
+    Returns:
+        (x, y) of the kept points
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    numeric_x = x.astype(np.float64) if np.issubdtype(x.dtype, np.number) else np.arange(len(x), dtype=np.float64)
+    idx = lttb_indices(numeric_x, y, max_points)
+    return x[idx], y[idx]
+
+
+def bin_2d(
+    x: np.ndarray,
+    y: np.ndarray,
+    values: Optional[np.ndarray] = None,
+    bins: int = DENSITY_BINS
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bin points onto a grid on the server.
+
+    Args:
+        x: x values
+        y: y values
+        values: Values averaged per cell (counts if None)
+        bins: Cells per axis
+
+    Returns:
+        (x centers, y centers, z grid with NaN for empty cells; rows follow y)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    valid = np.isfinite(x) & np.isfinite(y)
+    if values is not None:
+        values = np.asarray(values, dtype=np.float64)
+        valid &= np.isfinite(values)
+
+    counts, x_edges, y_edges = np.histogram2d(x[valid], y[valid], bins=bins)
+    if values is None:
+        z = counts
+    else:
+        sums, _, _ = np.histogram2d(x[valid], y[valid], bins=[x_edges, y_edges], weights=values[valid])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            z = sums / counts
+    z = np.where(counts > 0, z, np.nan)
+
+    x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+    y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+    return x_centers, y_centers, z.T
+
+
+def line_trace(
+    x,
+    y,
+    max_points: int = MAX_LINE_POINTS,
+    webgl_threshold: int = WEBGL_POINT_THRESHOLD,
+    **trace_kwargs
+) -> Union[go.Scatter, go.Scattergl]:
+    """
+    Line/marker trace that stays bounded for long series.
+
+    Args:
+        x: x values (sorted)
+        y: y values
+        max_points: Downsample above this many points (LTTB)
+        webgl_threshold: Use Scattergl above this many points
+        **trace_kwargs: Passed to go.Scatter / go.Scattergl
+
+    Returns:
+        Plotly trace
+    """
+    if len(x) > max_points:
+        x, y = downsample_series(x, y, max_points)
+    trace_cls = go.Scattergl if len(x) > webgl_threshold else go.Scatter
+    return trace_cls(x=x, y=y, **trace_kwargs)
+
+
+def scatter_figure(
+    df: pd.DataFrame,
+    x: str,
+    y: str,
+    color: Optional[str] = None,
+    hover_data: Optional[List[str]] = None,
+    title: Optional[str] = None,
+    labels: Optional[dict] = None,
+    color_continuous_scale: Optional[str] = None,
+    webgl_threshold: int = WEBGL_POINT_THRESHOLD,
+    max_points: int = MAX_SCATTER_POINTS,
+    bins: int = DENSITY_BINS
+) -> go.Figure:
+    """
+    Scatter chart whose payload is bounded by the fleet size.
+
+    Up to `webgl_threshold` points: regular SVG scatter. Up to `max_points`:
+    WebGL scatter. Beyond that: server-side 2-D binning rendered as a
+    heatmap (mean of `color` per cell, or point counts).
+
+    Args:
+        df: Data
+        x, y: Column names
+        color: Continuous color column
+        hover_data: Extra hover columns (point modes only)
+        title: Chart title
+        labels: Axis/legend labels (as in plotly express)
+        color_continuous_scale: Color scale name
+        webgl_threshold: Switch to WebGL above this many points
+        max_points: Switch to binning above this many points
+        bins: Cells per axis when binning
+
+    Returns:
+        Plotly figure
+    """
+    labels = labels or {}
+    n_points = len(df)
+
+    if n_points <= max_points:
+        return px.scatter(
+            df,
+            x=x,
+            y=y,
+            color=color,
+            hover_data=hover_data,
+            title=title,
+            labels=labels,
+            color_continuous_scale=color_continuous_scale,
+            render_mode='webgl' if n_points > webgl_threshold else 'svg'
+        )
+
+    x_centers, y_centers, z = bin_2d(
+        df[x].to_numpy(),
+        df[y].to_numpy(),
+        df[color].to_numpy() if color else None,
+        bins=bins
+    )
+    z_label = labels.get(color, color) if color else '점 수'
+    fig = go.Figure(go.Heatmap(
+        x=x_centers,
+        y=y_centers,
+        z=z,
+        colorscale=color_continuous_scale,
+        colorbar=dict(title=f"{z_label} (평균)" if color else z_label),
+        hoverongaps=False
+    ))
+    fig.update_layout(
+        title=f"{title} ({n_points:,}개 점 집계)" if title else None,
+        xaxis_title=labels.get(x, x),
+        yaxis_title=labels.get(y, y)
+    )
+    return fig
@@ -0,0 +1,48 @@
+"""Data readiness gate shown before a page renders."""
+
+import time
+import streamlit as st
+from pathlib import Path
+from typing import TYPE_CHECKING
+from src.startup import (
+    ensure_data_ready, data_job_error, record_timing, seconds_since_start, schedule_warm_up
+)
+
+if TYPE_CHECKING:
+    from src.data_access import DataAccessLayer
+
+
+def require_data(data_dir: Path, poll_seconds: float = 1.0) -> 'DataAccessLayer':
+    """
+    Return a DataAccessLayer once the datasets are available.
+
+    On a fresh deploy the sample data is generated in a background thread;
+    meanwhile a placeholder is rendered and the page reruns every
+    `poll_seconds` instead of blocking the first request.
+
+    Args:
+        data_dir: Directory containing data files
+        poll_seconds: Delay between readiness checks
+
+    Returns:
+        DataAccessLayer for the data directory (cache warm-up is scheduled
+        in the background for new data versions)
+    """
+    status = ensure_data_ready(data_dir)
+
+    if status == 'failed':
+        st.error(f"샘플 데이터 생성 실패: {data_job_error(data_dir)}")
+        st.stop()
+
+    if status == 'generating':
+        st.info("⏳ 최초 실행: 샘플 데이터를 준비하고 있습니다. 잠시 후 자동으로 표시됩니다.")
+        st.caption(f"서버 시작 후 {seconds_since_start():.1f}초 경과")
+        time.sleep(poll_seconds)
+        st.rerun()
+
+    record_timing('first_data_ready', seconds_since_start())
+    # Imported here: the placeholder above renders before pandas and the analytics stack load
+    from src.data_access import DataAccessLayer
+    dal = DataAccessLayer(data_dir, generate_missing=False)
+    schedule_warm_up(dal)
+    return dal
@@ -0,0 +1,41 @@
+"""Hidden admin expander with memory usage."""
+
+import streamlit as st
+from src.memory import memory_report, format_bytes
+
+
+def render_memory_inspector(dal) -> None:
+    """
+    Render the memory inspector when the page is opened with ?admin=1.
+
+    Args:
+        dal: DataAccessLayer instance
+    """
+    if st.query_params.get("admin") != "1":
+        return
+
+    with st.expander("🧠 메모리 사용량 (관리자)", expanded=False):
+        if not st.button("메모리 측정", key="run_memory_report"):
+            st.caption("데이터셋·파생 캐시·세션 상태의 메모리를 측정합니다.")
+            return
+
+        report = memory_report(dal, st.session_state)
+        rss = report.loc[report['category'] == 'process', 'bytes'].iloc[0]
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("프로세스 RSS", format_bytes(rss))
+        with col2:
+            st.metric("데이터셋", format_bytes(report.loc[report['category'] == 'dataset', 'bytes'].sum()))
+        with col3:
+            st.metric("파생 캐시", format_bytes(report.loc[report['category'] == 'derived', 'bytes'].sum()))
+
+        display = report[report['category'] != 'process'].copy()
+        display['size'] = display['bytes'].apply(format_bytes)
+        st.dataframe(
+            display[['category', 'name', 'type', 'rows', 'size']].rename(columns={
+                'category': '구분', 'name': '항목', 'type': '타입', 'rows': '행 수', 'size': '메모리'
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
@@ -0,0 +1,190 @@
+"""Paginated table with server-side sort/filter and lazy exports."""
+
+import math
+import streamlit as st
+import pandas as pd
+from typing import Any, Dict, Optional, Tuple
+from src.exports import EXPORT_FORMATS, ExportCache, available_formats, export_key, write_export
+
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def filter_table(df: pd.DataFrame, query: str = "") -> pd.DataFrame:
+    """
+    Keep rows whose text columns contain the query (case-insensitive).
+
+    Args:
+        df: Full table
+        query: Search text (all rows if empty)
+
+    Returns:
+        Matching rows
+    """
+    if not query:
+        return df
+    text_cols = [
+        col for col in df.columns
+        if df[col].dtype == object or str(df[col].dtype) in ('string', 'category')
+    ]
+    mask = pd.Series(False, index=df.index)
+    for col in text_cols:
+        mask |= df[col].astype(str).str.contains(query, case=False, regex=False, na=False)
+    return df[mask]
+
+
+def sort_table(df: pd.DataFrame, sort_by: Optional[str] = None, ascending: bool = True) -> pd.DataFrame:
+    """Stable sort by one column (unchanged if the column is None or missing)."""
+    if sort_by is None or sort_by not in df.columns:
+        return df
+    return df.sort_values(sort_by, ascending=ascending, kind='mergesort', na_position='last')
+
+
+def slice_table(
+    df: pd.DataFrame,
+    query: str = "",
+    sort_by: Optional[str] = None,
+    ascending: bool = True,
+    page: int = 1,
+    page_size: int = DEFAULT_PAGE_SIZE
+) -> Tuple[pd.DataFrame, int]:
+    """
+    Filter, sort and slice a table on the server.
+
+    Args:
+        df: Full table
+        query: Search text matched against text columns
+        sort_by: Column to sort by (original order if None)
+        ascending: Sort direction
+        page: 1-based page number (clamped to the valid range)
+        page_size: Rows per page
+
+    Returns:
+        (rows of the page, number of matching rows)
+    """
+    result = sort_table(filter_table(df, query), sort_by, ascending)
+
+    n_rows = len(result)
+    n_pages = max(1, math.ceil(n_rows / page_size))
+    page = min(max(1, page), n_pages)
+    start = (page - 1) * page_size
+    return result.iloc[start:start + page_size], n_rows
+
+
+@st.cache_resource
+def _export_cache() -> ExportCache:
+    """Process-wide cache of finished exports."""
+    return ExportCache(max_entries=16)
+
+
+def render_table_export(
+    df: pd.DataFrame,
+    key: str,
+    file_name: str,
+    data_version: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    query: str = "",
+    sort_by: Optional[str] = None,
+    ascending: bool = True
+) -> None:
+    """
+    Export generated only on request, streamed in chunks and cached.
+
+    Exports are cached by (table, data version, filters, view, format).
+    Without filters the table content fingerprint stands in for them.
+
+    Args:
+        df: Full table
+        key: Unique widget key prefix (also the table id)
+        file_name: Download file name without extension
+        data_version: Data version the table derives from
+        filters: Filters the table was built with
+        query, sort_by, ascending: View to export (as shown in the table)
+    """
+    col_fmt, col_btn = st.columns([1, 3])
+    with col_fmt:
+        fmt = st.selectbox(
+            "형식",
+            options=available_formats(),
+            key=f"{key}_format",
+            format_func=str.upper,
+            label_visibility="collapsed"
+        )
+    with col_btn:
+        if st.button("📥 내보내기 준비", key=f"{key}_export"):
+            st.session_state[f"{key}_export_ready"] = True
+
+    if not st.session_state.get(f"{key}_export_ready"):
+        return
+
+    if filters is None:
+        filters = {'fingerprint': int(pd.util.hash_pandas_object(df, index=False).sum())}
+    cache_key = export_key(key, data_version, filters, fmt, query=query, sort_by=sort_by, ascending=ascending)
+
+    def build():
+        view = sort_table(filter_table(df, query), sort_by, ascending)
+        return write_export(view, fmt)
+
+    try:
+        data = _export_cache().get_stream(cache_key, build)
+    except (ImportError, ValueError) as e:
+        st.error(f"내보내기 실패: {e}")
+        return
+
+    extension, mime = EXPORT_FORMATS[fmt]
+    with data:
+        st.download_button(
+            label=f"{extension.upper()} 다운로드",
+            data=data,
+            file_name=f"{file_name}.{extension}",
+            mime=mime,
+            key=f"{key}_download"
+        )
+
+
+def render_paged_table(
+    df: pd.DataFrame,
+    key: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    data_version: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    export_file_name: Optional[str] = None
+) -> None:
+    """
+    Render a table page by page; only the visible rows are sent to the browser.
+
+    Args:
+        df: Full table (kept on the server)
+        key: Unique widget key prefix
+        page_size: Rows per page
+        data_version: Data version the table derives from (export cache key)
+        filters: Filters the table was built with (export cache key)
+        export_file_name: Offer a lazily generated export under this name (no extension)
+    """
+    col_query, col_sort, col_dir, col_page = st.columns([3, 2, 1, 1])
+
+    with col_query:
+        query = st.text_input("검색", key=f"{key}_query", placeholder="텍스트 컬럼 검색")
+    with col_sort:
+        sort_by = st.selectbox("정렬", options=[None] + list(df.columns), key=f"{key}_sort",
+                               format_func=lambda c: "기본 순서" if c is None else c)
+    with col_dir:
+        ascending = st.selectbox("방향", options=[True, False], key=f"{key}_dir",
+                                 format_func=lambda a: "오름차순" if a else "내림차순")
+
+    # Filtered once: the page count needs the match count before slicing
+    matching = filter_table(df, query)
+    n_pages = max(1, math.ceil(len(matching) / page_size))
+
+    with col_page:
+        page = int(st.number_input("페이지", min_value=1, max_value=n_pages, value=1, step=1, key=f"{key}_page"))
+
+    visible, n_rows = slice_table(matching, sort_by=sort_by, ascending=ascending, page=page, page_size=page_size)
+    st.dataframe(visible, use_container_width=True, hide_index=True)
+
+    start = (page - 1) * page_size
+    st.caption(f"총 {n_rows:,}행 중 {min(start + 1, n_rows):,}–{min(start + page_size, n_rows):,}행 "
+               f"({page}/{n_pages} 페이지)")
+
+    if export_file_name:
+        render_table_export(df, key, export_file_name, data_version, filters, query, sort_by, ascending)
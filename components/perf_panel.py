@@ -0,0 +1,57 @@
+"""Opt-in sidebar performance panel."""
+
+import streamlit as st
+from pathlib import Path
+from src.perf import PerfRun, start_run, write_run, read_runs
+
+
+PERF_LOG_PATH = Path("data") / "logs" / "perf.jsonl"
+
+
+def start_page_perf(page: str) -> PerfRun:
+    """
+    Start timing a page rerun.
+
+    Args:
+        page: Page name (used to group runs in the log)
+
+    Returns:
+        PerfRun to wrap sections with `perf.section(...)`
+    """
+    return start_run(page)
+
+
+def finish_page_perf(run: PerfRun, log_path: Path = PERF_LOG_PATH) -> None:
+    """
+    Log the rerun and render the sidebar panel if enabled.
+
+    Args:
+        run: PerfRun started by start_page_perf
+        log_path: Rotating JSONL log file
+    """
+    record = write_run(run, log_path)
+
+    with st.sidebar:
+        show_panel = st.checkbox(
+            "⏱️ 성능 패널 표시",
+            key="show_perf_panel",
+            help="이번 실행의 구간별 소요 시간과 행 수를 표시합니다"
+        )
+        if not show_panel:
+            return
+
+        # Imported here: the panel is opt-in and pages may stop before pandas is loaded
+        import pandas as pd
+
+        st.markdown(f"**이번 실행: {record['total_seconds']:.2f}초**")
+        if record['sections']:
+            sections_df = pd.DataFrame(record['sections']).rename(columns={
+                'section': '구간', 'seconds': '초', 'rows': '행 수'
+            })
+            st.dataframe(sections_df, use_container_width=True, hide_index=True)
+
+        history = read_runs(log_path, page=run.page, limit=20)
+        if len(history) > 1:
+            totals = pd.DataFrame({'실행 시간(초)': [r['total_seconds'] for r in history]})
+            st.caption(f"최근 {len(history)}회 실행")
+            st.line_chart(totals, height=120)
@@ -2,10 +2,14 @@
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, TYPE_CHECKING
 from src.actions import ActionManager
 from src.models import ActionCategory, ValidationState
+from components.paged_table import render_paged_table, render_table_export
+
+if TYPE_CHECKING:
+    # Only for annotations; plotly is imported by the pages that build charts
+    import plotly.graph_objects as go
 
 
 def render_widget_card(
@@ -13,13 +17,16 @@ def render_widget_card(
     value: any,
     metric_label: str,
     validation_state: ValidationState,
-    evidence_chart: Optional[go.Figure] = None,
+    evidence_chart: Optional['go.Figure'] = None,
     evidence_table: Optional[pd.DataFrame] = None,
     action_manager: Optional[ActionManager] = None,
     action_category: Optional[ActionCategory] = None,
     action_description_template: Optional[str] = None,
     owner: str = "담당자",
-    site_ids: Optional[List[str]] = None
+    site_ids: Optional[List[str]] = None,
+    data_version: Optional[str] = None,
+    filters: Optional[dict] = None,
+    site_action_descriptions: Optional[List[str]] = None
 ) -> None:
     """
     Render a widget card with evidence, target list, and action creation.
@@ -36,6 +43,10 @@ def render_widget_card(
         action_description_template: Template for action description (optional)
         owner: Default action owner
         site_ids: List of site IDs for bulk action creation (optional)
+        data_version: Data version of the evidence table (export cache key, optional)
+        filters: Filters the evidence table was built with (export cache key, optional)
+        site_action_descriptions: Per-site action descriptions aligned with site_ids;
+            enables bulk creation of one action per unique site (optional)
     """
     # Validation state badge
     state_colors = {
@@ -63,23 +74,24 @@ def render_widget_card(
             st.plotly_chart(evidence_chart, use_container_width=True)
         
         if evidence_table is not None and len(evidence_table) > 0:
-            st.dataframe(evidence_table, use_container_width=True, hide_index=True)
+            # Paged on the server: only the visible rows reach the browser
+            render_paged_table(evidence_table, key=f"evidence_{title}", data_version=data_version)
         
         if not evidence_chart and (evidence_table is None or len(evidence_table) == 0):
             st.info("표시할 근거 데이터가 없습니다.")
     
-    # Target list section
+    # Target list section (the rows themselves are in the evidence table above)
     if evidence_table is not None and len(evidence_table) > 0:
         with st.expander("🎯 대상 리스트"):
-            st.dataframe(evidence_table, use_container_width=True, hide_index=True)
+            st.markdown(f"**대상:** {len(evidence_table):,}건")
             
-            # Download button
-            csv = evidence_table.to_csv(index=False).encode('utf-8-sig')
-            st.download_button(
-                label="CSV 다운로드",
-                data=csv,
-                file_name=f"{title}_targets.csv",
-                mime="text/csv"
+            # Export is built on request, in chunks, and cached per data version and filters
+            render_table_export(
+                evidence_table,
+                key=f"targets_{title}",
+                file_name=f"{title}_targets",
+                data_version=data_version,
+                filters=filters
             )
     
     # Action creation section
@@ -101,21 +113,47 @@ def render_widget_card(
             with col_b:
                 due_days = st.number_input("마감일 (일)", min_value=1, max_value=90, value=7, key=f"due_days_{title}")
             
+            # Callers may pass row-level site_ids (e.g. site-months); act once per site
+            target_ids = list(pd.unique(pd.Series(site_ids, dtype=object))) if site_ids else []
+            
+            # Bulk: one action per target site, offered when the caller supplies per-site descriptions
+            per_site = False
+            if site_action_descriptions is not None and len(target_ids) > 1:
+                first_rows = ~pd.Index(site_ids).duplicated()
+                target_descriptions = [desc for desc, keep in zip(site_action_descriptions, first_rows) if keep]
+                per_site = st.checkbox(
+                    f"국소별 개별 조치 생성 ({len(target_ids):,}건)",
+                    value=True,
+                    key=f"action_per_site_{title}"
+                )
+            
             if st.button("✅ 조치 생성", key=f"create_action_{title}"):
                 # Create action
                 evidence_links = [title]
                 
-                action = action_manager.create_action(
-                    owner=action_owner,
-                    category=action_category,
-                    description=action_desc,
-                    site_id=site_ids[0] if site_ids and len(site_ids) == 1 else None,
-                    evidence_links=evidence_links,
-                    due_days=due_days
-                )
-                
-                st.success(f"✅ 조치 생성 완료: {action.id}")
-                st.info(f"담당자: {action_owner} | 마감일: {action.due_date.strftime('%Y-%m-%d')}")
+                if per_site:
+                    actions = action_manager.create_actions(
+                        owner=action_owner,
+                        category=action_category,
+                        descriptions=target_descriptions,
+                        site_ids=target_ids,
+                        evidence_links=evidence_links,
+                        due_days=due_days
+                    )
+                    st.success(f"✅ 조치 {len(actions):,}건 생성 완료: {actions[0].id} ~ {actions[-1].id}")
+                    st.info(f"담당자: {action_owner} | 마감일: {actions[0].due_date.strftime('%Y-%m-%d')}")
+                else:
+                    action = action_manager.create_action(
+                        owner=action_owner,
+                        category=action_category,
+                        description=action_desc,
+                        site_id=target_ids[0] if len(target_ids) == 1 else None,
+                        evidence_links=evidence_links,
+                        due_days=due_days
+                    )
+                    
+                    st.success(f"✅ 조치 생성 완료: {action.id}")
+                    st.info(f"담당자: {action_owner} | 마감일: {action.due_date.strftime('%Y-%m-%d')}")
     
     st.divider()
 
@@ -0,0 +1,47 @@
+"""Print memory usage of datasets and derived caches.
+
+    python memory_report.py [--data-dir data] [--dimension-dtype object|pyarrow|category] [--no-warm-up]
+
+The caches are warmed first as the app's startup does, so the report
+shows what a warm app process holds.
+"""
+
+import argparse
+import pandas as pd
+from pathlib import Path
+from src.data_access import DataAccessLayer, DIMENSION_DTYPES
+from src.memory import memory_report, format_bytes
+from src.startup import warm_up
+import sys
+
+# Set UTF-8 encoding for Windows console
+if sys.platform == 'win32':
+    import codecs
+    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report memory usage of loaded data")
+    parser.add_argument("--data-dir", default="data", help="Data directory")
+    parser.add_argument("--dimension-dtype", choices=DIMENSION_DTYPES, default=None,
+                        help="Dimension column dtype (default: config/data.yaml)")
+    parser.add_argument("--no-warm-up", action="store_true",
+                        help="Report only what is loaded without warming the caches")
+    args = parser.parse_args()
+
+    dal = DataAccessLayer(Path(args.data_dir), dimension_dtype=args.dimension_dtype)
+    if not args.no_warm_up:
+        warm_up(dal)
+    report = memory_report(dal)
+
+    print("Memory usage")
+    print("=" * 70)
+    for category in ['dataset', 'derived']:
+        part = report[report['category'] == category]
+        print(f"[{category}] total {format_bytes(part['bytes'].sum())}")
+        for _, row in part.iterrows():
+            rows = f"{int(row['rows']):,}" if pd.notna(row['rows']) else "-"
+            print(f"  {row['name']:<32} {rows:>10} rows  {format_bytes(row['bytes']):>10}")
+    rss = report.loc[report['category'] == 'process', 'bytes'].iloc[0]
+    print("=" * 70)
+    print(f"Process RSS: {format_bytes(rss)}")
@@ -1,11 +1,6 @@
 """에너지 인텔리전스 페이지 - 개요, 계획 대비 실적, 청구서 vs 실사용량"""
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-import altair as alt
 from pathlib import Path
 import sys
 import os
@@ -16,34 +11,50 @@ parent_dir = current_dir.parent
 if str(parent_dir) not in sys.path:
     sys.path.insert(0, str(parent_dir))
 
-from src.data_access import DataAccessLayer
+from components.data_gate import require_data
+from components.perf_panel import start_page_perf, finish_page_perf
+from styles import (
+    PYLON_BLUE, PYLON_ORANGE, apply_page_style, create_footer
+)
+
+# Page config
+st.set_page_config(page_title="에너지 인텔리전스 | PYLON", layout="wide", page_icon="⚡")
+
+# Per-section timings of this rerun
+perf = start_page_perf("에너지 인텔리전스")
+
+# Apply PYLON brand colors
+st.markdown(apply_page_style(), unsafe_allow_html=True)
+
+# Initialize
+data_dir = Path("data")
+dal = perf.call('startup:require_data', require_data, data_dir)
+
+# Heavy modules are imported once data is ready (keeps the first response fast)
+import pandas as pd
+import numpy as np
 from src.analytics import (
-    calculate_plan_variance,
     calculate_bill_actual_error,
     classify_bill_actual_mismatch,
     decompose_cost_variance,
     calculate_yoy_comparison,
     prepare_monthly_3year_comparison
 )
+from src.plan_engine import summarize_plan_performance, RUNRATE_WINDOW
+from src.cost_variance import VARIANCE_BASELINES, VARIANCE_DIMENSIONS, rollup_variance
+from src.forecasting import FORECAST_MODELS, MAX_HORIZON
 from src.actions import ActionManager
 from src.models import GovernanceBadge, ActionCategory, ValidationState
 from src.config_loader import load_governance_config
 from components.global_controls import render_sidebar_filters, render_governance_badges, apply_filters, render_filter_summary
 from components.widget_card import render_widget_card, render_simple_metric_card
+from components.paged_table import render_paged_table, render_table_export
 from components.action_inbox import render_compact_action_inbox
-from styles import (
-    PYLON_BLUE, PYLON_ORANGE, apply_page_style, create_footer
-)
-
-# Page config
-st.set_page_config(page_title="에너지 인텔리전스 | PYLON", layout="wide", page_icon="⚡")
-
-# Apply PYLON brand colors
-st.markdown(apply_page_style(), unsafe_allow_html=True)
+import plotly.graph_objects as go
+import plotly.express as px
+import altair as alt
+from components.charts import line_trace
 
-# Initialize
-data_dir = Path("data")
-dal = DataAccessLayer(data_dir)
 action_manager = ActionManager(data_dir)
 
 # Load governance config
@@ -70,11 +81,12 @@ with st.sidebar:
     render_compact_action_inbox(action_manager, st.session_state["current_user"])
     st.divider()
 
-# Load data
-bills_df = dal.load_bills()
-actual_df = dal.load_actual()
-plan_df = dal.load_plan()
-site_master = dal.load_site_master()
+# Load data (all datasets read concurrently)
+datasets = perf.call('load:datasets', dal.load_all)
+bills_df = datasets.bills
+actual_df = datasets.actual
+plan_df = datasets.plan
+site_master = datasets.site_master
 
 if len(bills_df) == 0:
     st.error("청구서 데이터를 로드할 수 없습니다.")
@@ -93,14 +105,22 @@ filters = render_sidebar_filters(available_yymm)
 render_filter_summary(filters)
 
 # Apply filters
-filtered_bills = apply_filters(bills_df, filters)
+filtered_bills = perf.call('apply_filters:filtered_bills', apply_filters, bills_df, filters)
+
+# Plan performance of all months for the filtered sites (one table, cached per data version)
+filtered_site_ids = filtered_bills['site_id'].unique()
+plan_perf = perf.call(
+    'plan_engine:plan_performance',
+    dal.load_plan_performance,
+    None if len(filtered_site_ids) == bills_df['site_id'].nunique() else filtered_site_ids
+)
 
 st.markdown("---")
 
 # Tabs
 tab1, tab2, tab3 = st.tabs(["📊 개요", "📈 계획 대비 실적", "🔍 청구서 vs 실사용량"])
 
-with tab1:
+with tab1, perf.section('tab:개요'):
     st.markdown("## 📊 에너지 개요")
     
     if len(filtered_bills) == 0:
@@ -123,7 +143,7 @@ with tab1:
         if prev_year_yymm:
             filters_prev = filters.copy()
             filters_prev['yymm_list'] = prev_year_yymm
-            filtered_bills_prev = apply_filters(bills_df, filters_prev)
+            filtered_bills_prev = perf.call('apply_filters:filtered_bills_prev', apply_filters, bills_df, filters_prev)
             
             prev_total_kwh = filtered_bills_prev['kwh_bill'].sum()
             prev_total_cost = filtered_bills_prev['cost_bill'].sum()
@@ -173,7 +193,7 @@ with tab1:
         with col4:
             # YoY comparison - use the last month in selection
             selected_period = filters['yymm_list'][-1] if filters.get('yymm_list') else None
-            yoy_change = calculate_yoy_comparison(bills_df, selected_period, 'cost_bill') if selected_period else None
+            yoy_change = perf.call('calculate_yoy_comparison', calculate_yoy_comparison, bills_df, selected_period, 'cost_bill') if selected_period else None
             yoy_display = f"{yoy_change:+.1f}%" if yoy_change is not None else "N/A"
             render_simple_metric_card("YoY 변화 (최종월)", yoy_display, help_text="선택 기간의 마지막 월 기준")
         
@@ -197,11 +217,11 @@ with tab1:
             filters_no_period['yymm_list'] = []  # Remove period restriction
             
             # Apply all other filters
-            filtered_bills_no_period = apply_filters(bills_df, filters_no_period)
+            filtered_bills_no_period = perf.call('apply_filters:filtered_bills_no_period', apply_filters, bills_df, filters_no_period)
             
             # Prepare 3-year comparison data for multiple metrics
-            kwh_data = prepare_monthly_3year_comparison(filtered_bills_no_period, 'kwh_bill')
-            cost_data = prepare_monthly_3year_comparison(filtered_bills_no_period, 'cost_bill')
+            kwh_data = perf.call('prepare_monthly_3year_comparison', prepare_monthly_3year_comparison, filtered_bills_no_period, 'kwh_bill')
+            cost_data = perf.call('prepare_monthly_3year_comparison', prepare_monthly_3year_comparison, filtered_bills_no_period, 'cost_bill')
             
             if len(kwh_data) > 0 and len(cost_data) > 0:
                 # Calculate average unit cost (cost/kwh)
@@ -251,7 +271,8 @@ with tab1:
                         title='월별 전력량 (kWh) - 3개년 비교',
                         height=400
                     )
-                    st.altair_chart(chart_kwh, use_container_width=True)
+                    with perf.section('chart:chart_kwh'):
+                        st.altair_chart(chart_kwh, use_container_width=True)
                     
                     with st.expander("📊 데이터 테이블"):
                         pivot = kwh_data.pivot(index='month', columns='year', values='kwh')
@@ -274,7 +295,8 @@ with tab1:
                         title='월별 전기요금 (원) - 3개년 비교',
                         height=400
                     )
-                    st.altair_chart(chart_cost, use_container_width=True)
+                    with perf.section('chart:chart_cost'):
+                        st.altair_chart(chart_cost, use_container_width=True)
                     
                     with st.expander("📊 데이터 테이블"):
                         pivot = cost_data.pivot(index='month', columns='year', values='kwh')
@@ -297,7 +319,8 @@ with tab1:
                         title='월별 평균 단가 (원/kWh) - 3개년 비교',
                         height=400
                     )
-                    st.altair_chart(chart_avg, use_container_width=True)
+                    with perf.section('chart:chart_avg'):
+                        st.altair_chart(chart_avg, use_container_width=True)
                     
                     with st.expander("📊 데이터 테이블"):
                         pivot = avg_cost_data.pivot(index='month', columns='year', values='kwh')
@@ -321,7 +344,8 @@ with tab1:
                             title='월별 YoY 변화율 (%) - 전년 동월 대비',
                             height=400
                         )
-                        st.altair_chart(chart_yoy, use_container_width=True)
+                        with perf.section('chart:chart_yoy'):
+                            st.altair_chart(chart_yoy, use_container_width=True)
                         
                         with st.expander("📊 데이터 테이블"):
                             pivot = yoy_df.pivot(index='month', columns='year', values='kwh')
@@ -338,14 +362,14 @@ with tab1:
         # Plan variance
         st.markdown("### 계획 대비 실적 개요")
         
-        # Filter plan by selected periods
-        plan_month = plan_df[plan_df['yymm'].isin(filters['yymm_list'])] if filters.get('yymm_list') else plan_df
+        # Period totals from the plan performance table
+        plan_summary = summarize_plan_performance(plan_perf, filters.get('yymm_list'))
         
-        if len(plan_month) > 0:
-            plan_cost = plan_month['cost_plan'].sum()
-            plan_kwh = plan_month['kwh_plan'].sum()
+        if plan_summary and plan_summary['cost']['plan'] > 0:
+            plan_cost = plan_summary['cost']['plan']
+            plan_kwh = plan_summary['kwh']['plan']
             
-            variance_result = calculate_plan_variance(total_cost, plan_cost)
+            variance_result = plan_summary['cost']
             
             col1, col2, col3 = st.columns(3)
             
@@ -359,7 +383,7 @@ with tab1:
             with col2:
                 render_simple_metric_card(
                     "달성률",
-                    f"{variance_result['achievement_rate']:.1f}%"
+                    f"{variance_result['achievement']:.1f}%"
                 )
             
             with col3:
@@ -413,40 +437,50 @@ with tab1:
         else:
             st.info("월별 비교 데이터가 부족합니다.")
 
-with tab2:
+with tab2, perf.section('tab:계획 대비 실적'):
     st.markdown("## 📈 계획 대비 실적")
     
     # Trend chart
     st.markdown("### 월별 추이")
     
-    # Aggregate by month
-    monthly_actual = filtered_bills.groupby('yymm').agg({
-        'kwh_bill': 'sum',
-        'cost_bill': 'sum'
-    }).reset_index()
+    # Selected months of the plan performance table
+    yymm_selected = [int(ym) for ym in filters.get('yymm_list', [])]
+    monthly_combined = plan_perf[plan_perf['yymm'].isin(yymm_selected)] if yymm_selected else plan_perf
+    monthly_combined = monthly_combined[monthly_combined['cost_actual'].notna()]
     
-    # Merge with plan
-    monthly_plan = plan_df.groupby('yymm').agg({
-        'kwh_plan': 'sum',
-        'cost_plan': 'sum'
-    }).reset_index()
+    if len(filtered_site_ids) < bills_df['site_id'].nunique():
+        st.caption("📌 필터 적용 중: 전사 계획을 국소별 전년 동월 사용 비중으로 배분한 계획과 비교합니다.")
     
-    monthly_combined = monthly_actual.merge(monthly_plan, on='yymm', how='left')
+    # YTD and full-year run-rate as of the last selected month
+    plan_summary_tab2 = summarize_plan_performance(monthly_combined)
+    if plan_summary_tab2:
+        cost_summary = plan_summary_tab2['cost']
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            render_simple_metric_card("YTD 달성률 (비용)", f"{cost_summary['ytd_achievement']:.1f}%")
+        with col2:
+            render_simple_metric_card(
+                "연간 예상 비용 (Run-rate)",
+                f"₩{cost_summary['runrate']:,.0f}",
+                help_text=f"YTD 실적 + 남은 월 계획 × 최근 {RUNRATE_WINDOW}개월 달성률 (계획이 없으면 YTD 월평균 × 12)"
+            )
+        with col3:
+            render_simple_metric_card("연간 예상 달성률", f"{cost_summary['runrate_achievement']:.1f}%")
     
     # Cost trend
     fig_cost = go.Figure()
     
-    fig_cost.add_trace(go.Scatter(
-        x=monthly_combined['yymm'],
-        y=monthly_combined['cost_plan'],
+    fig_cost.add_trace(line_trace(
+        monthly_combined['yymm'],
+        monthly_combined['cost_plan'],
         name='Plan',
         mode='lines+markers',
         line=dict(dash='dash', color='blue')
     ))
     
-    fig_cost.add_trace(go.Scatter(
-        x=monthly_combined['yymm'],
-        y=monthly_combined['cost_bill'],
+    fig_cost.add_trace(line_trace(
+        monthly_combined['yymm'],
+        monthly_combined['cost_actual'],
         name='Actual',
         mode='lines+markers',
         line=dict(color='red')
@@ -459,20 +493,206 @@ with tab2:
         hovermode='x unified'
     )
     
-    st.plotly_chart(fig_cost, use_container_width=True)
+    with perf.section('chart:fig_cost'):
+        st.plotly_chart(fig_cost, use_container_width=True)
     
     # Variance table
     st.markdown("### 차이 분석")
     
-    monthly_combined['variance'] = monthly_combined['cost_bill'] - monthly_combined['cost_plan']
-    monthly_combined['variance_pct'] = (monthly_combined['variance'] / monthly_combined['cost_plan']) * 100
-    
-    variance_table = monthly_combined[['yymm', 'cost_plan', 'cost_bill', 'variance', 'variance_pct']].copy()
-    variance_table.columns = ['월', '계획', '실적', '차이', '차이율(%)']
+    variance_table = monthly_combined[[
+        'yymm', 'cost_plan', 'cost_actual', 'cost_variance', 'cost_variance_pct',
+        'cost_ytd_achievement', 'cost_runrate', 'cost_runrate_achievement'
+    ]].copy()
+    variance_table.columns = ['월', '계획', '실적', '차이', '차이율(%)', 'YTD 달성률(%)', '연간 예상(Run-rate)', '연간 예상 달성률(%)']
     
     st.dataframe(variance_table, use_container_width=True, hide_index=True)
+    
+    # kWh achievement (same table)
+    with st.expander("⚡ 전력량(kWh) 계획 대비 실적"):
+        kwh_table = monthly_combined[[
+            'yymm', 'kwh_plan', 'kwh_actual', 'kwh_variance', 'kwh_variance_pct',
+            'kwh_ytd_achievement', 'kwh_runrate', 'kwh_runrate_achievement'
+        ]].copy()
+        kwh_table.columns = ['월', '계획', '실적', '차이', '차이율(%)', 'YTD 달성률(%)', '연간 예상(Run-rate)', '연간 예상 달성률(%)']
+        st.dataframe(kwh_table, use_container_width=True, hide_index=True)
+    
+    # Regional plan lines from the allocated site-month plan
+    with st.expander("🗺️ 지역별 계획 대비 실적 (배분 계획)"):
+        site_plan = perf.call('derived:site_plan', dal.load_derived_table, 'site_plan')
+        site_plan = site_plan[site_plan['site_id'].isin(filtered_site_ids)]
+        region_actual = filtered_bills
+        if yymm_selected:
+            site_plan = site_plan[site_plan['yymm'].isin(yymm_selected)]
+            region_actual = region_actual[region_actual['yymm'].astype(int).isin(yymm_selected)]
+        
+        region_of_site = site_master.drop_duplicates('site_id').set_index('site_id')['region']
+        region_plan = site_plan.groupby(site_plan['site_id'].map(region_of_site), observed=True)['cost_plan'].sum()
+        region_table = pd.DataFrame({
+            '계획': region_plan,
+            '실적': region_actual.groupby('region', observed=True)['cost_bill'].sum()
+        }).fillna(0.0)
+        region_table['차이'] = region_table['실적'] - region_table['계획']
+        region_table['달성률(%)'] = np.where(region_table['계획'] > 0, region_table['실적'] / region_table['계획'] * 100, 0.0)
+        region_table = region_table.rename_axis('지역').reset_index()
+        
+        st.dataframe(region_table, use_container_width=True, hide_index=True)
+    
+    # Price / volume / mix decomposition of the cost change
+    st.markdown("### 💹 요금 변동 요인 분해")
+    
+    col_base, col_dim = st.columns(2)
+    with col_base:
+        variance_baseline = st.radio(
+            "비교 기준",
+            options=VARIANCE_BASELINES,
+            format_func=lambda b: {'prior_year': '전년 동월', 'plan_price': '전년 사용량 × 계획 단가'}[b],
+            horizontal=True,
+            key="variance_baseline"
+        )
+    with col_dim:
+        variance_dimension = st.selectbox(
+            "분해 기준",
+            options=VARIANCE_DIMENSIONS,
+            format_func=lambda d: {'region': '지역', 'site_type': '설비유형',
+                                   'contract_type': '계약유형', 'network_gen': '세대'}[d],
+            key="variance_dimension"
+        )
+    
+    site_variance = perf.call('cost_variance:site_variance', dal.load_site_variance, variance_baseline)
+    site_variance = site_variance[site_variance['site_id'].isin(filtered_site_ids)]
+    if yymm_selected:
+        site_variance = site_variance[site_variance['yymm'].isin(yymm_selected)]
+    
+    if len(site_variance) > 0:
+        by_group = rollup_variance(site_variance, [variance_dimension])
+        fleet = rollup_variance(site_variance).iloc[0]
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            render_simple_metric_card("총 변동", f"₩{fleet['total_variance']:,.0f}")
+        with col2:
+            render_simple_metric_card("물량 효과", f"₩{fleet['volume_effect']:,.0f}", help_text="사용량 변동 × 기준 단가")
+        with col3:
+            render_simple_metric_card("믹스 효과", f"₩{fleet['mix_effect']:,.0f}", help_text="단가가 다른 국소 간 사용량 이동")
+        with col4:
+            render_simple_metric_card("단가 효과", f"₩{fleet['price_effect']:,.0f}", help_text="국소 단가 변동 × 실적 사용량")
+        
+        effects_long = by_group.melt(
+            id_vars=[variance_dimension],
+            value_vars=['volume_effect', 'mix_effect', 'price_effect'],
+            var_name='effect',
+            value_name='amount'
+        )
+        effects_long['effect'] = effects_long['effect'].map(
+            {'volume_effect': '물량', 'mix_effect': '믹스', 'price_effect': '단가'}
+        )
+        fig_effects = px.bar(
+            effects_long,
+            x=variance_dimension,
+            y='amount',
+            color='effect',
+            barmode='relative',
+            title='요인별 요금 변동',
+            labels={'amount': '변동 (원)', 'effect': '요인'}
+        )
+        with perf.section('chart:fig_effects'):
+            st.plotly_chart(fig_effects, use_container_width=True)
+    else:
+        st.info("선택한 기간에 비교 기준 데이터가 없습니다.")
+    
+    # Forward view: batched per-site forecasts (precomputed per data version)
+    st.markdown("### 🔮 사용량·요금 전망")
+    
+    col_measure, col_model, col_horizon = st.columns(3)
+    with col_measure:
+        forecast_measure = st.radio(
+            "전망 항목",
+            options=['cost_bill', 'kwh_bill'],
+            format_func=lambda m: {'cost_bill': '비용', 'kwh_bill': '전력량'}[m],
+            horizontal=True,
+            key="forecast_measure"
+        )
+    with col_model:
+        forecast_model = st.radio(
+            "예측 모형",
+            options=FORECAST_MODELS,
+            format_func=lambda m: {'holt_winters': 'Holt-Winters', 'seasonal_naive': '전년 동월'}[m],
+            horizontal=True,
+            key="forecast_model"
+        )
+    with col_horizon:
+        forecast_horizon = st.slider("전망 기간 (개월)", 1, MAX_HORIZON, 6, key="forecast_horizon")
+    
+    fleet_forecast = perf.call(
+        'forecasting:forecast_total',
+        dal.load_forecast_total,
+        forecast_measure,
+        None if len(filtered_site_ids) == bills_df['site_id'].nunique() else filtered_site_ids,
+        forecast_model
+    ).head(forecast_horizon)
+    
+    if fleet_forecast['forecast'].notna().any():
+        measure_label = '비용 (원)' if forecast_measure == 'cost_bill' else '전력량 (kWh)'
+        history = plan_perf[plan_perf[forecast_measure.replace('_bill', '_actual')].notna()]
+        
+        fig_forecast = go.Figure()
+        fig_forecast.add_trace(line_trace(
+            history['yymm'].astype(str),
+            history[forecast_measure.replace('_bill', '_actual')],
+            name='실적',
+            mode='lines+markers',
+            line=dict(color=PYLON_BLUE)
+        ))
+        fig_forecast.add_trace(go.Scatter(
+            x=fleet_forecast['yymm'].astype(str).tolist() + fleet_forecast['yymm'].astype(str).tolist()[::-1],
+            y=fleet_forecast['upper'].tolist() + fleet_forecast['lower'].tolist()[::-1],
+            fill='toself',
+            fillcolor='rgba(255, 140, 0, 0.2)',
+            line=dict(width=0),
+            name='90% 예측구간',
+            hoverinfo='skip'
+        ))
+        fig_forecast.add_trace(line_trace(
+            fleet_forecast['yymm'].astype(str),
+            fleet_forecast['forecast'],
+            name='전망',
+            mode='lines+markers',
+            line=dict(dash='dash', color=PYLON_ORANGE)
+        ))
+        fig_forecast.update_layout(
+            title=f'{forecast_horizon}개월 전망',
+            xaxis_title='월',
+            yaxis_title=measure_label,
+            xaxis_type='category',
+            hovermode='x unified'
+        )
+        with perf.section('chart:fig_forecast'):
+            st.plotly_chart(fig_forecast, use_container_width=True)
+        
+        # Site forecasts summed over the horizon
+        site_forecast = perf.call('derived:forecast', dal.load_derived_table, 'forecast')
+        site_forecast = site_forecast[
+            (site_forecast['model'] == forecast_model)
+            & (site_forecast['horizon'] <= forecast_horizon)
+            & site_forecast['site_id'].isin(filtered_site_ids)
+        ]
+        site_totals = site_forecast.groupby('site_id', as_index=False, observed=True)[
+            ['kwh_bill_forecast', 'cost_bill_forecast', 'cost_bill_upper']
+        ].sum().sort_values('cost_bill_forecast', ascending=False)
+        site_totals.columns = ['국소ID', f'전망 전력량 ({forecast_horizon}개월)', f'전망 비용 ({forecast_horizon}개월)', '월별 비용 상한 합계']
+        
+        with st.expander(f"📋 국소별 전망 ({len(site_totals):,}개 국소)"):
+            render_paged_table(
+                site_totals,
+                key="site_forecast",
+                data_version=dal.get_data_version(),
+                filters={**filters, 'forecast_model': forecast_model, 'forecast_horizon': forecast_horizon},
+                export_file_name="국소별_전망"
+            )
+    else:
+        st.info("전망을 산출할 실적 데이터가 없습니다.")
 
-with tab3:
+with tab3, perf.section('tab:청구서 vs 실사용량'):
     st.markdown("## 🔍 청구서 vs 실사용량")
     
     # 청구서vs실사용량 화면 전용 월 선택
@@ -510,7 +730,7 @@ with tab3:
     # 기간 외 다른 필터 적용 (지역, 계약유형 등)
     filters_no_period = filters.copy()
     filters_no_period['yymm_list'] = []  # 기간 필터 제거
-    filtered_bills_month = apply_filters(bills_for_month, filters_no_period)
+    filtered_bills_month = perf.call('apply_filters:filtered_bills_month', apply_filters, bills_for_month, filters_no_period)
     
     # Merge bills and actual with explicit suffixes
     merged_bill_actual = filtered_bills_month.merge(
@@ -607,7 +827,7 @@ with tab3:
             st.markdown("#### 지역별 청구서 vs 실사용량 비교")
             
             # Aggregate by region
-            region_agg = merged_with_site.groupby('region').agg({
+            region_agg = merged_with_site.groupby('region', observed=True).agg({
                 'kwh_bill': 'sum',
                 'kwh_actual': 'sum',
                 'cost_bill': 'sum'
@@ -646,7 +866,8 @@ with tab3:
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig_region, use_container_width=True)
+            with perf.section('chart:fig_region'):
+                st.plotly_chart(fig_region, use_container_width=True)
             
             # Cost comparison
             fig_region_cost = go.Figure()
@@ -678,7 +899,8 @@ with tab3:
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig_region_cost, use_container_width=True)
+            with perf.section('chart:fig_region_cost'):
+                st.plotly_chart(fig_region_cost, use_container_width=True)
             
             with st.expander("📊 상세 데이터"):
                 region_agg['kwh_diff'] = region_agg['kwh_actual'] - region_agg['kwh_bill']
@@ -691,7 +913,7 @@ with tab3:
             st.markdown("#### 설비유형별 청구서 vs 실사용량 비교")
             
             # Aggregate by site_type
-            site_type_agg = merged_with_site.groupby('site_type').agg({
+            site_type_agg = merged_with_site.groupby('site_type', observed=True).agg({
                 'kwh_bill': 'sum',
                 'kwh_actual': 'sum',
                 'cost_bill': 'sum'
@@ -728,7 +950,8 @@ with tab3:
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig_site_type, use_container_width=True)
+            with perf.section('chart:fig_site_type'):
+                st.plotly_chart(fig_site_type, use_container_width=True)
             
             # Cost comparison
             fig_site_type_cost = go.Figure()
@@ -760,7 +983,8 @@ with tab3:
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig_site_type_cost, use_container_width=True)
+            with perf.section('chart:fig_site_type_cost'):
+                st.plotly_chart(fig_site_type_cost, use_container_width=True)
             
             with st.expander("📊 상세 데이터"):
                 site_type_agg['kwh_diff'] = site_type_agg['kwh_actual'] - site_type_agg['kwh_bill']
@@ -773,7 +997,7 @@ with tab3:
             st.markdown("#### 계약대상별 청구서 vs 실사용량 비교")
             
             # Aggregate by contract_target
-            contract_target_agg = merged_with_site.groupby('contract_target').agg({
+            contract_target_agg = merged_with_site.groupby('contract_target', observed=True).agg({
                 'kwh_bill': 'sum',
                 'kwh_actual': 'sum',
                 'cost_bill': 'sum'
@@ -810,7 +1034,8 @@ with tab3:
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig_contract_target, use_container_width=True)
+            with perf.section('chart:fig_contract_target'):
+                st.plotly_chart(fig_contract_target, use_container_width=True)
             
             # Cost comparison
             fig_contract_target_cost = go.Figure()
@@ -842,7 +1067,8 @@ with tab3:
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig_contract_target_cost, use_container_width=True)
+            with perf.section('chart:fig_contract_target_cost'):
+                st.plotly_chart(fig_contract_target_cost, use_container_width=True)
             
             with st.expander("📊 상세 데이터"):
                 contract_target_agg['kwh_diff'] = contract_target_agg['kwh_actual'] - contract_target_agg['kwh_bill']
@@ -855,7 +1081,7 @@ with tab3:
             st.markdown("#### 계약유형별 청구서 vs 실사용량 비교")
             
             # Aggregate by contract_type
-            contract_type_agg = merged_with_site.groupby('contract_type').agg({
+            contract_type_agg = merged_with_site.groupby('contract_type', observed=True).agg({
                 'kwh_bill': 'sum',
                 'kwh_actual': 'sum',
                 'cost_bill': 'sum'
@@ -892,7 +1118,8 @@ with tab3:
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig_contract_type, use_container_width=True)
+            with perf.section('chart:fig_contract_type'):
+                st.plotly_chart(fig_contract_type, use_container_width=True)
             
             # Cost comparison
             fig_contract_type_cost = go.Figure()
@@ -924,7 +1151,8 @@ with tab3:
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig_contract_type_cost, use_container_width=True)
+            with perf.section('chart:fig_contract_type_cost'):
+                st.plotly_chart(fig_contract_type_cost, use_container_width=True)
             
             with st.expander("📊 상세 데이터"):
                 contract_type_agg['kwh_diff'] = contract_type_agg['kwh_actual'] - contract_type_agg['kwh_bill']
@@ -937,7 +1165,7 @@ with tab3:
             st.markdown("#### 세대별 청구서 vs 실사용량 비교")
             
             # Aggregate by network_gen
-            network_gen_agg = merged_with_site.groupby('network_gen').agg({
+            network_gen_agg = merged_with_site.groupby('network_gen', observed=True).agg({
                 'kwh_bill': 'sum',
                 'kwh_actual': 'sum',
                 'cost_bill': 'sum'
@@ -974,7 +1202,8 @@ with tab3:
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig_network_gen, use_container_width=True)
+            with perf.section('chart:fig_network_gen'):
+                st.plotly_chart(fig_network_gen, use_container_width=True)
             
             # Cost comparison
             fig_network_gen_cost = go.Figure()
@@ -1006,7 +1235,8 @@ with tab3:
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig_network_gen_cost, use_container_width=True)
+            with perf.section('chart:fig_network_gen_cost'):
+                st.plotly_chart(fig_network_gen_cost, use_container_width=True)
             
             with st.expander("📊 상세 데이터"):
                 network_gen_agg['kwh_diff'] = network_gen_agg['kwh_actual'] - network_gen_agg['kwh_bill']
@@ -1019,7 +1249,7 @@ with tab3:
             st.markdown("#### RAPA여부별 청구서 vs 실사용량 비교")
             
             # Aggregate by rapa_type
-            rapa_agg = merged_with_site.groupby('rapa_type').agg({
+            rapa_agg = merged_with_site.groupby('rapa_type', observed=True).agg({
                 'kwh_bill': 'sum',
                 'kwh_actual': 'sum',
                 'cost_bill': 'sum'
@@ -1056,7 +1286,8 @@ with tab3:
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig_rapa, use_container_width=True)
+            with perf.section('chart:fig_rapa'):
+                st.plotly_chart(fig_rapa, use_container_width=True)
             
             # Cost comparison
             fig_rapa_cost = go.Figure()
@@ -1088,7 +1319,8 @@ with tab3:
                 hovermode='x unified'
             )
             
-            st.plotly_chart(fig_rapa_cost, use_container_width=True)
+            with perf.section('chart:fig_rapa_cost'):
+                st.plotly_chart(fig_rapa_cost, use_container_width=True)
             
             with st.expander("📊 상세 데이터"):
                 rapa_agg['kwh_diff'] = rapa_agg['kwh_actual'] - rapa_agg['kwh_bill']
@@ -1199,7 +1431,8 @@ with tab3:
                 )
             )
             
-            st.plotly_chart(fig_pie, use_container_width=True)
+            with perf.section('chart:fig_pie'):
+                st.plotly_chart(fig_pie, use_container_width=True)
         
         # 과대청구 국소 상세 분석
         st.markdown("#### 과대청구 국소 상세 분석")
@@ -1216,11 +1449,12 @@ with tab3:
             )
             
             # 2x3 그리드로 6개 기준별 도넛 차트 생성
+            # counts > 0: categorical dimension columns also count absent categories
             col_d1, col_d2, col_d3 = st.columns(3)
             
             with col_d1:
                 # 지역별
-                region_counts = overcharged_with_info['region'].value_counts()
+                region_counts = overcharged_with_info['region'].value_counts().loc[lambda counts: counts > 0]
                 fig_region = go.Figure(data=[go.Pie(
                     labels=region_counts.index,
                     values=region_counts.values,
@@ -1234,11 +1468,12 @@ with tab3:
                     showlegend=False,
                     margin=dict(l=20, r=20, t=40, b=20)
                 )
-                st.plotly_chart(fig_region, use_container_width=True)
+                with perf.section('chart:fig_region'):
+                    st.plotly_chart(fig_region, use_container_width=True)
             
             with col_d2:
                 # 설비유형별
-                site_type_counts = overcharged_with_info['site_type'].value_counts()
+                site_type_counts = overcharged_with_info['site_type'].value_counts().loc[lambda counts: counts > 0]
                 fig_site_type = go.Figure(data=[go.Pie(
                     labels=site_type_counts.index,
                     values=site_type_counts.values,
@@ -1252,11 +1487,12 @@ with tab3:
                     showlegend=False,
                     margin=dict(l=20, r=20, t=40, b=20)
                 )
-                st.plotly_chart(fig_site_type, use_container_width=True)
+                with perf.section('chart:fig_site_type'):
+                    st.plotly_chart(fig_site_type, use_container_width=True)
             
             with col_d3:
                 # 계약대상별
-                contract_target_counts = overcharged_with_info['contract_target'].value_counts()
+                contract_target_counts = overcharged_with_info['contract_target'].value_counts().loc[lambda counts: counts > 0]
                 fig_contract_target = go.Figure(data=[go.Pie(
                     labels=contract_target_counts.index,
                     values=contract_target_counts.values,
@@ -1270,13 +1506,14 @@ with tab3:
                     showlegend=False,
                     margin=dict(l=20, r=20, t=40, b=20)
                 )
-                st.plotly_chart(fig_contract_target, use_container_width=True)
+                with perf.section('chart:fig_contract_target'):
+                    st.plotly_chart(fig_contract_target, use_container_width=True)
             
             col_d4, col_d5, col_d6 = st.columns(3)
             
             with col_d4:
                 # 계약유형별
-                contract_type_counts = overcharged_with_info['contract_type'].value_counts()
+                contract_type_counts = overcharged_with_info['contract_type'].value_counts().loc[lambda counts: counts > 0]
                 fig_contract_type = go.Figure(data=[go.Pie(
                     labels=contract_type_counts.index,
                     values=contract_type_counts.values,
@@ -1290,11 +1527,12 @@ with tab3:
                     showlegend=False,
                     margin=dict(l=20, r=20, t=40, b=20)
                 )
-                st.plotly_chart(fig_contract_type, use_container_width=True)
+                with perf.section('chart:fig_contract_type'):
+                    st.plotly_chart(fig_contract_type, use_container_width=True)
             
             with col_d5:
                 # 세대별
-                network_gen_counts = overcharged_with_info['network_gen'].value_counts()
+                network_gen_counts = overcharged_with_info['network_gen'].value_counts().loc[lambda counts: counts > 0]
                 fig_network_gen = go.Figure(data=[go.Pie(
                     labels=network_gen_counts.index,
                     values=network_gen_counts.values,
@@ -1308,11 +1546,12 @@ with tab3:
                     showlegend=False,
                     margin=dict(l=20, r=20, t=40, b=20)
                 )
-                st.plotly_chart(fig_network_gen, use_container_width=True)
+                with perf.section('chart:fig_network_gen'):
+                    st.plotly_chart(fig_network_gen, use_container_width=True)
             
             with col_d6:
                 # RAPA여부별
-                rapa_counts = overcharged_with_info['rapa_type'].value_counts()
+                rapa_counts = overcharged_with_info['rapa_type'].value_counts().loc[lambda counts: counts > 0]
                 fig_rapa = go.Figure(data=[go.Pie(
                     labels=rapa_counts.index,
                     values=rapa_counts.values,
@@ -1326,7 +1565,8 @@ with tab3:
                     showlegend=False,
                     margin=dict(l=20, r=20, t=40, b=20)
                 )
-                st.plotly_chart(fig_rapa, use_container_width=True)
+                with perf.section('chart:fig_rapa'):
+                    st.plotly_chart(fig_rapa, use_container_width=True)
         else:
             st.info("과대청구 국소가 없습니다.")
         
@@ -1367,17 +1607,14 @@ with tab3:
         if 'site_review_status' not in st.session_state:
             st.session_state['site_review_status'] = {}
         
-        # 과대청구 국소만 필터링 (site_analysis에서 이미 계산됨)
-        overcharged_list = site_analysis[site_analysis['billing_status'] == '과대청구'].copy()
+        # 과대청구 국소 (사전 계산된 목록에서 선택 월의 분석 대상 국소만)
+        overcharge_table = perf.call('derived:overcharge', dal.load_derived_table, 'overcharge')
+        overcharged_list = overcharge_table[
+            (overcharge_table['yymm'] == selected_month) &
+            (overcharge_table['site_id'].isin(site_analysis['site_id']))
+        ].copy()
         
         if len(overcharged_list) > 0:
-            # site_master 정보 추가
-            overcharged_list = overcharged_list.merge(
-                site_master[['site_id', 'site_type', 'site_name', 'voltage']],
-                on='site_id',
-                how='left'
-            )
-            
             # 실사용 전력량 기반 추정 청구 요금 계산
             overcharged_list['estimated_cost'] = overcharged_list['kwh_actual'] * avg_unit_cost
             
@@ -1482,15 +1719,22 @@ with tab3:
                 height=600
             )
             
-            # CSV 다운로드 버튼
+            # 과대청구 국소 리스트 다운로드 (요청 시 청크 단위로 생성, 데이터 버전/필터별 캐시)
             st.markdown("---")
-            csv = overcharged_display.to_csv(index=False, encoding='utf-8-sig')
-            st.download_button(
-                label="📥 과대청구 국소 리스트 다운로드 (CSV)",
-                data=csv,
-                file_name=f"과대청구_국소_{str(selected_month)}.csv",
-                mime="text/csv",
-                key="download_overcharged_csv"
+            st.markdown("**📥 과대청구 국소 리스트 다운로드**")
+            render_table_export(
+                overcharged_display,
+                key="download_overcharged",
+                file_name=f"과대청구_국소_{str(selected_month)}",
+                data_version=dal.get_data_version(),
+                filters={
+                    **filters,
+                    'selected_month': selected_month,
+                    # 검토/점검 컬럼은 세션 상태에서 오므로 내보내는 국소의 상태만 해시해 캐시 키에 포함
+                    'review_digest': int(pd.util.hash_pandas_object(
+                        overcharged_list[['site_id', 'review_status', 'inspection_status']], index=False
+                    ).sum())
+                }
             )
             
             # === 국소 상세보기 ===
@@ -1728,12 +1972,12 @@ with tab3:
                 st.markdown("#### 📈 최근 6개월 추이")
                 
                 # 해당 국소의 최근 6개월 데이터 가져오기
-                site_history = bills_df[bills_df['site_id'] == selected_site_id].sort_values('yymm', ascending=False).head(6)
-                site_history = site_history.sort_values('yymm')  # 오름차순으로 다시 정렬
+                # 국소 인덱스에서 해당 국소 구간만 슬라이스 (월 오름차순 정렬 상태)
+                site_history = dal.load_site_index('bills').get(selected_site_id).tail(6)
                 
                 if len(site_history) > 0:
                     # actual 데이터도 가져오기
-                    site_history_actual = actual_df[actual_df['site_id'] == selected_site_id]
+                    site_history_actual = dal.load_site_index('actual').get(selected_site_id)
                     site_history = site_history.merge(
                         site_history_actual[['yymm', 'site_id', 'kwh_actual']],
                         on=['yymm', 'site_id'],
@@ -1757,9 +2001,9 @@ with tab3:
                     fig_trend = go.Figure()
                     
                     # 청구서 전력량
-                    fig_trend.add_trace(go.Scatter(
-                        x=site_history['month_label'],
-                        y=site_history['kwh_bill'],
+                    fig_trend.add_trace(line_trace(
+                        site_history['month_label'],
+                        site_history['kwh_bill'],
                         name='청구서 전력량',
                         mode='lines+markers',
                         line=dict(color=PYLON_BLUE, width=2),
@@ -1767,9 +2011,9 @@ with tab3:
                     ))
                     
                     # 실사용 전력량
-                    fig_trend.add_trace(go.Scatter(
-                        x=site_history['month_label'],
-                        y=site_history['kwh_actual'],
+                    fig_trend.add_trace(line_trace(
+                        site_history['month_label'],
+                        site_history['kwh_actual'],
                         name='실사용 전력량',
                         mode='lines+markers',
                         line=dict(color=PYLON_ORANGE, width=2),
@@ -1785,7 +2029,8 @@ with tab3:
                         xaxis=dict(type='category')  # 카테고리 타입으로 명시
                     )
                     
-                    st.plotly_chart(fig_trend, use_container_width=True)
+                    with perf.section('chart:fig_trend'):
+                        st.plotly_chart(fig_trend, use_container_width=True)
                     
                     # 요금 추이
                     fig_cost = go.Figure()
@@ -1814,7 +2059,8 @@ with tab3:
                         xaxis=dict(type='category')  # 카테고리 타입으로 명시
                     )
                     
-                    st.plotly_chart(fig_cost, use_container_width=True)
+                    with perf.section('chart:fig_cost'):
+                        st.plotly_chart(fig_cost, use_container_width=True)
                     
                     # 데이터 테이블
                     with st.expander("📊 상세 데이터 보기"):
@@ -1832,3 +2078,5 @@ with tab3:
 # Footer with PYLON branding
 st.markdown(create_footer(), unsafe_allow_html=True)
 
+# Log timings of this rerun (sidebar panel is opt-in)
+finish_page_perf(perf)
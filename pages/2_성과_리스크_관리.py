@@ -1,10 +1,6 @@
 """Performance & Risk Control page."""
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 from pathlib import Path
 import sys
 import os
@@ -15,17 +11,8 @@ parent_dir = current_dir.parent
 if str(parent_dir) not in sys.path:
     sys.path.insert(0, str(parent_dir))
 
-from src.data_access import DataAccessLayer
-from src.analytics import calculate_risk_score, calculate_bill_actual_error
-from src.actions import ActionManager
-from src.verified_savings import VerifiedSavingsManager
-from src.project_master import ProjectMasterManager
-from src.models import GovernanceBadge, ActionCategory, ValidationState
-from src.config_loader import load_governance_config
-from components.global_controls import render_sidebar_filters, render_governance_badges, apply_filters, render_filter_summary
-from components.widget_card import render_widget_card, render_simple_metric_card
-from components.action_inbox import render_compact_action_inbox
-from config.tasks import get_domains, get_tasks_by_domain
+from components.data_gate import require_data
+from components.perf_panel import start_page_perf, finish_page_perf
 from styles import (
     PYLON_BLUE, PYLON_GREEN, PYLON_ORANGE, PYLON_RED,
     apply_page_style, create_footer
@@ -34,12 +21,31 @@ from styles import (
 # Page config
 st.set_page_config(page_title="성과 & 리스크 관리 | PYLON", layout="wide", page_icon="📊")
 
+# Per-section timings of this rerun
+perf = start_page_perf("성과 리스크 관리")
+
 # Apply PYLON brand colors
 st.markdown(apply_page_style(), unsafe_allow_html=True)
 
 # Initialize
 data_dir = Path("data")
-dal = DataAccessLayer(data_dir)
+dal = perf.call('startup:require_data', require_data, data_dir)
+
+# Heavy modules are imported once data is ready (keeps the first response fast)
+import pandas as pd
+import numpy as np
+from src.actions import ActionManager
+from src.verified_savings import VerifiedSavingsManager
+from src.project_master import ProjectMasterManager
+from src.models import GovernanceBadge, ActionCategory, ValidationState
+from src.config_loader import load_governance_config
+from components.global_controls import render_sidebar_filters, render_governance_badges, apply_filters, render_filter_summary
+from components.widget_card import render_widget_card, render_simple_metric_card
+from components.action_inbox import render_compact_action_inbox
+from config.tasks import get_domains, get_tasks_by_domain
+import plotly.graph_objects as go
+import plotly.express as px
+
 action_manager = ActionManager(data_dir)
 verified_savings_manager = VerifiedSavingsManager(data_dir)
 project_master_manager = ProjectMasterManager(data_dir)
@@ -66,10 +72,10 @@ with st.sidebar:
     render_compact_action_inbox(action_manager, st.session_state["current_user"])
     st.divider()
 
-# Load data
-bills_df = dal.load_bills()
-actual_df = dal.load_actual()
-site_master = dal.load_site_master()
+# Load data (all datasets read concurrently)
+datasets = perf.call('load:datasets', dal.load_all)
+bills_df = datasets.bills
+site_master = datasets.site_master
 
 if len(bills_df) == 0:
     st.error("데이터를 로드할 수 없습니다.")
@@ -88,26 +94,25 @@ filters = render_sidebar_filters(available_yymm)
 render_filter_summary(filters)
 
 # Apply filters
-filtered_bills = apply_filters(bills_df, filters)
+filtered_bills = perf.call('apply_filters:filtered_bills', apply_filters, bills_df, filters)
 
 st.markdown("---")
 
 # Tabs
 tab1, tab2 = st.tabs(["📈 과제 성과 관리", "⚠️ 전기요금 Risk Monitoring"])
 
-with tab1:
+with tab1, perf.section('tab:과제 성과 관리'):
     st.markdown("## 📈 과제별 성과 관리")
     
-    # Load projects from master
-    projects_df = project_master_manager.load_projects()
-    
     # Three-tier savings display
     st.markdown("### 절감액 현황 (3단계)")
     
-    # Calculate from projects
-    expected_savings = projects_df[projects_df['status'] == '해야 할 일']['target_savings_krw'].sum()
-    in_progress_savings = projects_df[projects_df['status'] == '진행 중']['actual_savings_krw'].sum()
-    verified_total = projects_df['verified_savings_krw'].sum()
+    # Running project rollups (maintained on every project write)
+    project_totals = project_master_manager.get_totals()
+    status_rollup = project_master_manager.get_rollup('status').set_index('status')
+    expected_savings = status_rollup['target_savings_krw'].get('해야 할 일', 0.0)
+    in_progress_savings = status_rollup['actual_savings_krw'].get('진행 중', 0.0)
+    verified_total = project_totals['verified_savings_krw']
     
     col1, col2, col3 = st.columns(3)
     
@@ -142,11 +147,11 @@ with tab1:
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        total_target = projects_df['target_savings_krw'].sum()
+        total_target = project_totals['target_savings_krw']
         render_simple_metric_card("총 목표", f"₩{total_target:,.0f}/월")
     
     with col2:
-        total_actual = projects_df['actual_savings_krw'].sum()
+        total_actual = project_totals['actual_savings_krw']
         render_simple_metric_card("총 실적", f"₩{total_actual:,.0f}/월")
     
     with col3:
@@ -166,7 +171,7 @@ with tab1:
     
     for domain_idx, domain in enumerate(domains):
         with domain_tabs[domain_idx]:
-            domain_projects = projects_df[projects_df['domain'] == domain]
+            domain_projects = project_master_manager.list_projects(domain)
             
             if len(domain_projects) == 0:
                 st.warning(f"{domain}에 등록된 과제가 없습니다.")
@@ -182,7 +187,7 @@ with tab1:
                 st.markdown("---")
                 
                 # Display projects with action button
-                for idx, project in domain_projects.iterrows():
+                for project in domain_projects:
                     with st.expander(f"{project['project_name']} ({project['status']})"):
                         col_info, col_action = st.columns([3, 1])
                         
@@ -258,11 +263,7 @@ with tab1:
     # Achievement chart by domain
     st.markdown("### 영역별 성과")
     
-    domain_summary = projects_df.groupby('domain').agg({
-        'target_savings_krw': 'sum',
-        'actual_savings_krw': 'sum',
-        'verified_savings_krw': 'sum'
-    }).reset_index()
+    domain_summary = project_master_manager.get_rollup('domain')
     
     fig = go.Figure()
     
@@ -294,64 +295,18 @@ with tab1:
         barmode='group'
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    with perf.section('chart:fig'):
+        st.plotly_chart(fig, use_container_width=True)
 
-with tab2:
+with tab2, perf.section('tab:Risk Monitoring'):
     st.markdown("## ⚠️ 전기요금 Risk Monitoring")
     
-    # Merge bills with actual
-    merged = filtered_bills.merge(
-        actual_df,
-        on=['yymm', 'site_id'],
-        how='left'
-    )
+    # Precomputed risk-scored bills (likelihood uses each site's full history)
+    merged = perf.call('apply_filters:merged', apply_filters, perf.call('derived:risk_frame', dal.load_derived_table, 'risk_frame'), filters)
     
     if len(merged) == 0:
         st.warning("리스크 분석을 위한 데이터가 부족합니다.")
     else:
-        # Calculate risk scores
-        merged['impact'] = abs(merged['cost_actual_est'].fillna(merged['cost_bill']) - merged['cost_bill'])
-        
-        # Calculate likelihood based on error history
-        site_error_history = []
-        for site_id in merged['site_id'].unique():
-            site_data = bills_df[bills_df['site_id'] == site_id].merge(
-                actual_df[actual_df['site_id'] == site_id],
-                on=['yymm', 'site_id'],
-                how='left'
-            )
-            
-            if len(site_data) > 0:
-                # Count anomalies (error > 20%)
-                site_data['error_pct'] = abs(
-                    calculate_bill_actual_error(
-                        site_data['kwh_actual'].fillna(site_data['kwh_bill']),
-                        site_data['kwh_bill']
-                    )
-                )
-                anomaly_count = (site_data['error_pct'] > 20).sum()
-                likelihood = min(anomaly_count / len(site_data), 1.0)
-            else:
-                likelihood = 0.5
-            
-            site_error_history.append({
-                'site_id': site_id,
-                'likelihood': likelihood
-            })
-        
-        likelihood_df = pd.DataFrame(site_error_history)
-        merged = merged.merge(likelihood_df, on='site_id', how='left')
-        merged['likelihood'] = merged['likelihood'].fillna(0.5)
-        merged['confidence'] = merged['confidence'].fillna(0.7)
-        
-        # Calculate risk score
-        risk_scores = merged.apply(
-            lambda row: calculate_risk_score(row['impact'], row['likelihood'], row['confidence']),
-            axis=1
-        )
-        merged['risk_score_raw'] = risk_scores.apply(lambda x: x['raw_score'])
-        merged['risk_score_display'] = risk_scores.apply(lambda x: x['display_score'])
-        
         # Risk summary (using display score for classification)
         st.markdown("### 리스크 요약")
         
@@ -386,7 +341,8 @@ with tab2:
             labels={'risk_score_display': '리스크 점수'}
         )
         
-        st.plotly_chart(fig_risk_dist, use_container_width=True)
+        with perf.section('chart:fig_risk_dist'):
+            st.plotly_chart(fig_risk_dist, use_container_width=True)
         
         # High risk sites
         # High Risk: RED for critical attention
@@ -416,7 +372,9 @@ with tab2:
                 action_manager=action_manager,
                 action_category=ActionCategory.ANOMALY_INVESTIGATION,
                 action_description_template=f"High Risk 국소 조사 및 조치 ({len(high_risk_sites)}개 국소)",
-                site_ids=high_risk_sites['site_id'].tolist()
+                site_ids=high_risk_sites['site_id'].tolist(),
+                data_version=dal.get_data_version(),
+                filters=filters
             )
         else:
             st.success("✅ High Risk 국소가 없습니다.")
@@ -426,7 +384,7 @@ with tab2:
         # Risk heatmap by region and contract type
         st.markdown("### 리스크 히트맵 (지역 x 계약유형)")
         
-        risk_pivot = merged.groupby(['region', 'contract_type'])['risk_score_display'].mean().reset_index()
+        risk_pivot = merged.groupby(['region', 'contract_type'], observed=True)['risk_score_display'].mean().reset_index()
         risk_pivot_table = risk_pivot.pivot(index='region', columns='contract_type', values='risk_score_display')
         
         fig_heatmap = px.imshow(
@@ -436,8 +394,11 @@ with tab2:
             color_continuous_scale='RdYlGn_r'
         )
         
-        st.plotly_chart(fig_heatmap, use_container_width=True)
+        with perf.section('chart:fig_heatmap'):
+            st.plotly_chart(fig_heatmap, use_container_width=True)
 
 # Footer with PYLON branding
 st.markdown(create_footer(), unsafe_allow_html=True)
 
+# Log timings of this rerun (sidebar panel is opt-in)
+finish_page_perf(perf)
@@ -1,10 +1,6 @@
 """최적화 및 실행 페이지"""
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 from pathlib import Path
 import sys
 import os
@@ -15,18 +11,8 @@ parent_dir = current_dir.parent
 if str(parent_dir) not in sys.path:
     sys.path.insert(0, str(parent_dir))
 
-from src.data_access import DataAccessLayer
-from src.analytics import (
-    detect_zero_usage_sites,
-    recommend_contract_power_adjustment,
-    calculate_anomaly_score
-)
-from src.actions import ActionManager
-from src.models import GovernanceBadge, ActionCategory, ValidationState
-from src.config_loader import load_governance_config
-from components.global_controls import render_sidebar_filters, render_governance_badges, apply_filters, render_filter_summary
-from components.widget_card import render_widget_card, render_simple_metric_card
-from components.action_inbox import render_compact_action_inbox
+from components.data_gate import require_data
+from components.perf_panel import start_page_perf, finish_page_perf
 from styles import (
     PYLON_BLUE, PYLON_GREEN, PYLON_ORANGE,
     apply_page_style, create_footer
@@ -35,12 +21,31 @@ from styles import (
 # Page config
 st.set_page_config(page_title="최적화 & 실행 | PYLON", layout="wide", page_icon="🎯")
 
+# Per-section timings of this rerun
+perf = start_page_perf("최적화 실행")
+
 # Apply PYLON brand colors
 st.markdown(apply_page_style(), unsafe_allow_html=True)
 
 # Initialize
 data_dir = Path("data")
-dal = DataAccessLayer(data_dir)
+dal = perf.call('startup:require_data', require_data, data_dir)
+
+# Heavy modules are imported once data is ready (keeps the first response fast)
+import pandas as pd
+import numpy as np
+from src.derived_tables import zero_usage_summary
+from src.tariffs import load_tariff_book, site_tariff_ids, simulate_fleet_bills
+from src.actions import ActionManager
+from src.models import GovernanceBadge, ActionCategory, ValidationState
+from src.config_loader import load_governance_config
+from components.global_controls import render_sidebar_filters, render_governance_badges, apply_filters, render_filter_summary
+from components.widget_card import render_widget_card, render_simple_metric_card
+from components.action_inbox import render_compact_action_inbox
+import plotly.graph_objects as go
+import plotly.express as px
+from components.charts import scatter_figure
+
 action_manager = ActionManager(data_dir)
 gov_config = load_governance_config()
 
@@ -65,9 +70,10 @@ with st.sidebar:
     render_compact_action_inbox(action_manager, st.session_state["current_user"])
     st.divider()
 
-# Load data
-bills_df = dal.load_bills()
-site_master = dal.load_site_master()
+# Load data (all datasets read concurrently)
+datasets = perf.call('load:datasets', dal.load_all)
+bills_df = datasets.bills
+site_master = datasets.site_master
 
 if len(bills_df) == 0:
     st.error("데이터를 로드할 수 없습니다.")
@@ -86,21 +92,21 @@ filters = render_sidebar_filters(available_yymm)
 render_filter_summary(filters)
 
 # Apply filters
-filtered_bills = apply_filters(bills_df, filters)
+filtered_bills = perf.call('apply_filters:filtered_bills', apply_filters, bills_df, filters)
 
 st.markdown("---")
 
 # Tabs
-tab1, tab2, tab3 = st.tabs(["⚡ 계약전력 최적화", "🔍 이상 국소 탐지", "📍 사용량 0 국소"])
+tab1, tab2, tab3, tab4 = st.tabs(["⚡ 계약전력 최적화", "🔍 이상 국소 탐지", "📍 사용량 0 국소", "💱 요금제 시뮬레이션"])
 
-with tab1:
+with tab1, perf.section('tab:계약전력 최적화'):
     st.markdown("## ⚡ 계약전력 감설/증설")
     
-    st.info("💡 최근 6개월 사용 패턴을 분석하여 계약전력 최적화 기회를 식별합니다.")
+    st.info("💡 최근 12개월 월별 수요 분포에서 기본요금과 초과요금 기대값의 합이 최소인 계약전력을 찾습니다.")
     
-    # Get recent 6 months data
+    # Get recent 12 months data
     months_sorted = sorted(bills_df['yymm'].unique())
-    recent_months = months_sorted[-6:] if len(months_sorted) >= 6 else months_sorted
+    recent_months = months_sorted[-12:]
     
     recent_bills = bills_df[
         (bills_df['yymm'].isin(recent_months)) &
@@ -110,35 +116,16 @@ with tab1:
     if len(recent_bills) == 0:
         st.warning("정액 계약 데이터가 없습니다.")
     else:
-        # Analyze each site
-        optimization_results = []
+        # Precomputed fleet-wide recommendations, restricted to filtered sites
+        opt_df = perf.call('derived:contract_optimization', dal.load_derived_table, 'contract_optimization')
+        opt_df = opt_df[opt_df['site_id'].isin(filtered_bills['site_id'].unique())]
         
-        for site_id in filtered_bills['site_id'].unique():
-            site_bills = recent_bills[recent_bills['site_id'] == site_id]
-            
-            if len(site_bills) >= 3:  # Need at least 3 months
-                recommendation = recommend_contract_power_adjustment(site_bills)
-                
-                if recommendation['savings_est'] != 0:
-                    site_info = site_master[site_master['site_id'] == site_id].iloc[0]
-                    
-                    optimization_results.append({
-                        'site_id': site_id,
-                        'region': site_info['region'],
-                        'site_type': site_info['site_type'],
-                        'current_contract_kw': recommendation['current_contract_kw'],
-                        'recommended_kw': recommendation['new_contract_kw'],
-                        'savings_est': recommendation['savings_est'],
-                        'recommendation': recommendation['recommendation']
-                    })
-        
-        if len(optimization_results) > 0:
-            opt_df = pd.DataFrame(optimization_results)
-            
+        if len(opt_df) > 0:
             # Summary metrics
             total_savings = opt_df['savings_est'].sum()
-            reduction_sites = len(opt_df[opt_df['savings_est'] > 0])
-            increase_sites = len(opt_df[opt_df['savings_est'] < 0])
+            is_reduction = opt_df['recommended_kw'] < opt_df['current_contract_kw']
+            reduction_sites = int(is_reduction.sum())
+            increase_sites = int((~is_reduction).sum())
             
             col1, col2, col3 = st.columns(3)
             
@@ -146,7 +133,7 @@ with tab1:
                 render_simple_metric_card(
                     "예상 절감액",
                     f"₩{total_savings:,.0f}/월",
-                    help_text="감설 시 기본요금 절감"
+                    help_text="기본요금 + 초과요금 기대값 절감 (감설·증설 합계)"
                 )
             
             with col2:
@@ -160,7 +147,7 @@ with tab1:
             # Reduction opportunities: GREEN for savings/optimization
             st.markdown(f'<h3 style="color: {PYLON_GREEN};">🔽 감설 권고 국소</h3>', unsafe_allow_html=True)
             
-            reduction_df = opt_df[opt_df['savings_est'] > 0].sort_values('savings_est', ascending=False)
+            reduction_df = opt_df[is_reduction].sort_values('savings_est', ascending=False)
             
             if len(reduction_df) > 0:
                 render_widget_card(
@@ -172,7 +159,9 @@ with tab1:
                     action_manager=action_manager,
                     action_category=ActionCategory.CONTRACT_OPTIMIZATION,
                     action_description_template=f"계약전력 감설 검토 ({len(reduction_df)}개 국소, 예상 절감액: ₩{reduction_df['savings_est'].sum():,.0f}/월)",
-                    site_ids=reduction_df['site_id'].tolist()
+                    site_ids=reduction_df['site_id'].tolist(),
+                    data_version=dal.get_data_version(),
+                    filters=filters
                 )
             else:
                 st.info("감설 권고 국소가 없습니다.")
@@ -182,7 +171,7 @@ with tab1:
             # Increase needs
             st.markdown("### 🔼 증설 필요 국소")
             
-            increase_df = opt_df[opt_df['savings_est'] < 0].sort_values('savings_est')
+            increase_df = opt_df[~is_reduction].sort_values('savings_est', ascending=False)
             
             if len(increase_df) > 0:
                 render_widget_card(
@@ -193,54 +182,32 @@ with tab1:
                     evidence_table=increase_df,
                     action_manager=action_manager,
                     action_category=ActionCategory.CONTRACT_OPTIMIZATION,
-                    action_description_template=f"계약전력 증설 검토 (초과요금 위험, {len(increase_df)}개 국소)",
-                    site_ids=increase_df['site_id'].tolist()
+                    action_description_template=f"계약전력 증설 검토 (초과요금 위험, {len(increase_df)}개 국소, 예상 절감액: ₩{increase_df['savings_est'].sum():,.0f}/월)",
+                    site_ids=increase_df['site_id'].tolist(),
+                    data_version=dal.get_data_version(),
+                    filters=filters
                 )
             else:
                 st.success("✅ 증설이 필요한 국소가 없습니다.")
         else:
             st.info("최적화 권고 사항이 없습니다.")
 
-with tab2:
+with tab2, perf.section('tab:이상 국소 탐지'):
     st.markdown("## 🔍 이상 국소 탐지")
     
     st.info("💡 사용 패턴의 이상 변동을 탐지합니다 (Z-score 기반).")
     
-    # Detect anomalies for each site
-    anomaly_results = []
-    
     # Get latest month from filtered data
     latest_month = filtered_bills['yymm'].max() if len(filtered_bills) > 0 else None
     
-    for site_id in filtered_bills['site_id'].unique():
-        site_bills = bills_df[bills_df['site_id'] == site_id].sort_values('yymm')
-        
-        if len(site_bills) >= 6:  # Need sufficient history
-            site_with_anomaly = calculate_anomaly_score(site_bills, metric='kwh_bill')
-            
-            # Get recent anomalies
-            recent_anomalies = site_with_anomaly[
-                (site_with_anomaly['yymm'] == latest_month) &
-                (site_with_anomaly['is_anomaly'] == True)
-            ]
-            
-            if len(recent_anomalies) > 0:
-                site_info = site_master[site_master['site_id'] == site_id].iloc[0]
-                
-                for _, anomaly_row in recent_anomalies.iterrows():
-                    anomaly_results.append({
-                        'site_id': site_id,
-                        'region': site_info['region'],
-                        'site_type': site_info['site_type'],
-                        'yymm': anomaly_row['yymm'],
-                        'kwh_bill': anomaly_row['kwh_bill'],
-                        'rolling_mean': anomaly_row['rolling_mean'],
-                        'z_score': anomaly_row['z_score']
-                    })
+    # Precomputed anomalies of that month for the filtered sites
+    anomaly_df = perf.call('derived:anomalies', dal.load_derived_table, 'anomalies')
+    anomaly_df = anomaly_df[
+        (anomaly_df['yymm'] == latest_month) &
+        (anomaly_df['site_id'].isin(filtered_bills['site_id'].unique()))
+    ]
     
-    if len(anomaly_results) > 0:
-        anomaly_df = pd.DataFrame(anomaly_results)
-        
+    if len(anomaly_df) > 0:
         st.markdown(f"### ⚠️ 이상 탐지: {len(anomaly_df)} 건")
         
         render_widget_card(
@@ -252,13 +219,15 @@ with tab2:
             action_manager=action_manager,
             action_category=ActionCategory.ANOMALY_INVESTIGATION,
             action_description_template=f"이상 사용 패턴 조사 ({len(anomaly_df)}개 국소)",
-            site_ids=anomaly_df['site_id'].tolist()
+            site_ids=anomaly_df['site_id'].tolist(),
+            data_version=dal.get_data_version(),
+            filters=filters
         )
         
         # Anomaly distribution
         st.markdown("### 이상 점수 분포")
         
-        fig_anomaly = px.scatter(
+        fig_anomaly = scatter_figure(
             anomaly_df,
             x='rolling_mean',
             y='kwh_bill',
@@ -269,48 +238,23 @@ with tab2:
             color_continuous_scale='RdYlBu_r'
         )
         
-        st.plotly_chart(fig_anomaly, use_container_width=True)
+        with perf.section('chart:fig_anomaly'):
+            st.plotly_chart(fig_anomaly, use_container_width=True)
     else:
         st.success("✅ 이상 패턴이 탐지되지 않았습니다.")
 
-with tab3:
+with tab3, perf.section('tab:사용량 0 국소'):
     st.markdown("## 📍 사용량 0 국소")
     
     st.info("💡 연속 3개월 이상 사용량이 0인 국소를 탐지합니다 (필터 적용됨).")
     
-    # Detect zero usage sites (use filtered data)
-    zero_sites = detect_zero_usage_sites(filtered_bills, months=3)
+    # Precomputed zero-usage site-months, restricted to the filtered period and sites
+    zero_usage = perf.call('derived:zero_usage', dal.load_derived_table, 'zero_usage')
+    filtered_site_months = filtered_bills.loc[filtered_bills['kwh_bill'] == 0, ['site_id', 'yymm']]
+    zero_usage = zero_usage.merge(filtered_site_months, on=['site_id', 'yymm'], how='inner')
+    zero_details_df = zero_usage_summary(zero_usage, months=3)
     
-    if len(zero_sites) > 0:
-        # Get details
-        zero_details = []
-        
-        for _, row in zero_sites.iterrows():
-            site_id = row['site_id']
-            site_info = site_master[site_master['site_id'] == site_id]
-            
-            if len(site_info) > 0:
-                site_info = site_info.iloc[0]
-                
-                # Get recent bills (use filtered data)
-                site_bills = filtered_bills[
-                    (filtered_bills['site_id'] == site_id) &
-                    (filtered_bills['kwh_bill'] == 0)
-                ].sort_values('yymm', ascending=False).head(6)
-                
-                zero_months_list = ','.join(site_bills['yymm'].tolist())
-                
-                zero_details.append({
-                    'site_id': site_id,
-                    'site_name': site_info['site_name'],
-                    'region': site_info['region'],
-                    'site_type': site_info['site_type'],
-                    'zero_months': row['zero_months'],
-                    'recent_zero_periods': zero_months_list
-                })
-        
-        zero_details_df = pd.DataFrame(zero_details)
-        
+    if len(zero_details_df) > 0:
         render_widget_card(
             title="사용량 0 국소",
             value=f"{len(zero_details_df)} 국소",
@@ -320,7 +264,9 @@ with tab3:
             action_manager=action_manager,
             action_category=ActionCategory.ZERO_USAGE,
             action_description_template=f"사용량 0 국소 조사 ({len(zero_details_df)}개 국소 - 폐쇄/이전 여부 확인)",
-            site_ids=zero_details_df['site_id'].tolist()
+            site_ids=zero_details_df['site_id'].tolist(),
+            data_version=dal.get_data_version(),
+            filters=filters
         )
         
         # Regional distribution
@@ -337,10 +283,139 @@ with tab3:
             labels={'region': '지역', 'count': '국소 수'}
         )
         
-        st.plotly_chart(fig_region, use_container_width=True)
+        with perf.section('chart:fig_region'):
+            st.plotly_chart(fig_region, use_container_width=True)
     else:
         st.success("✅ 사용량 0 국소가 없습니다.")
 
+with tab4, perf.section('tab:요금제 시뮬레이션'):
+    st.markdown("## 💱 요금제 시뮬레이션")
+    
+    st.info("💡 요금 단가 변경 또는 요금제 전환 시 필터된 국소·기간의 요금을 전 국소 일괄 재계산합니다 (config/tariffs.yaml).")
+    
+    tariff_book = perf.call('tariffs:load_tariff_book', load_tariff_book)
+    matrix = dal.load_site_month_matrix()
+    
+    col_basic, col_energy, col_penalty = st.columns(3)
+    with col_basic:
+        basic_pct = st.slider("기본요금 변경 (%)", -30, 30, 0, key="tariff_basic_pct")
+    with col_energy:
+        energy_pct = st.slider("전력량요금 변경 (%)", -30, 30, 0, key="tariff_energy_pct")
+    with col_penalty:
+        penalty_pct = st.slider("초과요금 변경 (%)", -30, 30, 0, key="tariff_penalty_pct")
+    
+    tariff_options = list(tariff_book.tariffs)
+    col_fixed, col_volume = st.columns(2)
+    scenario_mapping = {}
+    for col, contract_type in zip([col_fixed, col_volume], ['정액', '종량']):
+        with col:
+            current_id = tariff_book.contract_type_tariffs[contract_type]
+            scenario_mapping[contract_type] = st.selectbox(
+                f"{contract_type} 국소 적용 요금제",
+                options=tariff_options,
+                index=tariff_options.index(current_id),
+                format_func=lambda t: tariff_book.tariffs[t].name,
+                key=f"tariff_scenario_{contract_type}"
+            )
+    
+    current_ids = site_tariff_ids(matrix.site_ids, site_master, tariff_book)
+    scenario_book = tariff_book.scaled(basic_pct, energy_pct, penalty_pct)
+    scenario_book.contract_type_tariffs = scenario_mapping
+    scenario_ids = site_tariff_ids(matrix.site_ids, site_master, scenario_book)
+    
+    # Only filtered sites and months take part
+    in_scope = np.isin(matrix.site_ids, filtered_bills['site_id'].unique())
+    scope_months = sorted(int(ym) for ym in filtered_bills['yymm'].unique())
+    current_ids = np.where(in_scope, current_ids, None)
+    scenario_ids = np.where(in_scope, scenario_ids, None)
+    
+    current_bills = perf.call('tariffs:current', simulate_fleet_bills, matrix, current_ids, tariff_book, scope_months)
+    scenario_bills = perf.call('tariffs:scenario', simulate_fleet_bills, matrix, scenario_ids, scenario_book, scope_months)
+    
+    current_total = np.nansum(current_bills.total)
+    scenario_total = np.nansum(scenario_bills.total)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        render_simple_metric_card("현행 요금제", f"₩{current_total:,.0f}", help_text=f"{len(scope_months)}개월, {int(in_scope.sum()):,}개 국소")
+    with col2:
+        render_simple_metric_card("시나리오", f"₩{scenario_total:,.0f}")
+    with col3:
+        delta_pct = (scenario_total / current_total - 1) * 100 if current_total > 0 else 0.0
+        render_simple_metric_card("증감", f"₩{scenario_total - current_total:+,.0f} ({delta_pct:+.1f}%)")
+    
+    monthly_bills = pd.DataFrame({
+        'yymm': [str(ym) for ym in scope_months] * 2,
+        'cost': np.concatenate([np.nansum(current_bills.total, axis=0), np.nansum(scenario_bills.total, axis=0)]),
+        'scenario': ['현행'] * len(scope_months) + ['시나리오'] * len(scope_months)
+    })
+    fig_tariff = px.line(
+        monthly_bills,
+        x='yymm',
+        y='cost',
+        color='scenario',
+        title='월별 요금: 현행 vs 시나리오',
+        labels={'yymm': '월', 'cost': '요금 (원)', 'scenario': '구분'},
+        markers=True
+    )
+    with perf.section('chart:fig_tariff'):
+        st.plotly_chart(fig_tariff, use_container_width=True)
+    
+    # Component breakdown
+    component_table = pd.DataFrame({
+        '구분': ['기본요금', '전력량요금', '초과요금', '합계'],
+        '현행': [np.nansum(current_bills.basic), np.nansum(current_bills.energy),
+               np.nansum(current_bills.penalty), current_total],
+        '시나리오': [np.nansum(scenario_bills.basic), np.nansum(scenario_bills.energy),
+                 np.nansum(scenario_bills.penalty), scenario_total]
+    })
+    component_table['증감'] = component_table['시나리오'] - component_table['현행']
+    st.dataframe(component_table, use_container_width=True, hide_index=True)
+    
+    st.markdown("---")
+    
+    # Per-site cheapest eligible tariff over the last 12 months
+    st.markdown(f'<h3 style="color: {PYLON_GREEN};">🏷️ 요금제 변경 추천</h3>', unsafe_allow_html=True)
+    
+    tariff_rec_df = perf.call('derived:tariff_recommendation', dal.load_derived_table, 'tariff_recommendation')
+    tariff_rec_df = tariff_rec_df[
+        tariff_rec_df['site_id'].isin(filtered_bills['site_id'].unique()) &
+        (tariff_rec_df['savings_annual_est'] > 0)
+    ].sort_values('savings_annual_est', ascending=False)
+    
+    if len(tariff_rec_df) > 0:
+        col1, col2 = st.columns(2)
+        with col1:
+            render_simple_metric_card(
+                "예상 절감액",
+                f"₩{tariff_rec_df['savings_annual_est'].sum():,.0f}/년",
+                help_text="최근 12개월 청구 기준 연환산"
+            )
+        with col2:
+            render_simple_metric_card("변경 추천", f"{len(tariff_rec_df):,} 국소")
+        
+        render_widget_card(
+            title="요금제 변경 추천",
+            value=f"{len(tariff_rec_df):,} 국소",
+            metric_label="변경 추천 국소 수",
+            validation_state=ValidationState.HYPOTHESIS,
+            evidence_table=tariff_rec_df,
+            action_manager=action_manager,
+            action_category=ActionCategory.TARIFF_CHANGE,
+            action_description_template=f"요금제 변경 검토 ({len(tariff_rec_df)}개 국소, 예상 절감액: ₩{tariff_rec_df['savings_annual_est'].sum():,.0f}/년)",
+            site_ids=tariff_rec_df['site_id'].tolist(),
+            data_version=dal.get_data_version(),
+            filters=filters,
+            site_action_descriptions=[
+                f"요금제 변경 검토: {rec} (예상 절감액: ₩{saving:,.0f}/년)"
+                for rec, saving in zip(tariff_rec_df['recommendation'], tariff_rec_df['savings_annual_est'])
+            ]
+        )
+    else:
+        st.success("✅ 현행 요금제가 가장 저렴합니다.")
+
 # Footer with PYLON branding
 st.markdown(create_footer(), unsafe_allow_html=True)
 
+# Log timings of this rerun (sidebar panel is opt-in)
+finish_page_perf(perf)
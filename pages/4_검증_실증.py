@@ -1,10 +1,6 @@
 """검증 및 실증(IDEA) 페이지"""
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 from pathlib import Path
 from datetime import datetime, timedelta
 import sys
@@ -16,16 +12,8 @@ parent_dir = current_dir.parent
 if str(parent_dir) not in sys.path:
     sys.path.insert(0, str(parent_dir))
 
-from src.data_access import DataAccessLayer
-from src.experiments import ExperimentManager
-from src.actions import ActionManager
-from src.verified_savings import VerifiedSavingsManager
-from src.project_master import ProjectMasterManager
-from src.models import GovernanceBadge, ActionCategory, ValidationState
-from src.config_loader import load_governance_config
-from components.global_controls import render_governance_badges
-from components.widget_card import render_simple_metric_card
-from components.action_inbox import render_compact_action_inbox
+from components.data_gate import require_data
+from components.perf_panel import start_page_perf, finish_page_perf
 from styles import (
     PYLON_BLUE, PYLON_GREEN,
     apply_page_style, create_footer
@@ -34,12 +22,33 @@ from styles import (
 # Page config
 st.set_page_config(page_title="검증 & 실증 | PYLON", layout="wide", page_icon="🔬")
 
+# Per-section timings of this rerun
+perf = start_page_perf("검증 실증")
+
 # Apply PYLON brand colors
 st.markdown(apply_page_style(), unsafe_allow_html=True)
 
 # Initialize
 data_dir = Path("data")
-dal = DataAccessLayer(data_dir)
+dal = perf.call('startup:require_data', require_data, data_dir)
+
+# Heavy modules are imported once data is ready (keeps the first response fast)
+import pandas as pd
+import numpy as np
+from src.experiments import ExperimentManager
+from src.actions import ActionManager
+from src.verified_savings import VerifiedSavingsManager
+from src.project_master import ProjectMasterManager
+from src.models import GovernanceBadge, ActionCategory, ValidationState
+from src.config_loader import load_governance_config
+from components.global_controls import render_governance_badges
+from components.widget_card import render_simple_metric_card
+from components.paged_table import render_paged_table
+from src.savings_uncertainty import CONFIDENCE_LEVELS
+from components.action_inbox import render_compact_action_inbox
+import plotly.graph_objects as go
+import plotly.express as px
+
 action_manager = ActionManager(data_dir)
 experiment_manager = ExperimentManager(data_dir)
 verified_savings_manager = VerifiedSavingsManager(data_dir)
@@ -67,10 +76,10 @@ with st.sidebar:
     render_compact_action_inbox(action_manager, st.session_state["current_user"])
     st.divider()
 
-# Load data
-bills_df = dal.load_bills()
-traffic_df = dal.load_traffic()
-site_master = dal.load_site_master()
+# Load data (all datasets read concurrently)
+datasets = perf.call('load:datasets', dal.load_all)
+bills_df = datasets.bills
+site_master = datasets.site_master
 
 if len(bills_df) == 0:
     st.error("데이터를 로드할 수 없습니다.")
@@ -94,9 +103,6 @@ st.info("""
 - Core/전송: F/H Zero Power化, Server Power Saving 등
 """)
 
-# Load projects
-projects_df = project_master_manager.load_projects()
-
 # Check if navigated from 성과 관리 with selected project
 if "selected_project_id" in st.session_state and st.session_state["selected_project_id"]:
     default_project_id = st.session_state["selected_project_id"]
@@ -133,14 +139,11 @@ with col_filter1:
 
 with col_filter2:
     # Filter projects by domain
-    if selected_domain == '전체':
-        filtered_projects = projects_df
-    else:
-        filtered_projects = projects_df[projects_df['domain'] == selected_domain]
+    filtered_projects = project_master_manager.list_projects(None if selected_domain == '전체' else selected_domain)
     
     # Project selection filter
-    project_options = ['전체'] + filtered_projects['project_id'].tolist()
-    project_labels = ['전체'] + [f"{row['domain']} - {row['project_name']}" for _, row in filtered_projects.iterrows()]
+    project_options = ['전체'] + [project['project_id'] for project in filtered_projects]
+    project_labels = ['전체'] + [f"{project['domain']} - {project['project_name']}" for project in filtered_projects]
     project_label_map = dict(zip(project_options, project_labels))
     
     # Find default index
@@ -161,7 +164,7 @@ st.markdown("---")
 
 # If specific project selected, show validation section
 if selected_project != '전체':
-    project_data = projects_df[projects_df['project_id'] == selected_project].iloc[0]
+    project_data = project_master_manager.get_project(selected_project)
     
     st.markdown(f"## 📊 {project_data['project_name']} - 효과검증")
     
@@ -183,8 +186,8 @@ if selected_project != '전체':
     
     st.markdown("---")
     
-    # Before/After comparison (sample data for demonstration)
-    st.markdown("### 전 / 후 비교")
+    # Difference-in-differences against matched control sites
+    st.markdown("### 전 / 후 비교 (매칭 대조군 DiD)")
     
     col_config1, col_config2 = st.columns(2)
     
@@ -205,79 +208,120 @@ if selected_project != '전체':
             key="validation_baseline_month"
         )
     
-    # Sample before/after data
-    months_sorted = sorted(bills_df['yymm'].unique())
-    if baseline_month in months_sorted:
-        baseline_idx = months_sorted.index(baseline_month)
+    # Treated sites: the project's target network generation / site types
+    gen_options = sorted(site_master['network_gen'].dropna().unique().tolist())
+    type_options = sorted(site_master['site_type'].dropna().unique().tolist())
+    default_gens = [gen for gen in gen_options if gen in project_data['project_name']]
+    
+    col_target1, col_target2 = st.columns(2)
+    with col_target1:
+        target_gens = st.multiselect(
+            "대상 세대",
+            options=gen_options,
+            default=default_gens,
+            key=f"validation_target_gens_{selected_project}",
+            help="비워두면 전체 세대"
+        )
+    with col_target2:
+        target_types = st.multiselect(
+            "대상 설비유형",
+            options=type_options,
+            default=[],
+            key=f"validation_target_types_{selected_project}",
+            help="비워두면 전체 설비유형"
+        )
+    
+    treated_sites = site_master
+    if target_gens:
+        treated_sites = treated_sites[treated_sites['network_gen'].isin(target_gens)]
+    if target_types:
+        treated_sites = treated_sites[treated_sites['site_type'].isin(target_types)]
+    
+    # Controls share the site type; when every site is treated no control remains
+    treated_ids = treated_sites['site_id'].tolist()
+    savings_estimate = perf.call(
+        'savings:did',
+        dal.load_savings_estimate,
+        treated_ids,
+        int(baseline_month),
+        int(comparison_months)
+    )
+    
+    savings_interval = None
+    if savings_estimate is not None:
+        col_a, col_b, col_c = st.columns(3)
         
-        before_months = months_sorted[max(0, baseline_idx - comparison_months):baseline_idx]
-        after_months = months_sorted[baseline_idx:min(len(months_sorted), baseline_idx + comparison_months)]
+        with col_a:
+            st.metric("대상 / 대조 국소", f"{len(savings_estimate.treated_ids):,} / {len(set(savings_estimate.control_ids)):,}")
         
-        if len(before_months) > 0 and len(after_months) > 0:
-            # Calculate sample savings (random subset for demo)
-            np.random.seed(hash(selected_project) % 2**32)
-            sample_sites = np.random.choice(bills_df['site_id'].unique(), size=min(30, len(bills_df['site_id'].unique())), replace=False)
-            
-            before_bills = bills_df[bills_df['yymm'].isin(before_months) & bills_df['site_id'].isin(sample_sites)]
-            after_bills = bills_df[bills_df['yymm'].isin(after_months) & bills_df['site_id'].isin(sample_sites)]
-            
-            before_avg_kwh = before_bills['kwh_bill'].sum() / len(before_months) if len(before_months) > 0 else 0
-            after_avg_kwh = after_bills['kwh_bill'].sum() / len(after_months) if len(after_months) > 0 else 0
-            
-            before_avg_cost = before_bills['cost_bill'].sum() / len(before_months) if len(before_months) > 0 else 0
-            after_avg_cost = after_bills['cost_bill'].sum() / len(after_months) if len(after_months) > 0 else 0
-            
-            kwh_reduction = before_avg_kwh - after_avg_kwh
-            cost_reduction = before_avg_cost - after_avg_cost
-            
-            col_a, col_b = st.columns(2)
-            
-            with col_a:
-                st.metric(
-                    "전력량 절감",
-                    f"{kwh_reduction:,.0f} kWh/월",
-                    delta=f"{(kwh_reduction / before_avg_kwh * 100) if before_avg_kwh > 0 else 0:.1f}%"
-                )
-            
-            with col_b:
-                st.metric(
-                    "비용 절감",
-                    f"₩{cost_reduction:,.0f}/월",
-                    delta=f"{(cost_reduction / before_avg_cost * 100) if before_avg_cost > 0 else 0:.1f}%"
-                )
-            
-            # Chart
-            before_monthly = before_bills.groupby('yymm')['kwh_bill'].sum().reset_index()
-            before_monthly['period'] = '전'
-            
-            after_monthly = after_bills.groupby('yymm')['kwh_bill'].sum().reset_index()
-            after_monthly['period'] = '후'
-            
-            combined_monthly = pd.concat([before_monthly, after_monthly])
-            
-            fig_comparison = px.line(
-                combined_monthly,
-                x='yymm',
-                y='kwh_bill',
-                color='period',
-                title=f'{project_data["project_name"]} 전력 사용량 전후 비교',
-                labels={'yymm': '월', 'kwh_bill': '총 kWh', 'period': '기간'},
-                markers=True
+        with col_b:
+            st.metric("전력량 절감", f"{savings_estimate.kwh_savings_per_month:,.0f} kWh/월")
+        
+        with col_c:
+            st.metric("비용 절감", f"₩{savings_estimate.krw_savings_per_month:,.0f}/월")
+        
+        st.caption(
+            f"적용 전 {len(savings_estimate.pre_months)}개월 vs 적용 후 {len(savings_estimate.post_months)}개월, "
+            f"계절성 제거 후 대조군 대비 차이의 변화 (양수 = 절감)"
+            + (f" | 데이터 누락으로 제외된 대상 국소 {savings_estimate.n_excluded}개" if savings_estimate.n_excluded else "")
+        )
+        
+        # Bootstrap interval over treated sites and months (shown before confirmation)
+        confidence = st.select_slider(
+            "신뢰수준",
+            options=CONFIDENCE_LEVELS,
+            value=0.9,
+            format_func=lambda x: f"{x:.0%}",
+            key=f"validation_confidence_{selected_project}"
+        )
+        savings_interval = perf.call(
+            'savings:bootstrap',
+            dal.load_savings_interval,
+            treated_ids,
+            int(baseline_month),
+            int(comparison_months),
+            confidence
+        )
+        
+        col_ci1, col_ci2 = st.columns(2)
+        
+        with col_ci1:
+            st.metric(
+                f"비용 절감 {confidence:.0%} 신뢰구간",
+                f"₩{savings_interval.krw_lower:,.0f} ~ ₩{savings_interval.krw_upper:,.0f}/월"
             )
-            
-            # Add baseline line (without add_vline to avoid type errors)
-            # Use add_shape instead for safety
-            fig_comparison.add_shape(
-                type="line",
-                x0=baseline_idx,
-                y0=0,
-                x1=baseline_idx,
-                y1=1,
-                yref="paper",
-                line=dict(color="red", width=2, dash="dash")
+        
+        with col_ci2:
+            st.metric(
+                f"전력량 절감 {confidence:.0%} 신뢰구간",
+                f"{savings_interval.kwh_lower:,.0f} ~ {savings_interval.kwh_upper:,.0f} kWh/월"
             )
-            
+        
+        st.caption(f"부트스트랩 {savings_interval.n_resamples:,}회 (대상 국소·적용 전/후 월 복원추출)")
+        if savings_interval.includes_zero:
+            st.warning("⚠️ 신뢰구간이 0을 포함합니다. 절감 효과가 통계적으로 확인되지 않았습니다.")
+        
+        # Chart: deseasonalized kWh gap (treated - control) per month
+        gap = pd.DataFrame({
+            'yymm': np.concatenate([savings_estimate.pre_months, savings_estimate.post_months]).astype(str),
+            'gap_kwh': savings_estimate.diff.sum(axis=0),
+            'period': ['전'] * len(savings_estimate.pre_months) + ['후'] * len(savings_estimate.post_months)
+        })
+        
+        fig_comparison = px.line(
+            gap,
+            x='yymm',
+            y='gap_kwh',
+            color='period',
+            title=f'{project_data["project_name"]} 대상군 - 대조군 사용량 차이 (계절성 제거)',
+            labels={'yymm': '월', 'gap_kwh': '차이 kWh', 'period': '기간'},
+            markers=True
+        )
+        
+        with perf.section('chart:fig_comparison'):
             st.plotly_chart(fig_comparison, use_container_width=True)
+    else:
+        st.info("선택한 기간과 대상에 대해 비교 가능한 대상/대조 국소가 없습니다.")
     
     st.markdown("---")
     
@@ -305,15 +349,31 @@ if selected_project != '전체':
             key=f"verified_amount_{selected_project}"
         )
     
+        if savings_interval is not None and not (
+            savings_interval.krw_lower <= verified_amount <= savings_interval.krw_upper
+        ):
+            st.warning(
+                f"확정 절감액이 {savings_interval.confidence:.0%} 신뢰구간"
+                f"(₩{savings_interval.krw_lower:,.0f} ~ ₩{savings_interval.krw_upper:,.0f}/월) 밖에 있습니다."
+            )
+    
     with col_action2:
         st.write("")  # Spacing
         st.write("")  # Spacing
-        if st.button("✅ 검증 완료로 반영", type="primary", key=f"verify_btn_{selected_project}"):
-            # Update project with verified savings
+        if savings_interval is None:
+            st.caption("신뢰구간을 산출할 수 있어야 확정할 수 있습니다.")
+        if st.button(
+            "✅ 검증 완료로 반영",
+            type="primary",
+            key=f"verify_btn_{selected_project}",
+            disabled=savings_interval is None
+        ):
+            # Update project with verified savings and its interval
             project_master_manager.update_project(
                 project_id=selected_project,
                 verified_savings_krw=verified_amount,
-                status='완료' if verified_amount > 0 else project_data['status']
+                status='완료' if verified_amount > 0 else project_data['status'],
+                verified_ci_krw=(savings_interval.krw_lower, savings_interval.krw_upper)
             )
             
             # Create verified savings record
@@ -322,8 +382,13 @@ if selected_project != '전체':
                 site_id=None,
                 category=project_data['project_name'],
                 verified_savings_krw=verified_amount,
-                notes=validation_notes if validation_notes else f"{project_data['project_name']} 효과 검증 완료"
+                notes=validation_notes if validation_notes else f"{project_data['project_name']} 효과 검증 완료",
+                interval=savings_interval.to_record(),
+                project_id=selected_project
             )
+            if saving_id is None:
+                # save_savings already reported the failed write
+                st.stop()
             
             # Create action
             current_user = st.session_state.get("current_user", "담당자")
@@ -346,20 +411,106 @@ else:
     
     col1, col2, col3, col4 = st.columns(4)
     
+    # Running project rollups (maintained on every project write)
+    project_totals = project_master_manager.get_totals()
+    status_counts = project_master_manager.get_rollup('status').set_index('status')['count']
+    
     with col1:
-        render_simple_metric_card("전체 과제", f"{len(projects_df)} 건")
+        render_simple_metric_card("전체 과제", f"{project_totals['count']} 건")
     
     with col2:
-        in_progress = len(projects_df[projects_df['status'] == '진행 중'])
+        in_progress = int(status_counts.get('진행 중', 0))
         render_simple_metric_card("진행 중", f"{in_progress} 건")
     
     with col3:
-        completed = len(projects_df[projects_df['status'] == '완료'])
+        completed = int(status_counts.get('완료', 0))
         render_simple_metric_card("완료", f"{completed} 건")
     
     with col4:
-        total_verified = projects_df['verified_savings_krw'].sum()
+        total_verified = project_totals['verified_savings_krw']
         render_simple_metric_card("확정 절감", f"₩{total_verified:,.0f}/월")
+    
+    # Verified savings records rolled up by category and month
+    category_rollup = verified_savings_manager.get_savings_rollup('category')
+    if len(category_rollup) > 0:
+        with st.expander(f"📒 검증 절감 기록 누계 (₩{verified_savings_manager.get_total_verified_savings():,.0f})"):
+            col_cat, col_month = st.columns(2)
+            
+            with col_cat:
+                st.dataframe(
+                    category_rollup.rename(columns={'category': '구분', 'count': '건수', 'verified_savings_krw': '확정 절감액'}),
+                    use_container_width=True,
+                    hide_index=True
+                )
+            
+            with col_month:
+                st.dataframe(
+                    verified_savings_manager.get_savings_rollup('yymm').rename(
+                        columns={'yymm': '기준월', 'count': '건수', 'verified_savings_krw': '확정 절감액'}
+                    ),
+                    use_container_width=True,
+                    hide_index=True
+                )
+
+st.markdown("---")
+
+# Traffic efficiency time series (precomputed kWh/GB table, all months and sites)
+st.markdown("## 📶 트래픽 효율 (kWh/GB) 추이")
+
+efficiency_df = perf.call('derived:efficiency', dal.load_derived_table, 'efficiency')
+
+if len(efficiency_df) > 0:
+    gen_trend = efficiency_df.groupby(['yymm', 'network_gen'], as_index=False, observed=True)['kwh_per_gb'].median()
+    gen_trend['yymm'] = gen_trend['yymm'].astype(str)
+    
+    fig_efficiency = px.line(
+        gen_trend,
+        x='yymm',
+        y='kwh_per_gb',
+        color='network_gen',
+        title='세대별 kWh/GB 중앙값 추이',
+        labels={'yymm': '월', 'kwh_per_gb': 'kWh/GB', 'network_gen': '세대'},
+        markers=True
+    )
+    
+    with perf.section('chart:fig_efficiency'):
+        st.plotly_chart(fig_efficiency, use_container_width=True)
+    
+    # 3G Fade-Out: 3G sites least efficient against their peers in the latest month
+    st.markdown("### 📉 3G Fade-Out 후보 (동일 세대·설비유형 대비 효율 하위)")
+    
+    efficiency_latest = efficiency_df['yymm'].max()
+    recent_months = sorted(efficiency_df['yymm'].unique())[-6:]
+    sites_3g = efficiency_df[(efficiency_df['network_gen'] == '3G') & efficiency_df['yymm'].isin(recent_months)]
+    
+    if len(sites_3g) > 0:
+        recent_avg = sites_3g.groupby('site_id', observed=True)['kwh_per_gb'].mean().rename('kwh_per_gb_6m_avg')
+        candidates = sites_3g[sites_3g['yymm'] == efficiency_latest].merge(
+            recent_avg, on='site_id', how='left'
+        ).sort_values('peer_percentile', ascending=False)
+        
+        candidates = candidates[[
+            'site_id', 'site_name', 'region', 'site_type', 'kwh_bill', 'gb_traffic', 'kwh_per_gb',
+            'peer_median_kwh_per_gb', 'peer_percentile', 'kwh_per_gb_mom_pct', 'kwh_per_gb_6m_avg'
+        ]].rename(columns={
+            'site_id': '국소ID', 'site_name': '국소명', 'region': '지역', 'site_type': '설비유형',
+            'kwh_bill': 'kWh', 'gb_traffic': 'GB', 'kwh_per_gb': 'kWh/GB',
+            'peer_median_kwh_per_gb': '동종 중앙값', 'peer_percentile': '동종 백분위',
+            'kwh_per_gb_mom_pct': '전월 대비(%)', 'kwh_per_gb_6m_avg': '6개월 평균 kWh/GB'
+        })
+        
+        st.caption(f"기준월: {efficiency_latest} | 3G 국소 {len(candidates)}개 (백분위가 높을수록 비효율)")
+        render_paged_table(
+            candidates,
+            key="efficiency_3g_candidates",
+            page_size=20,
+            data_version=dal.get_data_version(),
+            export_file_name=f"3G_fade_out_후보_{efficiency_latest}"
+        )
+    else:
+        st.info("3G 국소의 트래픽 데이터가 없습니다.")
+else:
+    st.info("트래픽 효율을 계산할 데이터가 없습니다.")
 
 st.markdown("---")
 
@@ -476,3 +627,5 @@ with st.form("new_experiment_form"):
 # Footer with PYLON branding
 st.markdown(create_footer(), unsafe_allow_html=True)
 
+# Log timings of this rerun (sidebar panel is opt-in)
+finish_page_perf(perf)
@@ -0,0 +1,33 @@
+"""Materialize derived page tables for the current data version.
+
+Run after new data lands (e.g. after regenerate_data.py or an upload):
+
+    python precompute_artifacts.py [--workers N] [--force]
+"""
+
+import argparse
+from pathlib import Path
+from src.precompute import run_precompute
+import sys
+
+# Set UTF-8 encoding for Windows console
+if sys.platform == 'win32':
+    import codecs
+    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
+    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute derived page tables")
+    parser.add_argument("--data-dir", default="data", help="Data directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if artifacts exist")
+    args = parser.parse_args()
+
+    print("Precomputing derived tables...")
+    print("=" * 70)
+    manifest = run_precompute(Path(args.data_dir), n_workers=args.workers, force=args.force)
+    print(f"Data version: {manifest['data_version']} (created {manifest['created_at']})")
+    for name, info in manifest['artifacts'].items():
+        print(f"  {name:<24} {info['rows']:>8,} rows  {info['build_seconds']:>7.2f}s")
+    print("=" * 70)
+    print("Precompute complete!")
@@ -67,35 +67,69 @@ class ActionManager:
         Returns:
             Created Action object
         """
+        return self.create_actions(
+            owner=owner,
+            category=category,
+            descriptions=[description],
+            site_ids=[site_id],
+            evidence_links=evidence_links,
+            due_days=due_days
+        )[0]
+    
+    def create_actions(
+        self,
+        owner: str,
+        category: ActionCategory,
+        descriptions: List[str],
+        site_ids: List[Optional[str]],
+        evidence_links: Optional[List[str]] = None,
+        due_days: int = 7
+    ) -> List[Action]:
+        """
+        Create one action per site in a single write (bulk creation).
+        
+        Args:
+            owner: Action owner
+            category: Action category
+            descriptions: Action description per site
+            site_ids: Related site ID per action
+            evidence_links: Links to evidence shared by the actions (optional)
+            due_days: Days until due date
+        
+        Returns:
+            Created Action objects
+        """
+        if len(descriptions) != len(site_ids):
+            raise ValueError("조치 내용과 국소 수가 일치하지 않습니다.")
+        
         now = datetime.now()
         actions_df = self.load_actions()
         
-        # Generate ID
-        if len(actions_df) == 0:
-            action_id = "ACT0001"
-        else:
-            last_id = actions_df['id'].max()
-            num = int(last_id[3:]) + 1
-            action_id = f"ACT{num:04d}"
-        
-        action = Action(
-            id=action_id,
-            created_at=now,
-            due_date=now + timedelta(days=due_days),
-            owner=owner,
-            status=ActionStatus.TODO,
-            category=category,
-            site_id=site_id,
-            description=description,
-            evidence_links=evidence_links or []
-        )
+        # Generate IDs after the current last one (numeric: string order breaks past ACT9999)
+        last_num = int(actions_df['id'].str[3:].astype(int).max()) if len(actions_df) > 0 else 0
+        
+        actions = [
+            Action(
+                id=f"ACT{last_num + i + 1:04d}",
+                created_at=now,
+                due_date=now + timedelta(days=due_days),
+                owner=owner,
+                status=ActionStatus.TODO,
+                category=category,
+                site_id=site_id,
+                description=description,
+                evidence_links=list(evidence_links or [])
+            )
+            for i, (site_id, description) in enumerate(zip(site_ids, descriptions))
+        ]
         
         # Append to dataframe
-        new_row = pd.DataFrame([action.to_dict()])
-        actions_df = pd.concat([actions_df, new_row], ignore_index=True)
-        self.save_actions(actions_df)
+        new_rows = pd.DataFrame([action.to_dict() for action in actions])
+        if len(actions_df) > 0:
+            new_rows = pd.concat([actions_df, new_rows], ignore_index=True)
+        self.save_actions(new_rows)
         
-        return action
+        return actions
     
     def update_action_status(self, action_id: str, new_status: ActionStatus) -> bool:
         """
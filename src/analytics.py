@@ -3,6 +3,8 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, Tuple, Optional
+from src.contract_optimizer import optimize_contract_power
+from src.tariffs import TariffBook, load_tariff_book
 
 
 def calculate_plan_variance(
@@ -148,7 +150,7 @@ def detect_zero_usage_sites(bills_df: pd.DataFrame, months: int = 3) -> pd.DataF
     zero_usage = bills_sorted[bills_sorted['kwh_bill'] == 0].copy()
     
     # Count consecutive zeros per site
-    zero_count = zero_usage.groupby('site_id').size().reset_index(name='zero_months')
+    zero_count = zero_usage.groupby('site_id', observed=True).size().reset_index(name='zero_months')
     
     # Filter sites with >= months consecutive zeros
     problem_sites = zero_count[zero_count['zero_months'] >= months]
@@ -158,14 +160,19 @@ def detect_zero_usage_sites(bills_df: pd.DataFrame, months: int = 3) -> pd.DataF
 
 def recommend_contract_power_adjustment(
     site_df: pd.DataFrame,
-    safety_margin: float = 1.15
+    max_exceedance_prob: Optional[float] = None,
+    tariff_book: Optional[TariffBook] = None
 ) -> Dict[str, any]:
     """
-    Recommend contract power adjustment based on usage patterns.
+    Recommend the contract power minimizing expected basic charge plus penalty.
+    
+    The site's monthly demands (kWh / demand hours) form its demand
+    distribution; see optimize_contract_power. The input is not modified.
     
     Args:
         site_df: DataFrame with site usage history
-        safety_margin: Safety margin multiplier
+        max_exceedance_prob: Highest accepted probability of exceeding the contract
+        tariff_book: Tariff book for the 정액 rates (loaded from config if None)
     
     Returns:
         Recommendation dictionary
@@ -173,37 +180,41 @@ def recommend_contract_power_adjustment(
     if len(site_df) == 0 or 'kwh_bill' not in site_df.columns:
         return {'recommendation': '데이터 부족', 'new_contract_kw': 0, 'savings_est': 0}
     
-    # Estimate max demand from kWh (rough approximation)
-    # Assuming 720 hours per month
-    site_df['demand_est_kw'] = site_df['kwh_bill'] / 720
+    book = tariff_book or load_tariff_book()
+    tariff = book.tariff_for('정액')
+    
+    # Estimate monthly max demand from kWh
+    demand_kw = site_df['kwh_bill'].to_numpy(dtype=np.float64) / book.demand_hours_per_month
     
     # Get current contract power
     current_contract_kw = site_df['contract_power_kw'].iloc[-1] if 'contract_power_kw' in site_df.columns else 0
     
-    # Calculate recommended power with safety margin
-    max_demand_kw = site_df['demand_est_kw'].max()
-    recommended_kw = max_demand_kw * safety_margin
-    
-    # Calculate potential savings (basic rate difference)
-    # Assuming 8000 KRW/kW for basic charge
-    if current_contract_kw > recommended_kw * 1.1:
-        # Recommend reduction
-        savings_est = (current_contract_kw - recommended_kw) * 8000
+    decision = optimize_contract_power(
+        demand_kw[None, :],
+        np.array([current_contract_kw], dtype=np.float64),
+        tariff.basic_charge_krw_per_kw,
+        tariff.penalty_krw_per_kw,
+        max_exceedance_prob=max_exceedance_prob
+    )
+    recommended_kw = float(decision['recommended_kw'][0])
+    exceedance_prob = float(decision['exceedance_prob'][0])
+    
+    if recommended_kw < current_contract_kw:
         recommendation = f"계약전력 감설 권고: {current_contract_kw:.1f}kW → {recommended_kw:.1f}kW"
-    elif current_contract_kw < recommended_kw * 0.9:
-        # Recommend increase to avoid penalties
-        penalty_est = (recommended_kw - current_contract_kw) * 12000  # Penalty rate
-        recommendation = f"계약전력 증설 필요: {current_contract_kw:.1f}kW → {recommended_kw:.1f}kW (초과요금 위험)"
-        savings_est = -penalty_est
+    elif recommended_kw > current_contract_kw:
+        recommendation = (
+            f"계약전력 증설 필요: {current_contract_kw:.1f}kW → {recommended_kw:.1f}kW "
+            f"(초과 확률 {decision['current_exceedance_prob'][0]:.0%} → {exceedance_prob:.0%})"
+        )
     else:
         recommendation = "적정 수준"
-        savings_est = 0
     
     return {
         'recommendation': recommendation,
         'current_contract_kw': current_contract_kw,
         'new_contract_kw': recommended_kw,
-        'savings_est': savings_est
+        'savings_est': float(decision['savings_est'][0]),
+        'exceedance_prob': exceedance_prob
     }
 
 
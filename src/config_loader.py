@@ -5,6 +5,20 @@ from pathlib import Path
 from typing import Dict, Any
 
 
+# Dataset file names in the data directory (kept here so the startup gate
+# can check them without importing the data access layer)
+DATASET_FILES = {
+    'bills': "sample_bills.parquet",
+    'actual': "sample_actual.parquet",
+    'plan': "sample_plan.parquet",
+    'traffic': "sample_traffic.parquet",
+    'site_master': "sample_site_master.parquet"
+}
+
+# Tariff settings drive derived artifacts, so the data version signs this file too
+TARIFF_CONFIG_PATH = Path("config") / "tariffs.yaml"
+
+
 def load_governance_config(config_path: Path = None) -> Dict[str, Any]:
     """
     Load governance configuration from YAML file.
@@ -42,3 +56,80 @@ def load_governance_config(config_path: Path = None) -> Dict[str, Any]:
 
 
 
+
+
+def load_tariff_config(config_path: Path = None) -> Dict[str, Any]:
+    """
+    Load tariff configuration from YAML file.
+    
+    Args:
+        config_path: Path to config file. If None, uses default config/tariffs.yaml
+    
+    Returns:
+        Dictionary with tariff configuration (current 정액/종량 tariffs if missing)
+    """
+    if config_path is None:
+        config_path = TARIFF_CONFIG_PATH
+    
+    # Default values (current tariffs)
+    defaults = {
+        'demand_hours_per_month': 720,
+        'contract_type_tariffs': {'정액': 'fixed_standard', '종량': 'volume_standard'},
+        'tariffs': {
+            'fixed_standard': {
+                'name': '정액 표준',
+                'basic_charge_krw_per_kw': 8000,
+                'energy_charge_krw_per_kwh': 80,
+                'penalty_krw_per_kw': 12000
+            },
+            'volume_standard': {
+                'name': '종량 표준',
+                'basic_charge_krw_per_kw': 0,
+                'energy_charge_krw_per_kwh': 120,
+                'penalty_krw_per_kw': 0
+            }
+        }
+    }
+    
+    try:
+        if config_path.exists():
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f)
+                # Merge with defaults
+                return {**defaults, **config}
+        else:
+            return defaults
+    except Exception as e:
+        print(f"Warning: Could not load tariff config: {e}")
+        return defaults
+
+
+def load_data_config(config_path: Path = None) -> Dict[str, Any]:
+    """
+    Load data loading configuration from YAML file.
+    
+    Args:
+        config_path: Path to config file. If None, uses default config/data.yaml
+    
+    Returns:
+        Dictionary with data loading configuration
+    """
+    if config_path is None:
+        config_path = Path("config") / "data.yaml"
+    
+    # Default values
+    defaults = {
+        'dimension_dtype': 'object'
+    }
+    
+    try:
+        if config_path.exists():
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f)
+                # Merge with defaults
+                return {**defaults, **config}
+        else:
+            return defaults
+    except Exception as e:
+        print(f"Warning: Could not load data config: {e}")
+        return defaults
@@ -0,0 +1,116 @@
+"""Cost-minimizing contract power optimizer."""
+
+import numpy as np
+from typing import Dict, Optional, Union
+
+
+# Contract changes within this share of the current contract are not worth a filing
+MIN_CHANGE_RATIO = 0.1
+
+# Smallest expected saving (KRW/month) that justifies a contract change
+MIN_SAVING_KRW = 1000.0
+
+OPTIMIZER_CHUNK_SITES = 20_000
+
+
+def optimize_contract_power(
+    demand_kw: np.ndarray,
+    current_kw: np.ndarray,
+    basic_rate_krw_per_kw: Union[float, np.ndarray],
+    penalty_rate_krw_per_kw: Union[float, np.ndarray],
+    max_exceedance_prob: Optional[float] = None,
+    min_change_ratio: float = MIN_CHANGE_RATIO,
+    min_saving_krw: float = MIN_SAVING_KRW
+) -> Dict[str, np.ndarray]:
+    """
+    Contract kW minimizing expected basic charge plus over-contract penalty.
+
+    The demand distribution of a site is its observed monthly demands. For
+    a contract level C the expected monthly cost is
+
+        basic_rate x C + penalty_rate x E[max(D - C, 0)]
+
+    which is piecewise linear and convex in C with breakpoints at the
+    observed demands, so the optimum is among them (the newsvendor
+    quantile P(D > C) = basic_rate / penalty_rate). The candidates are the
+    observed demands plus the current contract, evaluated for all sites at
+    once. Levels whose exceedance probability is above max_exceedance_prob
+    are excluded. The cost is flat over whole segments (where P(D > C)
+    equals the quantile), so the lowest kW within float tolerance of the
+    minimum is chosen. The current contract is kept unless the change saves
+    more than min_saving_krw a month and moves the contract by more than
+    min_change_ratio of the current level.
+
+    Args:
+        demand_kw: (sites, months) estimated monthly maximum demand (NaN: missing)
+        current_kw: Current contract kW per site (NaN treated as 0)
+        basic_rate_krw_per_kw: Basic charge per contract kW (scalar or per site)
+        penalty_rate_krw_per_kw: Penalty per kW over contract (scalar or per site)
+        max_exceedance_prob: Highest accepted probability of exceeding the contract
+        min_change_ratio: Smallest contract change recommended, relative to current
+        min_saving_krw: Smallest expected monthly saving (KRW) recommended
+
+    Returns:
+        Arrays per site: recommended_kw, current_cost, recommended_cost
+        (expected KRW/month), savings_est (KRW/month; negative only when
+        max_exceedance_prob forces an increase),
+        exceedance_prob, current_exceedance_prob (NaN without history)
+    """
+    demand_kw = np.asarray(demand_kw, dtype=np.float64)
+    current_kw = np.nan_to_num(np.asarray(current_kw, dtype=np.float64))
+    n_sites = len(demand_kw)
+    basic = np.broadcast_to(np.asarray(basic_rate_krw_per_kw, dtype=np.float64), (n_sites,))
+    penalty = np.broadcast_to(np.asarray(penalty_rate_krw_per_kw, dtype=np.float64), (n_sites,))
+
+    keys = ['recommended_kw', 'current_cost', 'recommended_cost', 'savings_est',
+            'exceedance_prob', 'current_exceedance_prob']
+    result = {key: np.full(n_sites, np.nan) for key in keys}
+
+    for start in range(0, n_sites, OPTIMIZER_CHUNK_SITES):
+        rows = slice(start, start + OPTIMIZER_CHUNK_SITES)
+        demand = demand_kw[rows]
+        current = current_kw[rows]
+        observed = ~np.isnan(demand)
+        n_observed = observed.sum(axis=1)
+
+        # Candidates: observed demands (missing months repeat the current contract) and current
+        candidates = np.concatenate([np.where(observed, demand, current[:, None]), current[:, None]], axis=1)
+        current_pos = candidates.shape[1] - 1
+
+        # (sites, candidates, months) excess over each candidate
+        excess = np.maximum(demand[:, None, :] - candidates[:, :, None], 0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            expected_excess = np.nansum(excess, axis=2) / n_observed[:, None]
+            exceedance = (excess > 0).sum(axis=2) / n_observed[:, None]
+
+        cost = basic[rows, None] * candidates + penalty[rows, None] * expected_excess
+        if max_exceedance_prob is not None:
+            # The largest observed demand is never exceeded, so a feasible level exists
+            cost = np.where(exceedance <= max_exceedance_prob, cost, np.inf)
+
+        site_rows = np.arange(len(candidates))
+        min_cost = cost.min(axis=1)
+        # Lowest kW among the candidates tied (within float tolerance) with the minimum
+        near_min = np.isclose(cost, min_cost[:, None], rtol=1e-9, atol=1e-6)
+        best = np.argmin(np.where(near_min, candidates, np.inf), axis=1)
+        best_kw = candidates[site_rows, best]
+        # Immaterial savings and small changes keep the current contract (if it is within the limit)
+        current_feasible = np.isfinite(cost[:, current_pos])
+        keep_current = (
+            (current_feasible & (cost[:, current_pos] - min_cost <= min_saving_krw))
+            | ((np.abs(best_kw - current) <= min_change_ratio * current) & current_feasible)
+            | (n_observed == 0)
+        )
+        best = np.where(keep_current, current_pos, best)
+
+        current_cost = basic[rows] * current + penalty[rows] * expected_excess[:, current_pos]
+        recommended_cost = basic[rows] * candidates[site_rows, best] + penalty[rows] * expected_excess[site_rows, best]
+        has_history = n_observed > 0
+
+        result['recommended_kw'][rows] = candidates[site_rows, best]
+        result['current_cost'][rows] = np.where(has_history, current_cost, np.nan)
+        result['recommended_cost'][rows] = np.where(has_history, recommended_cost, np.nan)
+        result['savings_est'][rows] = np.where(has_history, current_cost - recommended_cost, 0.0)
+        result['exceedance_prob'][rows] = exceedance[site_rows, best]
+        result['current_exceedance_prob'][rows] = exceedance[:, current_pos]
+    return result
@@ -0,0 +1,143 @@
+"""Fleet-wide price/volume decomposition of cost variance."""
+
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Sequence
+from src.perf import timed
+
+
+# Site attributes the decomposition rolls up to
+VARIANCE_DIMENSIONS = ['region', 'site_type', 'contract_type', 'network_gen']
+
+# Baselines supported by build_site_variance
+VARIANCE_BASELINES = ['prior_year', 'plan_price']
+
+EFFECT_COLUMNS = ['volume_effect', 'mix_effect', 'price_effect', 'total_variance']
+
+
+def _prior_year_baseline(bills_df: pd.DataFrame) -> pd.DataFrame:
+    """Same site, same month of the previous year (kwh_base, cost_base)."""
+    baseline = bills_df[['yymm', 'site_id', 'kwh_bill', 'cost_bill']].rename(
+        columns={'kwh_bill': 'kwh_base', 'cost_bill': 'cost_base'}
+    )
+    baseline = baseline.assign(yymm=baseline['yymm'].astype(int) + 100)
+    return baseline.groupby(['yymm', 'site_id'], as_index=False, observed=True)[['kwh_base', 'cost_base']].sum()
+
+
+def _plan_price_baseline(bills_df: pd.DataFrame, plan_df: pd.DataFrame) -> pd.DataFrame:
+    """Prior-year volume valued at the month's plan-implied unit price."""
+    baseline = _prior_year_baseline(bills_df)
+    plan = plan_df.groupby('yymm')[['kwh_plan', 'cost_plan']].sum()
+    plan.index = plan.index.astype(int)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        plan_price = (plan['cost_plan'] / plan['kwh_plan']).replace([np.inf, -np.inf], np.nan)
+    baseline['cost_base'] = baseline['kwh_base'] * baseline['yymm'].map(plan_price)
+    return baseline[baseline['cost_base'].notna()]
+
+
+def build_site_variance(
+    bills_df: pd.DataFrame,
+    site_master: pd.DataFrame,
+    plan_df: Optional[pd.DataFrame] = None,
+    baseline: str = 'prior_year'
+) -> pd.DataFrame:
+    """
+    Price/volume decomposition of every site-month against a baseline.
+
+    Per site-month, with p_base the baseline unit price:
+    - usage_effect = (kwh_actual - kwh_base) * p_base
+    - price_effect = cost_actual - kwh_actual * p_base
+    and usage_effect + price_effect = cost_actual - cost_base exactly.
+    Sites without baseline volume use the month's fleet baseline price.
+
+    Args:
+        bills_df: Bills (yymm, site_id, kwh_bill, cost_bill)
+        site_master: Site master (dimension columns)
+        plan_df: Plan (yymm, kwh_plan, cost_plan); required for 'plan_price'
+        baseline: 'prior_year' (site's own prior-year cost) or 'plan_price'
+            (prior-year volume at the plan-implied unit price)
+
+    Returns:
+        yymm, site_id, dimension columns, kwh_actual, cost_actual, kwh_base,
+        cost_base, price_base, usage_effect, price_effect, total_variance
+        (months that have a baseline only)
+    """
+    if baseline not in VARIANCE_BASELINES:
+        raise ValueError(f"지원하지 않는 기준: {baseline}")
+    if baseline == 'plan_price' and plan_df is None:
+        raise ValueError("계획 단가 기준에는 계획 데이터가 필요합니다.")
+
+    current = bills_df.groupby(['yymm', 'site_id'], as_index=False, observed=True)[['kwh_bill', 'cost_bill']].sum()
+    current = current.rename(columns={'kwh_bill': 'kwh_actual', 'cost_bill': 'cost_actual'})
+    current['yymm'] = current['yymm'].astype(int)
+
+    base = _prior_year_baseline(bills_df) if baseline == 'prior_year' else _plan_price_baseline(bills_df, plan_df)
+    # Months that have both actuals and a baseline
+    base_months = np.intersect1d(base['yymm'].unique(), current['yymm'].unique())
+
+    frame = current.merge(base, on=['yymm', 'site_id'], how='outer')
+    frame = frame[frame['yymm'].isin(base_months)]
+    frame[['kwh_actual', 'cost_actual', 'kwh_base', 'cost_base']] = \
+        frame[['kwh_actual', 'cost_actual', 'kwh_base', 'cost_base']].fillna(0.0)
+
+    # Site baseline price; the month's fleet price where the site had no baseline volume
+    month_totals = frame.groupby('yymm')[['kwh_base', 'cost_base']].transform('sum')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fleet_price = month_totals['cost_base'] / month_totals['kwh_base']
+        site_price = frame['cost_base'] / frame['kwh_base']
+    frame['price_base'] = site_price.where(frame['kwh_base'] > 0, fleet_price).fillna(0.0)
+
+    frame['usage_effect'] = frame['kwh_actual'] * frame['price_base'] - frame['cost_base']
+    frame['price_effect'] = frame['cost_actual'] - frame['kwh_actual'] * frame['price_base']
+    frame['total_variance'] = frame['cost_actual'] - frame['cost_base']
+
+    dimensions = [col for col in VARIANCE_DIMENSIONS if col in site_master.columns]
+    frame = frame.merge(site_master[['site_id'] + dimensions], on='site_id', how='left')
+
+    columns = ['yymm', 'site_id'] + dimensions + [
+        'kwh_actual', 'cost_actual', 'kwh_base', 'cost_base', 'price_base',
+        'usage_effect', 'price_effect', 'total_variance'
+    ]
+    return frame[columns].sort_values(['yymm', 'site_id']).reset_index(drop=True)
+
+
+@timed('variance:rollup')
+def rollup_variance(
+    site_variance: pd.DataFrame,
+    dimensions: Sequence[str] = (),
+    by_month: bool = False
+) -> pd.DataFrame:
+    """
+    Roll site decompositions up to dimension groups.
+
+    Within a group, the site usage effects split into
+    - volume_effect = (sum kwh_actual - sum kwh_base) * group baseline price
+    - mix_effect = sum usage_effect - volume_effect (volume shifting between
+      cheaper and dearer sites)
+    and price_effect is the sum of site price effects, so
+    volume_effect + mix_effect + price_effect = total_variance in every group
+    and group rows sum to the fleet total.
+
+    Args:
+        site_variance: Output of build_site_variance (optionally filtered)
+        dimensions: Columns to group by (fleet total if empty)
+        by_month: Also group by yymm
+
+    Returns:
+        Group columns, kwh_actual, kwh_base, cost_actual, cost_base,
+        volume_effect, mix_effect, price_effect, total_variance
+    """
+    keys: List[str] = (['yymm'] if by_month else []) + list(dimensions)
+    measures = ['kwh_actual', 'kwh_base', 'cost_actual', 'cost_base', 'usage_effect', 'price_effect', 'total_variance']
+
+    if keys:
+        groups = site_variance.groupby(keys, dropna=False, observed=True)[measures].sum().reset_index()
+    else:
+        groups = site_variance[measures].sum().to_frame().T
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        group_price = (groups['cost_base'] / groups['kwh_base']).where(groups['kwh_base'] > 0, 0.0)
+    groups['volume_effect'] = (groups['kwh_actual'] - groups['kwh_base']) * group_price
+    groups['mix_effect'] = groups['usage_effect'] - groups['volume_effect']
+
+    return groups[keys + ['kwh_actual', 'kwh_base', 'cost_actual', 'cost_base'] + EFFECT_COLUMNS]
@@ -1,10 +1,82 @@
 """Data Access Layer for PYLON platform."""
 
+import hashlib
+import threading
+import time
 import pandas as pd
+import pyarrow.parquet as pq
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
-from src.sample_data import generate_sample_data
+from typing import Callable, Optional, Dict, Any, List, Sequence, Tuple
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from src.config_loader import load_data_config, DATASET_FILES, TARIFF_CONFIG_PATH
+from src.site_index import SiteIndex
+from src.site_matrix import SiteMonthMatrix, build_fleet_matrix
+from src.precompute import ArtifactStore, ARTIFACT_NAMES
+from src import derived_tables
+from src.plan_engine import build_plan_performance
+from src.cost_variance import build_site_variance, VARIANCE_BASELINES
+from src.forecasting import build_forecast_table, forecast_total
+from src.plan_allocation import allocate_plan
+from src.tariffs import load_tariff_book, recommend_tariffs
+from src.savings_validation import SavingsEstimate, estimate_savings
+from src.savings_uncertainty import SavingsInterval, bootstrap_savings_ci, DEFAULT_RESAMPLES
+
+
+# Key and dimension columns stored with the configured dimension dtype
+DIMENSION_COLUMNS = [
+    'site_id', 'region', 'site_type', 'voltage', 'contract_type', 'contract_type_minor',
+    'contract_target', 'network_gen', 'generation', 'rapa_type', 'data_source', 'scenario'
+]
+
+# object: Python strings, pyarrow: string[pyarrow], category: categoricals shared by all datasets
+DIMENSION_DTYPES = ['object', 'pyarrow', 'category']
+
+DERIVED_CACHE_TTL_SECONDS = 3600
+
+# Derived caches built in this process: (data version, cache name) -> build time
+_built_caches: Dict[Tuple[str, str], float] = {}
+_built_lock = threading.Lock()
+
+
+def _mark_built(data_version: str, name: str) -> None:
+    """Record a derived cache entry (called from the cached builders on a miss)."""
+    with _built_lock:
+        _built_caches[(data_version, name)] = time.time()
+
+
+@dataclass
+class DatasetBundle:
+    """All datasets of one data version."""
+    bills: pd.DataFrame
+    actual: pd.DataFrame
+    plan: pd.DataFrame
+    traffic: pd.DataFrame
+    site_master: pd.DataFrame
+    
+    def as_dict(self) -> Dict[str, pd.DataFrame]:
+        """Dataset name -> dataframe (the DATASET_FILES keys)."""
+        return {name: getattr(self, name) for name in DATASET_FILES}
+
+
+def _load_concurrently(
+    loaders: Dict[str, Callable[[], pd.DataFrame]],
+    max_workers: Optional[int] = None
+) -> DatasetBundle:
+    """Run one loader per dataset in a thread pool (parquet reads release the GIL)."""
+    # Workers share the calling script's context so loader messages still render
+    # (none in bare mode or background threads; attaching None only warns)
+    ctx = get_script_run_ctx(suppress_warning=True)
+    context_args = {'initializer': add_script_run_ctx, 'initargs': (None, ctx)} if ctx is not None else {}
+    with ThreadPoolExecutor(
+        max_workers=max_workers or len(loaders),
+        thread_name_prefix='pylon-load',
+        **context_args
+    ) as pool:
+        futures = {name: pool.submit(loader) for name, loader in loaders.items()}
+        return DatasetBundle(**{name: future.result() for name, future in futures.items()})
 
 
 class DataAccessLayer:
@@ -13,37 +85,149 @@ class DataAccessLayer:
     Supports both sample data and uploaded data.
     """
     
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, generate_missing: bool = True, dimension_dtype: Optional[str] = None):
         """
         Initialize data access layer.
         
         Args:
             data_dir: Directory containing data files
+            generate_missing: Generate sample data synchronously if missing
+                (pages pass False and use the background startup path)
+            dimension_dtype: Storage of DIMENSION_COLUMNS, one of DIMENSION_DTYPES
+                (default: dimension_dtype in config/data.yaml). The cached
+                loaders are per process, so pick one mode per app.
         """
         self.data_dir = data_dir
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.artifacts_dir = self.data_dir / "artifacts"
+        self.dimension_dtype = dimension_dtype or load_data_config()['dimension_dtype']
+        if self.dimension_dtype not in DIMENSION_DTYPES:
+            raise ValueError(f"지원하지 않는 차원 컬럼 형식: {self.dimension_dtype}")
         
         # Ensure sample data exists
-        if not self._sample_data_exists():
+        if generate_missing and not self._sample_data_exists():
+            # Imported here: only needed on first run
+            from src.sample_data import generate_sample_data
             generate_sample_data(self.data_dir)
     
     def _sample_data_exists(self) -> bool:
         """Check if sample data files exist."""
-        required_files = [
-            "sample_bills.parquet",
-            "sample_actual.parquet",
-            "sample_plan.parquet",
-            "sample_traffic.parquet",
-            "sample_site_master.parquet"
-        ]
-        return all((self.data_dir / f).exists() for f in required_files)
+        return all((self.data_dir / f).exists() for f in DATASET_FILES.values())
+    
+    def get_data_version(self) -> str:
+        """
+        Get a version signature of the current datasets.
+        
+        The signature changes whenever any dataset file is replaced
+        (e.g. after an upload) or the tariff config is edited (the
+        tariff-driven contract and tariff artifacts depend on it), so
+        derived caches can be keyed on it.
+        
+        Returns:
+            Short hex digest of file names, sizes and modification times
+        """
+        digest = hashlib.sha1()
+        paths = [self.data_dir / file_name for file_name in DATASET_FILES.values()] + [TARIFF_CONFIG_PATH]
+        for path in paths:
+            if path.exists():
+                stat = path.stat()
+                digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        return digest.hexdigest()[:12]
+    
+    def read_dataset(self, data_type: str) -> pd.DataFrame:
+        """
+        Read and validate one dataset without caching or UI messages.
+        
+        Used by the cached loaders and by headless batch jobs.
+        
+        Args:
+            data_type: 'bills', 'actual', 'plan', 'traffic' or 'site_master'
+        
+        Returns:
+            Validated dataframe
+        """
+        df = pd.read_parquet(self.data_dir / DATASET_FILES[data_type])
+        validator = getattr(self, f'_validate_{data_type}')
+        return self._apply_dimension_dtype(validator(df))
+    
+    def _apply_dimension_dtype(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the dimension columns of a dataset to the configured dtype."""
+        if self.dimension_dtype == 'object':
+            return df
+        if self.dimension_dtype == 'pyarrow':
+            dtypes = {col: 'string[pyarrow]' for col in DIMENSION_COLUMNS if col in df.columns}
+        else:
+            categories = self.dimension_categories()
+            dtypes = {col: categories[col] for col in DIMENSION_COLUMNS if col in df.columns}
+        return df.astype(dtypes)
+    
+    def dimension_categories(self) -> Dict[str, pd.CategoricalDtype]:
+        """
+        Categorical dtype of every dimension column, shared by all datasets.
+        
+        Categories are the sorted union of the column's values over every
+        dataset file, so merges and concats between datasets keep the
+        categorical dtype instead of falling back to object.
+        
+        Returns:
+            Dimension column -> CategoricalDtype
+        """
+        return self._dimension_categories(self.get_data_version())
+    
+    @st.cache_resource(max_entries=4)
+    def _dimension_categories(_self, data_version: str) -> Dict[str, pd.CategoricalDtype]:
+        """Scan only the dimension columns of every dataset file."""
+        values: Dict[str, set] = {col: set() for col in DIMENSION_COLUMNS}
+        for file_name in DATASET_FILES.values():
+            path = _self.data_dir / file_name
+            if not path.exists():
+                continue
+            schema_names = set(pq.read_schema(path).names)
+            columns = [col for col in DIMENSION_COLUMNS if col in schema_names]
+            frame = pd.read_parquet(path, columns=columns)
+            for col in columns:
+                values[col].update(frame[col].dropna().unique())
+        return {col: pd.CategoricalDtype(sorted(vals)) for col, vals in values.items()}
+    
+    def read_all(self, max_workers: Optional[int] = None) -> DatasetBundle:
+        """
+        Read and validate every dataset concurrently, without caching.
+        
+        Args:
+            max_workers: Reader threads (default: one per dataset)
+        
+        Returns:
+            DatasetBundle
+        """
+        return _load_concurrently(
+            {name: (lambda name=name: self.read_dataset(name)) for name in DATASET_FILES},
+            max_workers
+        )
+    
+    def load_all(self, max_workers: Optional[int] = None) -> DatasetBundle:
+        """
+        Load every dataset through the cached loaders, concurrently.
+        
+        Cold page loads issue all parquet reads at once instead of one
+        after another; each dataset still lands in its loader's cache, so
+        later load_bills() etc. calls are cache hits.
+        
+        Args:
+            max_workers: Reader threads (default: one per dataset)
+        
+        Returns:
+            DatasetBundle (empty dataframes for datasets that failed to load)
+        """
+        return _load_concurrently(
+            {name: getattr(self, f'load_{name}') for name in DATASET_FILES},
+            max_workers
+        )
     
     @st.cache_data(ttl=3600)
     def load_bills(_self) -> pd.DataFrame:
         """Load bills data with caching."""
         try:
-            df = pd.read_parquet(_self.data_dir / "sample_bills.parquet")
-            return _self._validate_bills(df)
+            return _self.read_dataset('bills')
         except Exception as e:
             st.error(f"청구서 데이터 로드 실패: {e}")
             return pd.DataFrame()
@@ -52,8 +236,7 @@ class DataAccessLayer:
     def load_actual(_self) -> pd.DataFrame:
         """Load actual usage data with caching."""
         try:
-            df = pd.read_parquet(_self.data_dir / "sample_actual.parquet")
-            return _self._validate_actual(df)
+            return _self.read_dataset('actual')
         except Exception as e:
             st.error(f"실사용량 데이터 로드 실패: {e}")
             return pd.DataFrame()
@@ -62,8 +245,7 @@ class DataAccessLayer:
     def load_plan(_self) -> pd.DataFrame:
         """Load plan data with caching."""
         try:
-            df = pd.read_parquet(_self.data_dir / "sample_plan.parquet")
-            return _self._validate_plan(df)
+            return _self.read_dataset('plan')
         except Exception as e:
             st.error(f"계획 데이터 로드 실패: {e}")
             return pd.DataFrame()
@@ -72,8 +254,7 @@ class DataAccessLayer:
     def load_traffic(_self) -> pd.DataFrame:
         """Load traffic data with caching."""
         try:
-            df = pd.read_parquet(_self.data_dir / "sample_traffic.parquet")
-            return _self._validate_traffic(df)
+            return _self.read_dataset('traffic')
         except Exception as e:
             st.error(f"트래픽 데이터 로드 실패: {e}")
             return pd.DataFrame()
@@ -82,12 +263,277 @@ class DataAccessLayer:
     def load_site_master(_self) -> pd.DataFrame:
         """Load site master data with caching."""
         try:
-            df = pd.read_parquet(_self.data_dir / "sample_site_master.parquet")
-            return _self._validate_site_master(df)
+            return _self.read_dataset('site_master')
         except Exception as e:
             st.error(f"국소 마스터 데이터 로드 실패: {e}")
             return pd.DataFrame()
     
+    def load_site_index(self, dataset: str) -> SiteIndex:
+        """
+        Get the per-site offset index of a site-level dataset.
+        
+        Args:
+            dataset: 'bills', 'actual' or 'traffic'
+        
+        Returns:
+            SiteIndex built once per data version
+        """
+        return self._build_site_index(dataset, self.get_data_version())
+    
+    @st.cache_resource(max_entries=6)
+    def _build_site_index(_self, dataset: str, data_version: str) -> SiteIndex:
+        """Build the site index (shared across sessions, not copied per call)."""
+        loaders = {
+            'bills': _self.load_bills,
+            'actual': _self.load_actual,
+            'traffic': _self.load_traffic
+        }
+        if dataset not in loaders:
+            raise ValueError(f"국소 인덱스를 지원하지 않는 데이터 유형: {dataset}")
+        index = SiteIndex(loaders[dataset]())
+        _mark_built(data_version, f'site_index:{dataset}')
+        return index
+    
+    def load_site_month_matrix(self) -> SiteMonthMatrix:
+        """
+        Get the dense site x month matrix store.
+        
+        Returns:
+            SiteMonthMatrix (kwh_bill, cost_bill, kwh_actual, gb_traffic,
+            contract_power_kw) built once per data version
+        """
+        return self._build_site_month_matrix(self.get_data_version())
+    
+    @st.cache_resource(max_entries=2)
+    def _build_site_month_matrix(_self, data_version: str) -> SiteMonthMatrix:
+        """Build the matrix store (shared across sessions, not copied per call)."""
+        matrix = build_fleet_matrix({
+            'bills': _self.load_bills(),
+            'actual': _self.load_actual(),
+            'traffic': _self.load_traffic(),
+            'site_master': _self.load_site_master()
+        })
+        _mark_built(data_version, 'site_month_matrix')
+        return matrix
+    
+    def load_plan_performance(self, site_ids: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Get monthly, YTD and run-rate plan performance for all months.
+        
+        Args:
+            site_ids: Restrict actuals and the allocated site plan to these
+                sites (whole fleet and fleet plan if None)
+        
+        Returns:
+            Plan performance table (see build_plan_performance), cached per
+            data version and site scope
+        """
+        site_key = None if site_ids is None else tuple(sorted(set(site_ids)))
+        return self._load_plan_performance(self.get_data_version(), site_key)
+    
+    @st.cache_data(ttl=3600, max_entries=32)
+    def _load_plan_performance(_self, data_version: str, site_ids: Optional[tuple]) -> pd.DataFrame:
+        """Build the plan performance table once per version and scope."""
+        # A site scope compares against its share of the fleet plan
+        plan_df = _self.load_plan() if site_ids is None else _self.load_derived_table('site_plan')
+        return build_plan_performance(_self.load_bills(), plan_df, site_ids=site_ids)
+    
+    def load_site_variance(self, baseline: str = 'prior_year') -> pd.DataFrame:
+        """
+        Get the per site-month price/volume decomposition.
+        
+        Args:
+            baseline: 'prior_year' or 'plan_price' (see build_site_variance)
+        
+        Returns:
+            Site-month decomposition, cached per data version and baseline
+        """
+        if baseline not in VARIANCE_BASELINES:
+            raise ValueError(f"지원하지 않는 기준: {baseline}")
+        return self._load_site_variance(self.get_data_version(), baseline)
+    
+    @st.cache_data(ttl=3600, max_entries=4)
+    def _load_site_variance(_self, data_version: str, baseline: str) -> pd.DataFrame:
+        """Build the decomposition once per version and baseline."""
+        return build_site_variance(_self.load_bills(), _self.load_site_master(), _self.load_plan(), baseline=baseline)
+    
+    def load_forecast_total(
+        self,
+        measure: str,
+        site_ids: Optional[Sequence[str]] = None,
+        model: str = 'holt_winters',
+        level: float = 0.9
+    ) -> pd.DataFrame:
+        """
+        Get the 12-month forecast of the summed kWh or cost of a site set.
+    
+        Args:
+            measure: 'kwh_bill' or 'cost_bill'
+            site_ids: Sites to sum (whole fleet if None)
+            model: 'holt_winters' or 'seasonal_naive'
+            level: Prediction interval level
+    
+        Returns:
+            yymm, forecast, lower, upper (see forecast_total), cached per
+            data version and scope
+        """
+        site_key = None if site_ids is None else tuple(sorted(set(site_ids)))
+        return self._load_forecast_total(self.get_data_version(), measure, site_key, model, level)
+    
+    @st.cache_data(ttl=3600, max_entries=32)
+    def _load_forecast_total(
+        _self,
+        data_version: str,
+        measure: str,
+        site_ids: Optional[tuple],
+        model: str,
+        level: float
+    ) -> pd.DataFrame:
+        """Fit the total series once per version, scope and model."""
+        return forecast_total(_self.load_site_month_matrix(), measure, site_ids, model=model, level=level)
+    
+    def load_savings_estimate(
+        self,
+        treated_site_ids: Sequence[str],
+        go_live_yymm: int,
+        window_months: int
+    ) -> Optional[SavingsEstimate]:
+        """
+        Get the difference-in-differences savings of a treated site set.
+        
+        Args:
+            treated_site_ids: Sites where the measure went live
+            go_live_yymm: First month of the post period
+            window_months: Months compared before and after go-live
+        
+        Returns:
+            SavingsEstimate (see estimate_savings), cached per data version,
+            site set, go-live month and window
+        """
+        site_key = tuple(sorted(set(treated_site_ids)))
+        return self._load_savings_estimate(self.get_data_version(), site_key, go_live_yymm, window_months)
+    
+    @st.cache_data(ttl=3600, max_entries=32)
+    def _load_savings_estimate(
+        _self,
+        data_version: str,
+        site_ids: tuple,
+        go_live_yymm: int,
+        window_months: int
+    ) -> Optional[SavingsEstimate]:
+        """Match controls and estimate once per version, site set and periods."""
+        return estimate_savings(
+            _self.load_site_month_matrix(),
+            _self.load_site_master(),
+            list(site_ids),
+            go_live_yymm,
+            pre_months=window_months,
+            post_months=window_months
+        )
+    
+    def load_savings_interval(
+        self,
+        treated_site_ids: Sequence[str],
+        go_live_yymm: int,
+        window_months: int,
+        confidence: float
+    ) -> Optional[SavingsInterval]:
+        """
+        Get the bootstrap interval of a savings estimate.
+        
+        Args:
+            treated_site_ids, go_live_yymm, window_months: See load_savings_estimate
+            confidence: Two-sided confidence level
+        
+        Returns:
+            SavingsInterval (see bootstrap_savings_ci), None without an
+            estimate; cached per data version, estimate inputs and level
+        """
+        site_key = tuple(sorted(set(treated_site_ids)))
+        return self._load_savings_interval(self.get_data_version(), site_key, go_live_yymm, window_months, confidence)
+    
+    @st.cache_data(ttl=3600, max_entries=32)
+    def _load_savings_interval(
+        _self,
+        data_version: str,
+        site_ids: tuple,
+        go_live_yymm: int,
+        window_months: int,
+        confidence: float
+    ) -> Optional[SavingsInterval]:
+        """Resample once per version, estimate inputs and level."""
+        estimate = _self._load_savings_estimate(data_version, site_ids, go_live_yymm, window_months)
+        if estimate is None:
+            return None
+        return bootstrap_savings_ci(estimate, n_resamples=DEFAULT_RESAMPLES, confidence=confidence)
+    
+    def load_derived_table(self, name: str) -> pd.DataFrame:
+        """
+        Get a derived page table for the current data version.
+        
+        Reads the artifact written by precompute_artifacts.py; when the
+        batch job has not run for this version yet, the table is built
+        in-process once and cached.
+        
+        Args:
+            name: Artifact name ('contract_optimization', 'anomalies',
+                'zero_usage', 'risk_frame', 'overcharge', 'rollups', 'efficiency',
+                'forecast', 'site_plan', 'tariff_recommendation')
+        
+        Returns:
+            Derived table (fleet-wide, unfiltered)
+        """
+        if name not in ARTIFACT_NAMES:
+            raise ValueError(f"지원하지 않는 파생 테이블: {name}")
+        return self._load_derived_table(name, self.get_data_version())
+    
+    def resident_caches(self) -> List[str]:
+        """
+        Derived caches of the current data version already built in this process.
+        
+        Lets diagnostics measure the caches without building the missing ones.
+        
+        Returns:
+            Cache names ('site_index:<dataset>', 'site_month_matrix', 'derived:<name>')
+        """
+        data_version = self.get_data_version()
+        now = time.time()
+        with _built_lock:
+            return [
+                name for (version, name), built_at in _built_caches.items()
+                if version == data_version
+                and (not name.startswith('derived:') or now - built_at < DERIVED_CACHE_TTL_SECONDS)
+            ]
+    
+    @st.cache_data(ttl=DERIVED_CACHE_TTL_SECONDS)
+    def _load_derived_table(_self, name: str, data_version: str) -> pd.DataFrame:
+        """Load the artifact, falling back to an in-process build."""
+        _mark_built(data_version, f'derived:{name}')
+        artifact = ArtifactStore(_self.artifacts_dir).load(name, data_version)
+        if artifact is not None:
+            return artifact
+        
+        bills_df = _self.load_bills()
+        actual_df = _self.load_actual()
+        site_master = _self.load_site_master()
+        builders = {
+            'contract_optimization': lambda: derived_tables.build_contract_optimization_table(bills_df, site_master),
+            'anomalies': lambda: derived_tables.build_anomaly_table(
+                bills_df, site_master, matrix=_self.load_site_month_matrix()),
+            'zero_usage': lambda: derived_tables.build_zero_usage_table(bills_df, site_master),
+            'risk_frame': lambda: derived_tables.build_risk_frame(
+                bills_df, actual_df, matrix=_self.load_site_month_matrix()),
+            'overcharge': lambda: derived_tables.build_overcharge_table(bills_df, actual_df, site_master),
+            'rollups': lambda: derived_tables.build_rollups(bills_df, actual_df),
+            'efficiency': lambda: derived_tables.build_efficiency_table(
+                bills_df, _self.load_traffic(), site_master),
+            'forecast': lambda: build_forecast_table(_self.load_site_month_matrix()),
+            'site_plan': lambda: allocate_plan(_self.load_plan(), _self.load_site_month_matrix()),
+            'tariff_recommendation': lambda: recommend_tariffs(
+                _self.load_site_month_matrix(), site_master, load_tariff_book())
+        }
+        return builders[name]()
+    
     def _validate_bills(self, df: pd.DataFrame) -> pd.DataFrame:
         """Validate bills schema."""
         required_cols = ['yymm', 'site_id', 'kwh_bill', 'cost_bill', 
@@ -160,6 +606,9 @@ class DataAccessLayer:
             output_path = self.data_dir / f"sample_{data_type}.parquet"
             df.to_parquet(output_path, index=False)
             
+            # Drop the stale cached copy of this dataset
+            getattr(self, f'load_{data_type}').clear()
+            
             st.success(f"{data_type} 데이터 업로드 완료: {len(df)} rows")
             return True
             
@@ -0,0 +1,338 @@
+"""Builders for the derived tables shown on the dashboard pages.
+
+Each builder works on whole datasets (fleet-wide) so the result can be
+materialized once per data version and filtered cheaply by the pages.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional
+from src.site_matrix import SiteMonthMatrix, build_site_month_matrix
+from src.fleet_jobs import run_fleet_job
+from src.contract_optimizer import MIN_SAVING_KRW
+from src.tariffs import load_tariff_book
+from src.perf import timed
+
+
+# Dimension columns kept on rollups (only those present are used)
+ROLLUP_DIMENSIONS = ['region', 'contract_type', 'contract_target', 'network_gen', 'rapa_type']
+
+# Actual-usage columns joined onto bills (avoids region_x/region_y suffixes)
+ACTUAL_MEASURE_COLUMNS = ['yymm', 'site_id', 'kwh_actual', 'cost_actual_est', 'data_source', 'confidence']
+
+
+def _site_info(site_master: pd.DataFrame, columns) -> pd.DataFrame:
+    """Select site master columns that exist (site_id first)."""
+    available = [col for col in columns if col in site_master.columns]
+    return site_master[['site_id'] + available].drop_duplicates('site_id')
+
+
+def build_contract_optimization_table(
+    bills_df: pd.DataFrame,
+    site_master: pd.DataFrame,
+    recent_months: int = 12,
+    n_workers: Optional[int] = 1,
+    max_exceedance_prob: Optional[float] = None
+) -> pd.DataFrame:
+    """
+    Cost-minimizing contract power for 정액 sites over the recent months.
+
+    Args:
+        bills_df: Bills dataframe
+        site_master: Site master dataframe
+        recent_months: Number of most recent months analysed (the demand distribution)
+        n_workers: Worker processes for the fleet job
+        max_exceedance_prob: Highest accepted probability of exceeding the contract
+
+    Returns:
+        site_id, region, site_type, current_contract_kw, recommended_kw,
+        savings_est, exceedance_prob, current_exceedance_prob, recommendation
+        (only sites with a material saving or a forced increase)
+    """
+    columns = ['site_id', 'region', 'site_type', 'current_contract_kw', 'recommended_kw',
+               'savings_est', 'exceedance_prob', 'current_exceedance_prob', 'recommendation']
+    if len(bills_df) == 0:
+        return pd.DataFrame(columns=columns)
+
+    months_sorted = sorted(bills_df['yymm'].unique())
+    recent = months_sorted[-recent_months:]
+    recent_bills = bills_df[
+        (bills_df['yymm'].isin(recent)) &
+        (bills_df['contract_type'] == '정액')
+    ]
+    if len(recent_bills) == 0:
+        return pd.DataFrame(columns=columns)
+
+    book = load_tariff_book()
+    tariff = book.tariff_for('정액')
+    matrix = build_site_month_matrix(recent_bills)
+    result = run_fleet_job(
+        'contract', matrix, n_workers=n_workers, recent_months=len(recent),
+        basic_rate_krw_per_kw=tariff.basic_charge_krw_per_kw,
+        penalty_rate_krw_per_kw=tariff.penalty_krw_per_kw,
+        demand_hours_per_month=book.demand_hours_per_month,
+        max_exceedance_prob=max_exceedance_prob
+    )
+    # Material savings, or increases forced by the exceedance limit (negative saving)
+    result = result[(result['savings_est'] > MIN_SAVING_KRW) | (result['savings_est'] < 0)]
+
+    current = result['current_contract_kw'].map('{:.1f}'.format)
+    recommended = result['recommended_kw'].map('{:.1f}'.format)
+    current_prob = (result['current_exceedance_prob'] * 100).map('{:.0f}'.format)
+    prob = (result['exceedance_prob'] * 100).map('{:.0f}'.format)
+    result = result.assign(recommendation=np.where(
+        result['recommended_kw'] < result['current_contract_kw'],
+        "계약전력 감설 권고: " + current + "kW → " + recommended + "kW",
+        "계약전력 증설 필요: " + current + "kW → " + recommended + "kW (초과 확률 " + current_prob + "% → " + prob + "%)"
+    ))
+
+    result = result.merge(_site_info(site_master, ['region', 'site_type']), on='site_id', how='inner')
+    return result[columns].reset_index(drop=True)
+
+
+def build_anomaly_table(
+    bills_df: pd.DataFrame,
+    site_master: pd.DataFrame,
+    matrix: Optional[SiteMonthMatrix] = None,
+    n_workers: Optional[int] = 1
+) -> pd.DataFrame:
+    """
+    Anomalous site-months for every month of the bills history.
+
+    Pages pick the rows of the month they display.
+
+    Args:
+        bills_df: Bills dataframe
+        site_master: Site master dataframe
+        matrix: Prebuilt site x month matrix (built from bills_df if None)
+        n_workers: Worker processes for the fleet job
+
+    Returns:
+        site_id, region, site_type, yymm, kwh_bill, rolling_mean, z_score
+    """
+    columns = ['site_id', 'region', 'site_type', 'yymm', 'kwh_bill', 'rolling_mean', 'z_score']
+    if matrix is None:
+        matrix = build_site_month_matrix(bills_df)
+    if len(matrix.months) == 0:
+        return pd.DataFrame(columns=columns)
+
+    anomalies = run_fleet_job('anomaly', matrix, n_workers=n_workers, all_months=True)
+    anomalies = anomalies[anomalies['is_anomaly']]
+
+    anomalies = anomalies.merge(_site_info(site_master, ['region', 'site_type']), on='site_id', how='inner')
+    return anomalies[columns].sort_values(['yymm', 'site_id'], kind='mergesort').reset_index(drop=True)
+
+
+def build_zero_usage_table(
+    bills_df: pd.DataFrame,
+    site_master: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Every zero-usage site-month with site details.
+
+    Pages count the rows inside the selected period and keep sites with
+    enough zero months (see zero_usage_summary).
+
+    Args:
+        bills_df: Bills dataframe
+        site_master: Site master dataframe
+
+    Returns:
+        site_id, yymm, site_name, region, site_type
+    """
+    zero = bills_df.loc[bills_df['kwh_bill'] == 0, ['site_id', 'yymm']]
+    zero = zero.merge(_site_info(site_master, ['site_name', 'region', 'site_type']), on='site_id', how='inner')
+    return zero.sort_values(['site_id', 'yymm'], kind='mergesort').reset_index(drop=True)
+
+
+@timed('derived:zero_usage_summary')
+def zero_usage_summary(
+    zero_usage_df: pd.DataFrame,
+    months: int = 3,
+    recent_periods: int = 6
+) -> pd.DataFrame:
+    """
+    Summarize zero-usage site-months into one row per problem site.
+
+    Args:
+        zero_usage_df: Output of build_zero_usage_table (already filtered)
+        months: Minimum number of zero months
+        recent_periods: Number of recent zero months listed
+
+    Returns:
+        site_id, site_name, region, site_type, zero_months, recent_zero_periods
+    """
+    columns = ['site_id', 'site_name', 'region', 'site_type', 'zero_months', 'recent_zero_periods']
+    if len(zero_usage_df) == 0:
+        return pd.DataFrame(columns=columns)
+
+    ordered = zero_usage_df.sort_values(['site_id', 'yymm'], ascending=[True, False], kind='mergesort')
+    grouped = ordered.groupby('site_id', sort=True, observed=True)
+    summary = grouped[['site_name', 'region', 'site_type']].first()
+    summary['zero_months'] = grouped.size()
+    summary['recent_zero_periods'] = grouped['yymm'].agg(
+        lambda s: ','.join(s.head(recent_periods).astype(str))
+    )
+    summary = summary[summary['zero_months'] >= months].reset_index()
+    return summary[columns]
+
+
+def build_risk_frame(
+    bills_df: pd.DataFrame,
+    actual_df: pd.DataFrame,
+    matrix: Optional[SiteMonthMatrix] = None,
+    n_workers: Optional[int] = 1
+) -> pd.DataFrame:
+    """
+    Bills joined with actual usage and scored for billing risk.
+
+    Scores follow calculate_risk_score, vectorized over all site-months.
+
+    Args:
+        bills_df: Bills dataframe
+        actual_df: Actual usage dataframe
+        matrix: Prebuilt site x month matrix (built from bills/actual if None)
+        n_workers: Worker processes for the fleet job
+
+    Returns:
+        Bills columns plus kwh_actual, cost_actual_est, data_source,
+        confidence, impact, likelihood, risk_score_raw, risk_score_display
+    """
+    actual_cols = [col for col in ACTUAL_MEASURE_COLUMNS if col in actual_df.columns]
+    merged = bills_df.merge(actual_df[actual_cols], on=['yymm', 'site_id'], how='left')
+    if len(merged) == 0:
+        return merged
+
+    if matrix is None:
+        matrix = build_site_month_matrix(bills_df, actual_df)
+    likelihood = run_fleet_job('risk_likelihood', matrix, n_workers=n_workers)
+
+    merged['impact'] = (merged['cost_actual_est'].fillna(merged['cost_bill']) - merged['cost_bill']).abs()
+    merged = merged.merge(likelihood, on='site_id', how='left')
+    merged['likelihood'] = merged['likelihood'].fillna(0.5)
+    merged['confidence'] = merged['confidence'].fillna(0.7)
+
+    raw_score = merged['impact'] * merged['likelihood'] * merged['confidence']
+    impact_normalized = np.minimum(merged['impact'] / 10_000_000, 1.0)
+    display_score = impact_normalized * merged['likelihood'] * merged['confidence'] * 100
+
+    merged['risk_score_raw'] = raw_score.round(2)
+    merged['risk_score_display'] = display_score.round(2)
+    return merged
+
+
+def build_overcharge_table(
+    bills_df: pd.DataFrame,
+    actual_df: pd.DataFrame,
+    site_master: pd.DataFrame,
+    threshold_pct: float = 5.0
+) -> pd.DataFrame:
+    """
+    Overcharged site-months (bill exceeds actual usage by more than the threshold).
+
+    Args:
+        bills_df: Bills dataframe
+        actual_df: Actual usage dataframe
+        site_master: Site master dataframe
+        threshold_pct: Error threshold (%) above which a bill is overcharged
+
+    Returns:
+        Bills columns plus kwh_actual, cost_actual_est, billing_error_pct,
+        site_name, site_type, voltage
+    """
+    actual_cols = [col for col in ACTUAL_MEASURE_COLUMNS if col in actual_df.columns]
+    merged = bills_df.merge(actual_df[actual_cols], on=['yymm', 'site_id'], how='inner')
+    merged = merged[(merged['kwh_actual'] > 0) & (merged['kwh_bill'] > 0)]
+
+    merged = merged.assign(
+        billing_error_pct=(merged['kwh_bill'] - merged['kwh_actual']) / merged['kwh_actual'] * 100
+    )
+    overcharged = merged[merged['billing_error_pct'] > threshold_pct]
+
+    info = _site_info(site_master, ['site_name', 'site_type', 'voltage'])
+    overcharged = overcharged.merge(info, on='site_id', how='left')
+    return overcharged.sort_values(['yymm', 'site_id'], kind='mergesort').reset_index(drop=True)
+
+
+def build_rollups(
+    bills_df: pd.DataFrame,
+    actual_df: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Monthly bill and actual totals per dimension combination.
+
+    Summing rows over any subset of the dimensions gives the rollup for
+    that subset.
+
+    Args:
+        bills_df: Bills dataframe
+        actual_df: Actual usage dataframe
+
+    Returns:
+        yymm, dimension columns, site_count, kwh_bill, cost_bill,
+        kwh_actual, cost_actual_est
+    """
+    dimensions = [col for col in ROLLUP_DIMENSIONS if col in bills_df.columns]
+    actual_cols = [col for col in ['yymm', 'site_id', 'kwh_actual', 'cost_actual_est'] if col in actual_df.columns]
+    merged = bills_df.merge(actual_df[actual_cols], on=['yymm', 'site_id'], how='left')
+
+    rollups = merged.groupby(['yymm'] + dimensions, dropna=False, observed=True).agg(
+        site_count=('site_id', 'nunique'),
+        kwh_bill=('kwh_bill', 'sum'),
+        cost_bill=('cost_bill', 'sum'),
+        kwh_actual=('kwh_actual', 'sum'),
+        cost_actual_est=('cost_actual_est', 'sum')
+    )
+    return rollups.reset_index()
+
+
+def _previous_yymm(yymm: pd.Series) -> pd.Series:
+    """Calendar month before each yymm (202501 -> 202412)."""
+    year, month = yymm // 100, yymm % 100
+    return np.where(month == 1, (year - 1) * 100 + 12, yymm - 1)
+
+
+def build_efficiency_table(
+    bills_df: pd.DataFrame,
+    traffic_df: pd.DataFrame,
+    site_master: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    kWh per GB for every site-month, ranked within peer groups.
+
+    Peers share month, network_gen and site_type. A higher percentile means
+    more kWh per GB than peers (less efficient). The month-over-month change
+    is only set when the site has the immediately preceding month.
+
+    Args:
+        bills_df: Bills dataframe
+        traffic_df: Traffic dataframe
+        site_master: Site master dataframe
+
+    Returns:
+        yymm, site_id, site info columns, kwh_bill, gb_traffic, kwh_per_gb,
+        peer_median_kwh_per_gb, peer_percentile, kwh_per_gb_mom_pct
+    """
+    usage = bills_df.groupby(['yymm', 'site_id'], as_index=False, observed=True)['kwh_bill'].sum()
+    traffic = traffic_df.groupby(['yymm', 'site_id'], as_index=False, observed=True)['gb_traffic'].sum()
+    merged = usage.merge(traffic, on=['yymm', 'site_id'], how='inner')
+    merged['yymm'] = merged['yymm'].astype(int)
+    merged = merged.merge(
+        _site_info(site_master, ['site_name', 'region', 'network_gen', 'site_type']),
+        on='site_id',
+        how='left'
+    )
+    merged['kwh_per_gb'] = merged['kwh_bill'] / merged['gb_traffic'].where(merged['gb_traffic'] > 0)
+
+    peer_keys = ['yymm'] + [col for col in ['network_gen', 'site_type'] if col in merged.columns]
+    peers = merged.groupby(peer_keys, dropna=False, observed=True)['kwh_per_gb']
+    merged['peer_median_kwh_per_gb'] = peers.transform('median')
+    merged['peer_percentile'] = peers.rank(pct=True) * 100
+
+    merged = merged.sort_values(['site_id', 'yymm']).reset_index(drop=True)
+    prev_value = merged.groupby('site_id', observed=True)['kwh_per_gb'].shift(1)
+    prev_month = merged.groupby('site_id', observed=True)['yymm'].shift(1)
+    consecutive = prev_month == _previous_yymm(merged['yymm'])
+    merged['kwh_per_gb_mom_pct'] = ((merged['kwh_per_gb'] / prev_value - 1) * 100).where(consecutive)
+
+    return merged.sort_values(['yymm', 'site_id']).reset_index(drop=True)
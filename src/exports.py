@@ -0,0 +1,277 @@
+"""Chunked table exports (CSV, Parquet, XLSX) with a per-version artifact cache."""
+
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional
+import pandas as pd
+from src.perf import timed
+
+
+# format -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    'csv': ('csv', 'text/csv'),
+    'parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'xlsx': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+
+# Rows serialized per chunk
+EXPORT_CHUNK_ROWS = 50_000
+
+# Exports stay in memory up to this size, then roll over to a temp file
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# Excel sheet limit (header row included)
+XLSX_MAX_ROWS = 1_048_576
+
+_XLSX_ENGINES = ['xlsxwriter', 'openpyxl']
+
+
+def _xlsx_engine() -> Optional[str]:
+    """First installed Excel writer engine (None if neither is installed)."""
+    for engine in _XLSX_ENGINES:
+        if importlib.util.find_spec(engine) is not None:
+            return engine
+    return None
+
+
+def available_formats() -> List[str]:
+    """Export formats usable in this environment (XLSX needs xlsxwriter or openpyxl)."""
+    return [fmt for fmt in EXPORT_FORMATS if fmt != 'xlsx' or _xlsx_engine() is not None]
+
+
+def iter_chunks(df: pd.DataFrame, chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Yield consecutive row slices of a frame (one empty slice for an empty frame)."""
+    if len(df) == 0:
+        yield df
+        return
+    for start in range(0, len(df), chunk_rows):
+        yield df.iloc[start:start + chunk_rows]
+
+
+def _write_csv(df: pd.DataFrame, file, chunk_rows: int) -> None:
+    # BOM once so Excel opens Korean text correctly
+    file.write('\ufeff'.encode('utf-8'))
+    for i, chunk in enumerate(iter_chunks(df, chunk_rows)):
+        file.write(chunk.to_csv(index=False, header=(i == 0)).encode('utf-8'))
+
+
+def _write_parquet(df: pd.DataFrame, file, chunk_rows: int) -> None:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in iter_chunks(df, chunk_rows):
+            if writer is None:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                writer = pq.ParquetWriter(file, table.schema)
+            else:
+                table = pa.Table.from_pandas(chunk, schema=writer.schema, preserve_index=False)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _xlsx_rows(chunk: pd.DataFrame) -> List[list]:
+    """Rows of a chunk as Python values (missing values as empty cells)."""
+    return chunk.astype(object).where(chunk.notna(), None).to_numpy().tolist()
+
+
+def _write_xlsx(df: pd.DataFrame, file, chunk_rows: int) -> None:
+    # Streaming workbooks (xlsxwriter constant_memory / openpyxl write_only)
+    # flush rows as they are appended; pd.ExcelWriter keeps every cell in memory
+    engine = _xlsx_engine()
+    if engine is None:
+        raise ImportError("XLSX 내보내기에는 xlsxwriter 또는 openpyxl 패키지가 필요합니다.")
+    if len(df) + 1 > XLSX_MAX_ROWS:
+        raise ValueError(f"XLSX는 최대 {XLSX_MAX_ROWS - 1:,}행까지 내보낼 수 있습니다: {len(df):,}행")
+
+    header = [str(col) for col in df.columns]
+    if engine == 'xlsxwriter':
+        import xlsxwriter
+
+        workbook = xlsxwriter.Workbook(file, {'constant_memory': True, 'default_date_format': 'yyyy-mm-dd'})
+        sheet = workbook.add_worksheet()
+        sheet.write_row(0, 0, header)
+        row = 1
+        for chunk in iter_chunks(df, chunk_rows):
+            for values in _xlsx_rows(chunk):
+                sheet.write_row(row, 0, values)
+                row += 1
+        workbook.close()
+    else:
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append(header)
+        for chunk in iter_chunks(df, chunk_rows):
+            for values in _xlsx_rows(chunk):
+                sheet.append(values)
+        workbook.save(file)
+
+
+_WRITERS = {
+    'csv': _write_csv,
+    'parquet': _write_parquet,
+    'xlsx': _write_xlsx,
+}
+
+
+@timed('export:write')
+def write_export(
+    df: pd.DataFrame,
+    fmt: str = 'csv',
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+    spool_max_bytes: int = SPOOL_MAX_BYTES
+) -> tempfile.SpooledTemporaryFile:
+    """
+    Serialize a table chunk by chunk into a spooled temp file.
+
+    Only one chunk is converted at a time, so the export never holds a
+    second full copy of the table as a string in memory; large exports
+    roll over to disk.
+
+    Args:
+        df: Table to export
+        fmt: 'csv', 'parquet' or 'xlsx'
+        chunk_rows: Rows serialized per chunk
+        spool_max_bytes: In-memory size before rolling over to disk
+
+    Returns:
+        Binary file positioned at the start
+    """
+    if fmt not in _WRITERS:
+        raise ValueError(f"지원하지 않는 내보내기 형식입니다: {fmt}")
+
+    file = tempfile.SpooledTemporaryFile(max_size=spool_max_bytes, mode='w+b')
+    try:
+        _WRITERS[fmt](df, file, chunk_rows)
+    except Exception:
+        file.close()
+        raise
+    file.seek(0)
+    return file
+
+
+def export_key(table_id: str, data_version: Optional[str], filters: Optional[Dict[str, Any]], fmt: str,
+               **view: Any) -> str:
+    """
+    Cache key of an export artifact.
+
+    Args:
+        table_id: Table identifier
+        data_version: Data version the table derives from
+        filters: Filters the table was built with
+        fmt: Export format
+        **view: Further view parameters (search text, sort, ...)
+
+    Returns:
+        Hex digest
+    """
+    payload = json.dumps(
+        [table_id, data_version, filters or {}, fmt, view],
+        sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class ExportCache:
+    """
+    LRU cache of finished exports.
+
+    Exports are spooled while they are written and kept as temp files on
+    disk, one per key; every request opens its own handle, so cached
+    exports hold no memory and reruns neither rebuild nor copy them.
+    Different keys build concurrently; concurrent requests for the same
+    key build it once.
+    """
+
+    def __init__(self, max_entries: int = 16):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, str]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._dir = tempfile.mkdtemp(prefix='exports-')
+        weakref.finalize(self, shutil.rmtree, self._dir, ignore_errors=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _open(self, key: str) -> Optional[BinaryIO]:
+        """Fresh handle on a cached export, marked as recently used (call with the lock held)."""
+        path = self._entries.get(key)
+        if path is None:
+            return None
+        self._entries.move_to_end(key)
+        return open(path, 'rb')
+
+    def _evict(self) -> None:
+        """Drop least recently used exports beyond max_entries (call with the lock held)."""
+        while len(self._entries) > self.max_entries:
+            _, path = self._entries.popitem(last=False)
+            try:
+                os.remove(path)
+            except OSError:
+                # Still open elsewhere (Windows); the directory goes at exit
+                pass
+
+    def get_stream(self, key: str, build: Callable[[], tempfile.SpooledTemporaryFile]) -> BinaryIO:
+        """
+        Stream over a cached export, building it on a miss.
+
+        The build runs outside the cache lock, under a lock of its own key.
+        The caller closes the returned stream.
+
+        Args:
+            key: Cache key (see export_key)
+            build: Returns the export file (see write_export)
+
+        Returns:
+            Binary file positioned at the start
+        """
+        with self._lock:
+            stream = self._open(key)
+            build_lock = self._build_locks.setdefault(key, threading.Lock()) if stream is None else None
+        if stream is not None:
+            return stream
+
+        with build_lock:
+            with self._lock:
+                # Another request may have built it while this one waited
+                stream = self._open(key)
+            if stream is not None:
+                return stream
+
+            path = os.path.join(self._dir, hashlib.sha1(key.encode('utf-8')).hexdigest())
+            try:
+                with build() as file, open(path, 'wb') as target:
+                    shutil.copyfileobj(file, target)
+            except Exception:
+                with self._lock:
+                    self._build_locks.pop(key, None)
+                raise
+            with self._lock:
+                self._entries[key] = path
+                self._build_locks.pop(key, None)
+                stream = self._open(key)
+                self._evict()
+        return stream
+
+    def clear(self) -> None:
+        """Drop all cached exports."""
+        with self._lock:
+            max_entries, self.max_entries = self.max_entries, 0
+            self._evict()
+            self.max_entries = max_entries
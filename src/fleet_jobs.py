@@ -0,0 +1,370 @@
+"""Multi-core execution layer for fleet-wide site-level analytics jobs."""
+
+import os
+import warnings
+import zlib
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+from src.site_matrix import SiteMonthMatrix, add_months
+from src.contract_optimizer import optimize_contract_power
+from src.tariffs import load_tariff_book
+
+
+# ---------------------------------------------------------------------------
+# Sharding
+# ---------------------------------------------------------------------------
+
+def site_shard(site_ids, n_shards: int) -> np.ndarray:
+    """
+    Assign sites to shards by a stable hash of the site ID.
+
+    CRC32 is used instead of hash() so the assignment is identical across
+    processes and runs.
+
+    Args:
+        site_ids: Site IDs
+        n_shards: Number of shards
+
+    Returns:
+        Shard number per site
+    """
+    return np.array(
+        [zlib.crc32(str(site_id).encode('utf-8')) % n_shards for site_id in site_ids],
+        dtype=np.int64
+    )
+
+
+# ---------------------------------------------------------------------------
+# Site-level kernels (vectorized over the rows of one shard)
+# ---------------------------------------------------------------------------
+
+def _last_observed(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Last non-NaN value per row and whether the row had any."""
+    observed = ~np.isnan(values)
+    has_any = observed.any(axis=1)
+    last_pos = values.shape[1] - 1 - np.argmax(observed[:, ::-1], axis=1)
+    last = values[np.arange(len(values)), last_pos]
+    return np.where(has_any, last, np.nan), has_any
+
+
+def anomaly_kernel(
+    arrays: Dict[str, np.ndarray],
+    site_ids: np.ndarray,
+    months: np.ndarray,
+    yymm: Optional[int] = None,
+    metric: str = 'kwh_bill',
+    window: int = 3,
+    threshold_std: float = 2.0,
+    min_history: int = 6,
+    all_months: bool = False
+) -> pd.DataFrame:
+    """
+    Rolling z-score per site (same rule as calculate_anomaly_score).
+
+    The window covers the site's last `window` observed months, so months
+    without a bill are skipped as they are by rolling() over bill rows.
+    Scores one month (yymm, default: the latest) or, with all_months, every
+    month of the matrix in one pass.
+
+    Returns:
+        One row per site and scored month with enough history: site_id,
+        yymm, kwh_bill, rolling_mean, z_score, is_anomaly
+    """
+    values = arrays[metric].astype(np.float64)
+    if all_months:
+        ts = np.arange(len(months))
+    elif yymm is None:
+        ts = np.arange(len(months))[-1:]
+    else:
+        ts = np.flatnonzero(months == int(yymm))[:1]
+    if len(ts) == 0:
+        return pd.DataFrame(columns=['site_id', 'yymm', metric, 'rolling_mean', 'z_score', 'is_anomaly'])
+
+    # Windows run over each site's last `window` observed months, like rolling()
+    # over its bill rows: observed values are packed to the left per site and
+    # sliced back from the scored month's rank (NaN before the first observation);
+    # nan-aware stats match pandas rolling(min_periods=1)
+    observed = ~np.isnan(values)
+    rank = np.cumsum(observed, axis=1) - 1
+    packed = np.full_like(values, np.nan)
+    site_obs, month_obs = np.nonzero(observed)
+    packed[site_obs, rank[site_obs, month_obs]] = values[site_obs, month_obs]
+    padded = np.concatenate([np.full((len(values), window - 1), np.nan), packed], axis=1)
+    end = np.maximum(rank[:, ts], 0) + window - 1
+    rows = np.arange(len(values))[:, None]
+    slices = [padded[rows, end - k] for k in range(window)]
+    count = sum((~np.isnan(part)).astype(np.float64) for part in slices)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rolling_mean = sum(np.nan_to_num(part) for part in slices) / count
+        squares = sum(np.nan_to_num((part - rolling_mean) ** 2) for part in slices)
+        rolling_std = np.sqrt(squares / (count - 1))
+    rolling_std = np.where(rolling_std == 0, 1.0, rolling_std)
+    current = values[:, ts]
+    z_score = (current - rolling_mean) / rolling_std
+
+    history = (~np.isnan(values)).sum(axis=1)
+    keep = (history >= min_history)[:, None] & ~np.isnan(current)
+    site_pos, t_pos = np.nonzero(keep)
+
+    return pd.DataFrame({
+        'site_id': site_ids[site_pos],
+        'yymm': months[ts][t_pos],
+        metric: current[site_pos, t_pos],
+        'rolling_mean': rolling_mean[site_pos, t_pos],
+        'z_score': z_score[site_pos, t_pos],
+        'is_anomaly': np.abs(np.nan_to_num(z_score[site_pos, t_pos])) > threshold_std
+    })
+
+
+def contract_kernel(
+    arrays: Dict[str, np.ndarray],
+    site_ids: np.ndarray,
+    months: np.ndarray,
+    recent_months: int = 12,
+    basic_rate_krw_per_kw: Optional[float] = None,
+    penalty_rate_krw_per_kw: Optional[float] = None,
+    demand_hours_per_month: Optional[float] = None,
+    max_exceedance_prob: Optional[float] = None,
+    min_months: int = 3
+) -> pd.DataFrame:
+    """
+    Cost-minimizing contract power per site (see optimize_contract_power)
+    over the most recent months.
+
+    Rates and demand hours default to the current 정액 tariff of the tariff book.
+
+    Returns:
+        One row per site with enough history: site_id, current_contract_kw,
+        recommended_kw, savings_est, exceedance_prob, current_exceedance_prob
+    """
+    if basic_rate_krw_per_kw is None or penalty_rate_krw_per_kw is None or demand_hours_per_month is None:
+        book = load_tariff_book()
+        tariff = book.tariff_for('정액')
+        basic_rate_krw_per_kw = tariff.basic_charge_krw_per_kw if basic_rate_krw_per_kw is None else basic_rate_krw_per_kw
+        penalty_rate_krw_per_kw = tariff.penalty_krw_per_kw if penalty_rate_krw_per_kw is None else penalty_rate_krw_per_kw
+        demand_hours_per_month = book.demand_hours_per_month if demand_hours_per_month is None else demand_hours_per_month
+
+    kwh = arrays['kwh_bill'][:, -recent_months:].astype(np.float64)
+    contract = arrays['contract_power_kw'][:, -recent_months:].astype(np.float64)
+
+    n_months = (~np.isnan(kwh)).sum(axis=1)
+    current_kw, _ = _last_observed(contract)
+    current_kw = np.nan_to_num(current_kw)
+
+    decision = optimize_contract_power(
+        kwh / demand_hours_per_month,
+        current_kw,
+        basic_rate_krw_per_kw,
+        penalty_rate_krw_per_kw,
+        max_exceedance_prob=max_exceedance_prob
+    )
+
+    keep = n_months >= min_months
+    return pd.DataFrame({
+        'site_id': site_ids[keep],
+        'current_contract_kw': current_kw[keep],
+        'recommended_kw': decision['recommended_kw'][keep],
+        'savings_est': decision['savings_est'][keep],
+        'exceedance_prob': decision['exceedance_prob'][keep],
+        'current_exceedance_prob': decision['current_exceedance_prob'][keep]
+    })
+
+
+def risk_likelihood_kernel(
+    arrays: Dict[str, np.ndarray],
+    site_ids: np.ndarray,
+    months: np.ndarray,
+    error_threshold_pct: float = 20.0
+) -> pd.DataFrame:
+    """
+    Share of billed months whose bill vs actual error exceeds the threshold.
+
+    Months without actual data count as zero error, as on the risk page.
+
+    Returns:
+        site_id, likelihood
+    """
+    bill = arrays['kwh_bill'].astype(np.float64)
+    actual = arrays['kwh_actual'].astype(np.float64)
+    billed = ~np.isnan(bill)
+    actual = np.where(np.isnan(actual), bill, actual)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        error_pct = np.abs((actual - bill) / np.where(bill == 0, np.nan, bill)) * 100
+    exceed = (np.nan_to_num(error_pct) > error_threshold_pct) & billed
+
+    n_billed = billed.sum(axis=1)
+    likelihood = np.where(n_billed > 0, exceed.sum(axis=1) / np.maximum(n_billed, 1), 0.5)
+
+    return pd.DataFrame({
+        'site_id': site_ids,
+        'likelihood': np.minimum(likelihood, 1.0)
+    })
+
+
+def seasonal_naive_kernel(
+    arrays: Dict[str, np.ndarray],
+    site_ids: np.ndarray,
+    months: np.ndarray,
+    horizon: int = 12,
+    metric: str = 'kwh_bill',
+    season_length: int = 12
+) -> pd.DataFrame:
+    """
+    Seasonal naive forecast: each future month repeats the same month of
+    the last observed season.
+
+    Returns:
+        Long format: site_id, horizon, yymm, forecast
+    """
+    values = arrays[metric]
+    if values.shape[1] < season_length:
+        return pd.DataFrame(columns=['site_id', 'horizon', 'yymm', 'forecast'])
+
+    last_season = values[:, -season_length:]
+    steps = np.arange(horizon)
+    forecast = last_season[:, steps % season_length]
+
+    future = [add_months(months[-1], h + 1) for h in steps]
+
+    return pd.DataFrame({
+        'site_id': np.repeat(site_ids, horizon),
+        'horizon': np.tile(steps + 1, len(site_ids)),
+        'yymm': np.tile(future, len(site_ids)),
+        'forecast': forecast.reshape(-1)
+    })
+
+
+# Job name -> (kernel, measures the kernel reads)
+FLEET_JOBS: Dict[str, Tuple[Callable[..., pd.DataFrame], List[str]]] = {
+    'anomaly': (anomaly_kernel, ['kwh_bill']),
+    'contract': (contract_kernel, ['kwh_bill', 'contract_power_kw']),
+    'risk_likelihood': (risk_likelihood_kernel, ['kwh_bill', 'kwh_actual']),
+    'forecast': (seasonal_naive_kernel, ['kwh_bill'])
+}
+
+
+# ---------------------------------------------------------------------------
+# Shared-memory inputs
+# ---------------------------------------------------------------------------
+
+class SharedArrays:
+    """
+    Context manager copying arrays into shared memory once.
+
+    Workers attach by name, so the arrays are not pickled per task.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+        self.spec: Dict[str, Tuple[str, tuple, str]] = {}
+        self._segments: List[shared_memory.SharedMemory] = []
+
+    def __enter__(self) -> Dict[str, Tuple[str, tuple, str]]:
+        for name, arr in self.arrays.items():
+            arr = np.ascontiguousarray(arr)
+            segment = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=segment.buf)[...] = arr
+            self._segments.append(segment)
+            self.spec[name] = (segment.name, arr.shape, arr.dtype.str)
+        return self.spec
+
+    def __exit__(self, exc_type, exc, tb):
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+
+
+def _run_shard(
+    job: str,
+    spec: Dict[str, Tuple[str, tuple, str]],
+    rows: np.ndarray,
+    site_ids: np.ndarray,
+    months: np.ndarray,
+    params: dict
+) -> pd.DataFrame:
+    """Worker entry point: attach shared inputs, run the kernel on a shard."""
+    kernel, _ = FLEET_JOBS[job]
+    segments = []
+    arrays = {}
+    try:
+        for name, (shm_name, shape, dtype) in spec.items():
+            # Pool workers share the parent's resource tracker, so attaching
+            # does not take ownership; the parent unlinks on exit
+            segment = shared_memory.SharedMemory(name=shm_name)
+            segments.append(segment)
+            arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=segment.buf)[rows]
+        return kernel(arrays, site_ids, months, **params)
+    finally:
+        arrays.clear()
+        for segment in segments:
+            segment.close()
+
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+
+def run_fleet_job(
+    job: str,
+    matrix: SiteMonthMatrix,
+    n_workers: Optional[int] = None,
+    site_ids: Optional[List[str]] = None,
+    **params
+) -> pd.DataFrame:
+    """
+    Run a site-level job over the fleet, sharded across processes.
+
+    Args:
+        job: Job name ('anomaly', 'contract', 'risk_likelihood', 'forecast')
+        matrix: Site x month matrix store
+        n_workers: Worker processes (default: CPU count, 1 = in-process)
+        site_ids: Restrict to these sites (default: all sites)
+        **params: Kernel parameters
+
+    Returns:
+        Merged results sorted by site_id (deterministic for any worker count)
+    """
+    if job not in FLEET_JOBS:
+        raise ValueError(f"지원하지 않는 작업: {job}")
+    kernel, measures = FLEET_JOBS[job]
+
+    if site_ids is None:
+        rows = np.arange(len(matrix.site_ids))
+    else:
+        rows = matrix.site_positions(site_ids)
+        rows = np.unique(rows[rows >= 0])
+
+    n_workers = n_workers or os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, len(rows)))
+
+    if n_workers == 1:
+        arrays = {name: matrix.measure(name)[rows] for name in measures}
+        results = [kernel(arrays, matrix.site_ids[rows], matrix.months, **params)]
+    else:
+        shard_of_row = site_shard(matrix.site_ids[rows], n_workers)
+        with SharedArrays({name: matrix.measure(name) for name in measures}) as spec:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                futures = []
+                for shard in range(n_workers):
+                    shard_rows = rows[shard_of_row == shard]
+                    if len(shard_rows) == 0:
+                        continue
+                    futures.append(executor.submit(
+                        _run_shard, job, spec, shard_rows,
+                        matrix.site_ids[shard_rows], matrix.months, params
+                    ))
+                results = [future.result() for future in futures]
+
+    results = [df for df in results if len(df) > 0]
+    if not results:
+        return kernel({name: matrix.measure(name)[:0] for name in measures},
+                      matrix.site_ids[:0], matrix.months, **params)
+
+    merged = pd.concat(results, ignore_index=True)
+    sort_cols = ['site_id'] + [c for c in ('horizon',) if c in merged.columns]
+    return merged.sort_values(sort_cols, kind='mergesort').reset_index(drop=True)
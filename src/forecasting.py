@@ -0,0 +1,291 @@
+"""Batched seasonal forecasting of every site on the site x month matrix."""
+
+import warnings
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from itertools import product
+from statistics import NormalDist
+from typing import Optional, Sequence
+from src.site_matrix import SiteMonthMatrix, add_months
+
+
+FORECAST_MODELS = ['holt_winters', 'seasonal_naive']
+
+FORECAST_MEASURES = ['kwh_bill', 'cost_bill']
+
+SEASON_LENGTH = 12
+MAX_HORIZON = 12
+DEFAULT_LEVEL = 0.9
+
+# Sites fitted together (bounds the sites x grid x season state arrays)
+FORECAST_CHUNK_SITES = 5_000
+
+# Holt-Winters grid in error-correction form: beta = alpha * beta_share,
+# gamma = (1 - alpha) * gamma_share, damped trend phi
+HW_GRID = np.array(list(product(
+    (0.1, 0.3, 0.5, 0.8),   # alpha
+    (0.0, 0.1, 0.3),        # beta_share
+    (0.05, 0.2, 0.5),       # gamma_share
+    (0.9, 0.98)             # phi
+)))
+
+
+def fill_gaps(values: np.ndarray, season: int = SEASON_LENGTH) -> np.ndarray:
+    """
+    Fill missing months so every row is a complete series.
+
+    Gaps take the same calendar month of the previous (or next) year,
+    then the row mean; rows without any observation stay NaN.
+
+    Args:
+        values: (series, months) array with NaN gaps
+        season: Season length in months
+
+    Returns:
+        float64 copy without interior gaps
+    """
+    y = values.astype(np.float64, copy=True)
+    for shift in (season, -season):
+        if abs(shift) >= y.shape[1]:
+            continue
+        shifted = np.full_like(y, np.nan)
+        if shift > 0:
+            shifted[:, shift:] = y[:, :-shift]
+        else:
+            shifted[:, :shift] = y[:, -shift:]
+        y = np.where(np.isnan(y), shifted, y)
+    with warnings.catch_warnings():
+        # All-NaN rows (sites without any observation) stay NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        row_mean = np.nanmean(y, axis=1)
+    return np.where(np.isnan(y), row_mean[:, None], y)
+
+
+def seasonal_naive(y: np.ndarray, horizon: int, season: int = SEASON_LENGTH):
+    """
+    Seasonal naive forecast: the same month of the last observed year.
+
+    Args:
+        y: (series, months) complete history
+        horizon: Months ahead
+        season: Season length in months
+
+    Returns:
+        (point, sd) arrays of shape (series, horizon)
+    """
+    n_months = y.shape[1]
+    period = min(season, n_months)
+    steps = np.arange(horizon)
+    point = y[:, n_months - period + steps % period]
+
+    residuals = y[:, period:] - y[:, :-period]
+    if residuals.shape[1] > 0:
+        sigma = np.sqrt(np.mean(residuals ** 2, axis=1))
+    else:
+        sigma = np.zeros(len(y))
+    # Error grows with the number of seasons ahead
+    sd = sigma[:, None] * np.sqrt(steps // period + 1)[None, :]
+    return point, sd
+
+
+def holt_winters(y: np.ndarray, horizon: int, season: int = SEASON_LENGTH):
+    """
+    Additive damped-trend Holt-Winters fitted to every series at once.
+
+    All HW_GRID parameter sets run side by side as an extra array axis;
+    each series keeps the set with the lowest one-step squared error
+    after the first season. Intervals use the ETS(A,Ad,A) forecast
+    variance sigma^2 * (1 + sum_j c_j^2), c_j = alpha + beta * phi_j +
+    gamma * [j is a whole season].
+
+    Args:
+        y: (series, months) complete history (at least two seasons)
+        horizon: Months ahead
+        season: Season length in months
+
+    Returns:
+        (point, sd) arrays of shape (series, horizon)
+    """
+    n_series, n_months = y.shape
+    alpha = HW_GRID[:, 0][None, :]
+    beta = alpha * HW_GRID[:, 1][None, :]
+    gamma = (1 - alpha) * HW_GRID[:, 2][None, :]
+    phi = HW_GRID[:, 3][None, :]
+    n_grid = len(HW_GRID)
+
+    first = y[:, :season].mean(axis=1)
+    second = y[:, season:2 * season].mean(axis=1)
+    level = np.repeat(first[:, None], n_grid, axis=1)
+    trend = np.repeat(((second - first) / season)[:, None], n_grid, axis=1)
+    seasonal = np.repeat((y[:, :season] - first[:, None])[:, None, :], n_grid, axis=1)
+    sse = np.zeros((n_series, n_grid))
+
+    for t in range(n_months):
+        s = seasonal[:, :, t % season]
+        error = y[:, t][:, None] - (level + phi * trend + s)
+        if t >= season:
+            sse += error ** 2
+        level = level + phi * trend + alpha * error
+        trend = phi * trend + beta * error
+        seasonal[:, :, t % season] = s + gamma * error
+
+    best = np.argmin(sse, axis=1)
+    rows = np.arange(n_series)
+    level, trend = level[rows, best], trend[rows, best]
+    seasonal = seasonal[rows, best]
+    a, b, g, p = alpha[0, best], beta[0, best], gamma[0, best], phi[0, best]
+    sigma = np.sqrt(sse[rows, best] / max(1, n_months - season))
+
+    steps = np.arange(1, horizon + 1)
+    # phi_h = phi + phi^2 + ... + phi^h per series
+    damped = np.cumsum(p[:, None] ** steps[None, :], axis=1)
+    season_pos = (n_months + steps - 1) % season
+    point = level[:, None] + damped * trend[:, None] + seasonal[:, season_pos]
+
+    c = a[:, None] + b[:, None] * damped + g[:, None] * (steps[None, :] % season == 0)
+    # Variance at h sums c_j^2 for j = 1 .. h-1
+    c_sq = np.cumsum(c ** 2, axis=1)
+    var_factor = 1 + np.hstack([np.zeros((n_series, 1)), c_sq[:, :-1]])
+    sd = sigma[:, None] * np.sqrt(var_factor)
+    return point, sd
+
+
+@dataclass
+class Forecast:
+    """Forecasts of several series over the same future months."""
+    months: np.ndarray
+    point: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    model: str
+    level: float
+
+
+def forecast_series(
+    values: np.ndarray,
+    last_yymm: int,
+    horizon: int = MAX_HORIZON,
+    model: str = 'holt_winters',
+    level: float = DEFAULT_LEVEL
+) -> Forecast:
+    """
+    Forecast many monthly series in chunks of FORECAST_CHUNK_SITES.
+
+    Gaps are filled first (see fill_gaps). Holt-Winters needs two full
+    seasons of history and falls back to seasonal naive otherwise.
+    Forecasts and bounds are clipped at zero (kWh and cost).
+
+    Args:
+        values: (series, months) history ending at last_yymm
+        last_yymm: Last history month
+        horizon: Months ahead (1-12)
+        model: 'holt_winters' or 'seasonal_naive'
+        level: Two-sided prediction interval level
+
+    Returns:
+        Forecast with (series, horizon) arrays
+    """
+    if model not in FORECAST_MODELS:
+        raise ValueError(f"지원하지 않는 예측 모형: {model}")
+    if not 1 <= horizon <= MAX_HORIZON:
+        raise ValueError(f"예측 기간은 1~{MAX_HORIZON}개월입니다: {horizon}")
+
+    fit = holt_winters if model == 'holt_winters' and values.shape[1] >= 2 * SEASON_LENGTH else seasonal_naive
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+
+    point = np.full((len(values), horizon), np.nan)
+    sd = np.full((len(values), horizon), np.nan)
+    for start in range(0, len(values), FORECAST_CHUNK_SITES):
+        y = fill_gaps(values[start:start + FORECAST_CHUNK_SITES])
+        valid = ~np.isnan(y).any(axis=1)
+        if valid.any():
+            chunk_point, chunk_sd = fit(y[valid], horizon)
+            point[start:start + len(y)][valid] = chunk_point
+            sd[start:start + len(y)][valid] = chunk_sd
+
+    return Forecast(
+        months=np.array([add_months(last_yymm, h) for h in range(1, horizon + 1)]),
+        point=np.maximum(point, 0),
+        lower=np.maximum(point - z * sd, 0),
+        upper=np.maximum(point + z * sd, 0),
+        model=model,
+        level=level
+    )
+
+
+def forecast_total(
+    matrix: SiteMonthMatrix,
+    measure: str,
+    site_ids: Optional[Sequence[str]] = None,
+    horizon: int = MAX_HORIZON,
+    model: str = 'holt_winters',
+    level: float = DEFAULT_LEVEL
+) -> pd.DataFrame:
+    """
+    Forecast the summed series of a site set.
+
+    The total is forecast as one series, so its interval reflects how the
+    sites move together rather than assuming independent site errors.
+
+    Args:
+        matrix: Site x month matrix store
+        measure: 'kwh_bill' or 'cost_bill'
+        site_ids: Sites to sum (all if None)
+        horizon: Months ahead
+        model: Forecast model
+        level: Prediction interval level
+
+    Returns:
+        yymm, forecast, lower, upper
+    """
+    values = matrix.measure(measure)
+    if site_ids is not None:
+        positions = matrix.site_positions(site_ids)
+        values = values[positions[positions >= 0]]
+    observed = ~np.isnan(values)
+    total = np.where(observed.any(axis=0), np.nansum(values, axis=0, dtype=np.float64), np.nan)
+
+    result = forecast_series(total[None, :], int(matrix.months[-1]), horizon, model, level)
+    return pd.DataFrame({
+        'yymm': result.months,
+        'forecast': result.point[0],
+        'lower': result.lower[0],
+        'upper': result.upper[0]
+    })
+
+
+def build_forecast_table(
+    matrix: SiteMonthMatrix,
+    horizon: int = MAX_HORIZON,
+    level: float = DEFAULT_LEVEL
+) -> pd.DataFrame:
+    """
+    Site forecasts of every model and measure (the 'forecast' artifact).
+
+    Args:
+        matrix: Site x month matrix store
+        horizon: Months ahead
+        level: Prediction interval level
+
+    Returns:
+        model, site_id, yymm, horizon, then forecast/lower/upper per
+        measure (kwh_bill_forecast, kwh_bill_lower, ...)
+    """
+    last_yymm = int(matrix.months[-1])
+    n_sites = len(matrix.site_ids)
+    frames = []
+    for model in FORECAST_MODELS:
+        frame = pd.DataFrame({
+            'model': model,
+            'site_id': np.repeat(matrix.site_ids, horizon),
+            'yymm': np.tile([add_months(last_yymm, h) for h in range(1, horizon + 1)], n_sites),
+            'horizon': np.tile(np.arange(1, horizon + 1), n_sites)
+        })
+        for measure in FORECAST_MEASURES:
+            result = forecast_series(matrix.measure(measure), last_yymm, horizon, model, level)
+            frame[f'{measure}_forecast'] = result.point.ravel().astype(np.float32)
+            frame[f'{measure}_lower'] = result.lower.ravel().astype(np.float32)
+            frame[f'{measure}_upper'] = result.upper.ravel().astype(np.float32)
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
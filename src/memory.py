@@ -0,0 +1,185 @@
+"""Memory accounting for loaded datasets, derived caches and session state."""
+
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+from src.site_index import SiteIndex
+from src.site_matrix import SiteMonthMatrix
+from src.precompute import ARTIFACT_NAMES
+
+
+def deep_size_bytes(obj: Any, _seen: Optional[set] = None) -> int:
+    """
+    Approximate deep memory size of an object.
+
+    DataFrames use memory_usage(deep=True), arrays their buffer size, and
+    containers are walked recursively (shared objects counted once).
+
+    Args:
+        obj: Object to measure
+
+    Returns:
+        Size in bytes
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True, index=True).sum())
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        size = obj.nbytes
+        if obj.dtype == object:
+            size += sum(deep_size_bytes(item, _seen) for item in obj.ravel())
+        return int(size)
+    if isinstance(obj, SiteIndex):
+        return deep_size_bytes(obj.frame, _seen) + deep_size_bytes(obj._offsets, _seen) + \
+            obj.site_ids.nbytes + obj.starts.nbytes + obj.stops.nbytes
+    if isinstance(obj, SiteMonthMatrix):
+        arrays = list(obj.values.values()) + list(obj.observed.values())
+        return int(sum(arr.nbytes for arr in arrays)) + deep_size_bytes(obj.site_ids, _seen) + obj.months.nbytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            deep_size_bytes(k, _seen) + deep_size_bytes(v, _seen) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return sys.getsizeof(obj) + sum(deep_size_bytes(item, _seen) for item in obj)
+    return sys.getsizeof(obj)
+
+
+def process_rss_bytes() -> Optional[int]:
+    """
+    Resident set size of the current process.
+
+    Reads /proc on Linux; elsewhere falls back to the peak RSS reported by
+    the resource module (None if unavailable).
+    """
+    status = Path("/proc/self/status")
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS reports bytes, Linux kilobytes
+        return int(peak if sys.platform == 'darwin' else peak * 1024)
+    except (ImportError, AttributeError):
+        return None
+
+
+def format_bytes(n: Optional[float]) -> str:
+    """Human-readable byte count (e.g. '12.3 MB')."""
+    if n is None:
+        return "-"
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if abs(n) < 1024 or unit == 'GB':
+            return f"{n:,.0f} {unit}" if unit == 'B' else f"{n:,.1f} {unit}"
+        n /= 1024
+
+
+def _report(entries: Dict[str, Any], category: str) -> pd.DataFrame:
+    """Build a report frame from name -> object."""
+    rows = []
+    for name, obj in entries.items():
+        if hasattr(obj, 'shape') and len(obj.shape) > 0:
+            n_rows = int(obj.shape[0])
+        elif hasattr(obj, '__len__'):
+            n_rows = len(obj)
+        else:
+            n_rows = None
+        rows.append({
+            'category': category,
+            'name': name,
+            'type': type(obj).__name__,
+            'rows': n_rows,
+            'bytes': deep_size_bytes(obj)
+        })
+    return pd.DataFrame(rows, columns=['category', 'name', 'type', 'rows', 'bytes'])
+
+
+def dataset_memory_report(dal) -> pd.DataFrame:
+    """
+    Deep memory of the five cached datasets.
+
+    Args:
+        dal: DataAccessLayer instance
+
+    Returns:
+        category, name, type, rows, bytes
+    """
+    datasets = {
+        name: getattr(dal, f'load_{name}')()
+        for name in ['bills', 'actual', 'plan', 'traffic', 'site_master']
+    }
+    return _report(datasets, 'dataset')
+
+
+def derived_memory_report(dal) -> pd.DataFrame:
+    """
+    Deep memory of the derived structures cached for the current data version.
+
+    Only caches already built are measured; the others are listed with
+    type 'not loaded' and no size instead of being built for the report.
+
+    Args:
+        dal: DataAccessLayer instance
+
+    Returns:
+        category, name, type, rows, bytes
+    """
+    loaders = {f'site_index:{name}': (lambda name=name: dal.load_site_index(name))
+               for name in ['bills', 'actual', 'traffic']}
+    loaders['site_month_matrix'] = dal.load_site_month_matrix
+    for name in ARTIFACT_NAMES:
+        loaders[f'derived:{name}'] = lambda name=name: dal.load_derived_table(name)
+
+    resident = set(dal.resident_caches())
+    report = _report({name: load() for name, load in loaders.items() if name in resident}, 'derived')
+    missing = pd.DataFrame([
+        {'category': 'derived', 'name': name, 'type': 'not loaded', 'rows': None, 'bytes': None}
+        for name in loaders if name not in resident
+    ], columns=report.columns)
+    parts = [part for part in [report, missing] if len(part) > 0]
+    return pd.concat(parts, ignore_index=True) if parts else report
+
+
+def session_state_report(session_state: Mapping) -> pd.DataFrame:
+    """
+    Deep memory per session-state key.
+
+    Args:
+        session_state: st.session_state (or any mapping)
+
+    Returns:
+        category, name, type, rows, bytes (largest first)
+    """
+    entries = {str(key): session_state[key] for key in list(session_state.keys())}
+    report = _report(entries, 'session_state')
+    return report.sort_values('bytes', ascending=False).reset_index(drop=True)
+
+
+def memory_report(dal, session_state: Optional[Mapping] = None) -> pd.DataFrame:
+    """
+    Combined memory report.
+
+    Args:
+        dal: DataAccessLayer instance
+        session_state: Session state to include (optional)
+
+    Returns:
+        category, name, type, rows, bytes; a final 'process' row holds RSS
+    """
+    parts = [dataset_memory_report(dal), derived_memory_report(dal)]
+    if session_state is not None:
+        parts.append(session_state_report(session_state))
+    parts.append(pd.DataFrame([{
+        'category': 'process', 'name': 'rss', 'type': 'process', 'rows': None, 'bytes': process_rss_bytes()
+    }]))
+    return pd.concat(parts, ignore_index=True)
@@ -0,0 +1,214 @@
+"""Lightweight per-rerun timing instrumentation."""
+
+import contextvars
+import functools
+import json
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+PERF_LOG_MAX_BYTES = 5 * 1024 * 1024
+PERF_LOG_BACKUPS = 3
+
+_active_run: contextvars.ContextVar = contextvars.ContextVar('pylon_perf_run', default=None)
+_loggers: Dict[str, logging.Logger] = {}
+
+
+def count_rows(value: Any) -> Optional[int]:
+    """Row count of a dataframe-like result (None if not sized)."""
+    if hasattr(value, 'shape') and len(getattr(value, 'shape', ())) > 0:
+        return int(value.shape[0])
+    if isinstance(value, (list, tuple, dict)):
+        return len(value)
+    return None
+
+
+class PerfSection:
+    """Handle of one timed section; set `rows` inside the block."""
+
+    def __init__(self, name: str, rows: Optional[int] = None):
+        self.name = name
+        self.rows = rows
+        self.seconds = 0.0
+
+
+class PerfRun:
+    """
+    Timings of one page rerun.
+
+    Sections may nest; each is recorded with its own elapsed time, so the
+    total of a page is the run's elapsed time, not the sum of sections.
+    """
+
+    def __init__(self, page: str):
+        """
+        Start a run.
+
+        Args:
+            page: Page name
+        """
+        self.page = page
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self.sections: List[Dict] = []
+
+    @contextmanager
+    def section(self, name: str, rows: Optional[int] = None):
+        """
+        Time a block.
+
+        Args:
+            name: Section name (e.g. 'load:bills', 'chart:risk_heatmap')
+            rows: Row count, if known up front
+
+        Yields:
+            PerfSection whose `rows` may be set inside the block
+        """
+        handle = PerfSection(name, rows)
+        start = time.perf_counter()
+        try:
+            yield handle
+        finally:
+            handle.seconds = time.perf_counter() - start
+            self.sections.append({
+                'section': handle.name,
+                'seconds': round(handle.seconds, 4),
+                'rows': handle.rows if isinstance(handle.rows, int) else count_rows(handle.rows)
+            })
+
+    def call(self, name: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Time a single call, taking the row count from its result.
+
+        Args:
+            name: Section name
+            func: Function to call
+            *args, **kwargs: Arguments passed to func
+
+        Returns:
+            Result of func
+        """
+        with self.section(name) as handle:
+            result = func(*args, **kwargs)
+            handle.rows = count_rows(result)
+        return result
+
+    def elapsed(self) -> float:
+        """Seconds since the run started."""
+        return time.perf_counter() - self._start
+
+    def to_record(self) -> Dict:
+        """JSON-serializable summary of the run."""
+        return {
+            'timestamp': self.started_at.isoformat(),
+            'page': self.page,
+            'total_seconds': round(self.elapsed(), 4),
+            'sections': self.sections
+        }
+
+
+def start_run(page: str) -> PerfRun:
+    """
+    Start a run and make it the active one for `timed` functions.
+
+    Args:
+        page: Page name
+
+    Returns:
+        New PerfRun
+    """
+    run = PerfRun(page)
+    _active_run.set(run)
+    return run
+
+
+def active_run() -> Optional[PerfRun]:
+    """Run started by the current script thread (None outside a page)."""
+    return _active_run.get()
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """
+    Decorator recording calls into the active run.
+
+    Row counts are taken from the return value when it is a dataframe.
+    Without an active run the function is called unchanged.
+
+    Args:
+        name: Section name (default: function name)
+    """
+    def decorator(func: Callable) -> Callable:
+        section_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            run = active_run()
+            if run is None:
+                return func(*args, **kwargs)
+            return run.call(section_name, func, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _get_logger(log_path: Path) -> logging.Logger:
+    """Rotating JSONL logger for a log file (one per path)."""
+    key = str(Path(log_path).resolve())
+    if key not in _loggers:
+        Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+        logger = logging.getLogger(f"pylon.perf.{len(_loggers)}")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        handler = RotatingFileHandler(
+            log_path, maxBytes=PERF_LOG_MAX_BYTES, backupCount=PERF_LOG_BACKUPS, encoding='utf-8'
+        )
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        _loggers[key] = logger
+    return _loggers[key]
+
+
+def write_run(run: PerfRun, log_path: Path) -> Dict:
+    """
+    Append a run to the rotating JSONL log.
+
+    Args:
+        run: Finished run
+        log_path: Log file path
+
+    Returns:
+        Record written
+    """
+    record = run.to_record()
+    _get_logger(log_path).info(json.dumps(record, ensure_ascii=False))
+    return record
+
+
+def read_runs(log_path: Path, page: Optional[str] = None, limit: int = 200) -> List[Dict]:
+    """
+    Read the most recent runs from the current log file.
+
+    Args:
+        log_path: Log file path
+        page: Only runs of this page
+        limit: Maximum number of runs
+
+    Returns:
+        Records, oldest first
+    """
+    if not Path(log_path).exists():
+        return []
+    records = []
+    with open(log_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if page is None or record.get('page') == page:
+                records.append(record)
+    return records[-limit:]
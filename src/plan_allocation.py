@@ -0,0 +1,135 @@
+"""Allocation of the fleet-level plan to a site-month plan table."""
+
+import numpy as np
+import pandas as pd
+from typing import Dict
+from src.site_matrix import SiteMonthMatrix
+from src.forecasting import MAX_HORIZON, fill_gaps, forecast_series
+
+
+ALLOCATION_METHODS = ['historical_share', 'forecast_share']
+
+# plan column -> matrix measure its shares are taken from
+ALLOCATION_MEASURES = {
+    'kwh_plan': 'kwh_bill',
+    'cost_plan': 'cost_bill'
+}
+
+
+def reference_columns(matrix_months: np.ndarray, plan_months: np.ndarray) -> np.ndarray:
+    """
+    Matrix column whose site mix allocates each plan month.
+
+    The latest month with the same calendar month in an earlier year than
+    the plan month (last year's mix); plan months without an earlier year
+    use the earliest same calendar month available. -1 if the matrix has
+    no such calendar month.
+
+    Args:
+        matrix_months: YYYYMM of the matrix columns
+        plan_months: YYYYMM of the plan months
+
+    Returns:
+        Column index per plan month
+    """
+    matrix_months = np.asarray(matrix_months, dtype=np.int64)
+    refs = np.full(len(plan_months), -1, dtype=np.int64)
+    for j, yymm in enumerate(np.asarray(plan_months, dtype=np.int64)):
+        same_month = np.flatnonzero(matrix_months % 100 == yymm % 100)
+        if len(same_month) == 0:
+            continue
+        earlier = same_month[matrix_months[same_month] // 100 < yymm // 100]
+        refs[j] = earlier[-1] if len(earlier) > 0 else same_month[0]
+    return refs
+
+
+def allocation_weights(
+    matrix: SiteMonthMatrix,
+    measure: str,
+    plan_months: np.ndarray,
+    method: str = 'historical_share'
+) -> np.ndarray:
+    """
+    Non-negative site weights of every plan month.
+
+    Args:
+        matrix: Site x month matrix store
+        measure: Matrix measure the weights come from
+        plan_months: YYYYMM of the plan months
+        method: 'historical_share' (last year's same-month mix) or
+            'forecast_share' (site forecasts for months after the data,
+            historical share otherwise)
+
+    Returns:
+        (sites, plan months) weights; NaN-free
+    """
+    if method not in ALLOCATION_METHODS:
+        raise ValueError(f"지원하지 않는 배분 방식: {method}")
+
+    filled = fill_gaps(matrix.measure(measure))
+    filled = np.nan_to_num(np.maximum(filled, 0), nan=0.0)
+    refs = reference_columns(matrix.months, plan_months)
+
+    weights = np.where(
+        refs[None, :] >= 0,
+        filled[:, np.maximum(refs, 0)],
+        filled.mean(axis=1)[:, None]
+    )
+
+    if method == 'forecast_share' and len(matrix.months) > 0:
+        last_yymm = int(matrix.months[-1])
+        forecast = forecast_series(matrix.measure(measure), last_yymm, MAX_HORIZON)
+        positions = {int(m): h for h, m in enumerate(forecast.months)}
+        for j, yymm in enumerate(np.asarray(plan_months, dtype=np.int64)):
+            h = positions.get(int(yymm))
+            if h is not None:
+                weights[:, j] = np.nan_to_num(forecast.point[:, h], nan=0.0)
+    return weights
+
+
+def allocate_plan(
+    plan_df: pd.DataFrame,
+    matrix: SiteMonthMatrix,
+    method: str = 'historical_share'
+) -> pd.DataFrame:
+    """
+    Disaggregate fleet plan rows to sites.
+
+    Each fleet month (rows with site_id missing) is split across sites in
+    proportion to the allocation weights of its measure, separately for
+    kWh and cost, so every month's site plans sum back to the fleet plan.
+    A month without any site weight is split evenly. Plan rows that
+    already name a site are kept as they are.
+
+    Args:
+        plan_df: Plan (yymm, site_id, kwh_plan, cost_plan)
+        matrix: Site x month matrix store (kwh_bill, cost_bill)
+        method: See allocation_weights
+
+    Returns:
+        Site-month plan: yymm, site_id, kwh_plan, cost_plan
+    """
+    columns = ['yymm', 'site_id'] + list(ALLOCATION_MEASURES)
+    is_fleet = plan_df['site_id'].isna() if 'site_id' in plan_df.columns else pd.Series(True, index=plan_df.index)
+    fleet = plan_df[is_fleet].groupby('yymm')[list(ALLOCATION_MEASURES)].sum()
+    site_rows = plan_df.loc[~is_fleet, columns]
+
+    plan_months = fleet.index.astype(np.int64).to_numpy()
+    n_sites = len(matrix.site_ids)
+    allocated: Dict[str, np.ndarray] = {}
+    for plan_col, measure in ALLOCATION_MEASURES.items():
+        weights = allocation_weights(matrix, measure, plan_months, method)
+        totals = weights.sum(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            shares = np.where(totals > 0, weights / totals, 1.0 / max(1, n_sites))
+        allocated[plan_col] = (shares * fleet[plan_col].to_numpy()[None, :]).ravel(order='F')
+
+    site_plan = pd.DataFrame({
+        'yymm': np.repeat(plan_months, n_sites),
+        'site_id': np.tile(matrix.site_ids, len(plan_months)),
+        **allocated
+    })
+    if len(site_rows) > 0:
+        site_plan = pd.concat([site_plan, site_rows], ignore_index=True)
+        site_plan = site_plan.groupby(['yymm', 'site_id'], as_index=False, observed=True)[list(ALLOCATION_MEASURES)].sum()
+    return site_plan
@@ -0,0 +1,143 @@
+"""Vectorized plan-vs-actual engine (monthly, YTD and full-year run-rate)."""
+
+import numpy as np
+import pandas as pd
+from typing import Optional, Sequence
+
+
+# measure -> (actual column in bills, plan column)
+PLAN_MEASURES = {
+    'kwh': ('kwh_bill', 'kwh_plan'),
+    'cost': ('cost_bill', 'cost_plan'),
+}
+
+# Months of recent achievement applied to the remaining plan in the run-rate
+RUNRATE_WINDOW = 3
+
+
+def _ratio_pct(numerator: pd.Series, plan: pd.Series) -> pd.Series:
+    """numerator / plan * 100, 0 where the plan is 0 (as calculate_plan_variance), NaN without a plan."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pct = numerator / plan * 100
+    return pct.mask(plan == 0, 0.0)
+
+
+def build_plan_performance(
+    bills_df: pd.DataFrame,
+    plan_df: pd.DataFrame,
+    site_ids: Optional[Sequence[str]] = None
+) -> pd.DataFrame:
+    """
+    Plan performance of every month in one table.
+
+    For each measure (kwh, cost) the table holds:
+    - monthly: {m}_actual, {m}_plan, {m}_variance, {m}_variance_pct, {m}_achievement
+    - year to date: {m}_actual_ytd, {m}_plan_ytd, {m}_ytd_variance, {m}_ytd_variance_pct,
+      {m}_ytd_achievement
+    - full-year run-rate: {m}_plan_fy, {m}_runrate, {m}_runrate_variance, {m}_runrate_achievement
+
+    The run-rate adds the remaining months' plan, scaled by the achievement
+    of the last RUNRATE_WINDOW months, to the YTD actual (keeps the plan's
+    seasonality); without a plan it extrapolates the YTD monthly mean. The
+    full-year plan counts only the months the plan covers.
+    Percentages follow calculate_plan_variance (0 when the plan is 0).
+
+    Args:
+        bills_df: Bills (yymm, site_id, kwh_bill, cost_bill)
+        plan_df: Plan (yymm, kwh_plan, cost_plan); fleet-level rows, or the
+            site-month plan of allocate_plan
+        site_ids: Restrict actuals (and a site-month plan) to these sites
+            (all sites if None)
+
+    Returns:
+        One row per month (yymm ascending) with year, month_of_year and the columns above
+    """
+    if site_ids is not None:
+        bills_df = bills_df[bills_df['site_id'].isin(site_ids)]
+        # A site-level plan (see allocate_plan) follows the same scope
+        if 'site_id' in plan_df.columns and plan_df['site_id'].notna().all():
+            plan_df = plan_df[plan_df['site_id'].isin(site_ids)]
+
+    actual_cols = [actual for actual, _ in PLAN_MEASURES.values()]
+    plan_cols = [plan for _, plan in PLAN_MEASURES.values()]
+    monthly_actual = bills_df.groupby('yymm')[actual_cols].sum()
+    monthly_plan = plan_df.groupby('yymm')[plan_cols].sum()
+
+    table = monthly_actual.join(monthly_plan, how='outer').sort_index()
+    table.index = table.index.astype(int)
+    table = table.reset_index().rename(columns={'index': 'yymm'})
+    table['year'] = table['yymm'] // 100
+    table['month_of_year'] = table['yymm'] % 100
+
+    by_year = table.groupby('year')
+    months_elapsed = by_year.cumcount() + 1
+
+    for measure, (actual_col, plan_col) in PLAN_MEASURES.items():
+        actual = table.pop(actual_col)
+        plan = table.pop(plan_col)
+        table[f'{measure}_actual'] = actual
+        table[f'{measure}_plan'] = plan
+        table[f'{measure}_variance'] = actual - plan
+        table[f'{measure}_variance_pct'] = _ratio_pct(actual - plan, plan)
+        table[f'{measure}_achievement'] = _ratio_pct(actual, plan)
+
+        # Cumulative sums within each calendar year (months without actuals add 0)
+        actual_ytd = actual.fillna(0).groupby(table['year']).cumsum()
+        plan_ytd = plan.groupby(table['year']).cumsum()
+        table[f'{measure}_actual_ytd'] = actual_ytd
+        table[f'{measure}_plan_ytd'] = plan_ytd
+        table[f'{measure}_ytd_variance'] = actual_ytd - plan_ytd
+        table[f'{measure}_ytd_variance_pct'] = _ratio_pct(actual_ytd - plan_ytd, plan_ytd)
+        table[f'{measure}_ytd_achievement'] = _ratio_pct(actual_ytd, plan_ytd)
+
+        plan_fy = plan.groupby(table['year']).transform(lambda s: s.sum(min_count=1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            recent_rate = (actual.rolling(RUNRATE_WINDOW, min_periods=1).sum() /
+                           plan.rolling(RUNRATE_WINDOW, min_periods=1).sum())
+        projected = actual_ytd + (plan_fy - plan_ytd) * recent_rate
+        linear = actual_ytd / months_elapsed * 12
+        runrate = projected.where((plan_ytd > 0) & np.isfinite(recent_rate), linear)
+        table[f'{measure}_plan_fy'] = plan_fy
+        table[f'{measure}_runrate'] = runrate
+        table[f'{measure}_runrate_variance'] = runrate - plan_fy
+        table[f'{measure}_runrate_achievement'] = _ratio_pct(runrate, plan_fy)
+
+    return table
+
+
+def summarize_plan_performance(table: pd.DataFrame, yymm_list: Optional[Sequence] = None) -> dict:
+    """
+    Period totals and latest YTD/run-rate figures from a plan performance table.
+
+    Args:
+        table: Output of build_plan_performance
+        yymm_list: Months of the period (all months if empty)
+
+    Returns:
+        Dict per measure ('kwh', 'cost') with actual, plan, variance,
+        variance_pct, achievement over the period, plus ytd_achievement,
+        runrate, plan_fy and runrate_achievement as of the last month of the period
+        (empty dict if no month matches)
+    """
+    if yymm_list:
+        table = table[table['yymm'].isin([int(ym) for ym in yymm_list])]
+    if len(table) == 0:
+        return {}
+
+    latest = table.iloc[-1]
+    summary = {}
+    for measure in PLAN_MEASURES:
+        actual = float(table[f'{measure}_actual'].sum())
+        plan = float(table[f'{measure}_plan'].sum())
+        summary[measure] = {
+            'actual': actual,
+            'plan': plan,
+            'variance': actual - plan,
+            'variance_pct': (actual - plan) / plan * 100 if plan else 0.0,
+            'achievement': actual / plan * 100 if plan else 0.0,
+            'ytd_achievement': float(latest[f'{measure}_ytd_achievement']),
+            'runrate': float(latest[f'{measure}_runrate']),
+            'plan_fy': float(latest[f'{measure}_plan_fy']),
+            'runrate_achievement': float(latest[f'{measure}_runrate_achievement'])
+        }
+    return summary
@@ -0,0 +1,205 @@
+"""Offline precompute pipeline writing versioned derived-table artifacts."""
+
+import json
+import os
+import time
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+from src.site_matrix import build_fleet_matrix
+from src.derived_tables import (
+    build_contract_optimization_table,
+    build_anomaly_table,
+    build_zero_usage_table,
+    build_risk_frame,
+    build_overcharge_table,
+    build_rollups,
+    build_efficiency_table
+)
+from src.forecasting import build_forecast_table
+from src.plan_allocation import allocate_plan
+from src.tariffs import load_tariff_book, recommend_tariffs
+
+
+ARTIFACT_NAMES = [
+    'contract_optimization',
+    'anomalies',
+    'zero_usage',
+    'risk_frame',
+    'overcharge',
+    'rollups',
+    'efficiency',
+    'forecast',
+    'site_plan',
+    'tariff_recommendation'
+]
+
+
+class ArtifactStore:
+    """
+    Versioned artifact storage: <artifacts_dir>/<data_version>/<name>.parquet.
+
+    A version directory is only readable once its manifest.json has been
+    written, so pages never see a half-finished run.
+    """
+
+    def __init__(self, artifacts_dir: Path):
+        """
+        Initialize artifact store.
+
+        Args:
+            artifacts_dir: Root directory of the artifacts
+        """
+        self.artifacts_dir = Path(artifacts_dir)
+
+    def version_dir(self, data_version: str) -> Path:
+        """Directory holding the artifacts of one data version."""
+        return self.artifacts_dir / data_version
+
+    def has_version(self, data_version: str) -> bool:
+        """Check a complete artifact set exists for the data version."""
+        return (self.version_dir(data_version) / "manifest.json").exists()
+
+    def load_manifest(self, data_version: str) -> Optional[Dict]:
+        """Load the manifest of a data version (None if not materialized)."""
+        path = self.version_dir(data_version) / "manifest.json"
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load(self, name: str, data_version: str) -> Optional[pd.DataFrame]:
+        """
+        Load one artifact.
+
+        Args:
+            name: Artifact name (see ARTIFACT_NAMES)
+            data_version: Data version signature
+
+        Returns:
+            Artifact dataframe, or None if not materialized for this version
+        """
+        if not self.has_version(data_version):
+            return None
+        path = self.version_dir(data_version) / f"{name}.parquet"
+        if not path.exists():
+            return None
+        return pd.read_parquet(path)
+
+    def save(self, data_version: str, tables: Dict[str, pd.DataFrame], timings: Dict[str, float]) -> Path:
+        """
+        Write a complete artifact set and its manifest.
+
+        Args:
+            data_version: Data version signature
+            tables: Artifact name -> dataframe
+            timings: Artifact name -> build seconds
+
+        Returns:
+            Version directory
+        """
+        target = self.version_dir(data_version)
+        target.mkdir(parents=True, exist_ok=True)
+
+        manifest_path = target / "manifest.json"
+        if manifest_path.exists():
+            manifest_path.unlink()
+
+        for name, df in tables.items():
+            tmp_path = target / f"{name}.parquet.tmp"
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, target / f"{name}.parquet")
+
+        manifest = {
+            'data_version': data_version,
+            'created_at': datetime.now().isoformat(),
+            'artifacts': {
+                name: {'rows': int(len(df)), 'build_seconds': round(timings.get(name, 0.0), 3)}
+                for name, df in tables.items()
+            }
+        }
+        tmp_manifest = target / "manifest.json.tmp"
+        with open(tmp_manifest, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_manifest, manifest_path)
+        return target
+
+
+def build_artifacts(
+    datasets: Dict[str, pd.DataFrame],
+    n_workers: Optional[int] = None
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, float]]:
+    """
+    Build every derived table from loaded datasets.
+
+    Args:
+        datasets: 'bills', 'actual', 'plan', 'traffic', 'site_master' dataframes
+        n_workers: Worker processes for fleet jobs (default: CPU count)
+
+    Returns:
+        (artifact name -> dataframe, artifact name -> build seconds)
+    """
+    bills_df = datasets['bills']
+    actual_df = datasets['actual']
+    traffic_df = datasets['traffic']
+    site_master = datasets['site_master']
+
+    matrix = build_fleet_matrix(datasets)
+
+    builders: Dict[str, Callable[[], pd.DataFrame]] = {
+        'contract_optimization': lambda: build_contract_optimization_table(bills_df, site_master, n_workers=n_workers),
+        'anomalies': lambda: build_anomaly_table(bills_df, site_master, matrix=matrix, n_workers=n_workers),
+        'zero_usage': lambda: build_zero_usage_table(bills_df, site_master),
+        'risk_frame': lambda: build_risk_frame(bills_df, actual_df, matrix=matrix, n_workers=n_workers),
+        'overcharge': lambda: build_overcharge_table(bills_df, actual_df, site_master),
+        'rollups': lambda: build_rollups(bills_df, actual_df),
+        'efficiency': lambda: build_efficiency_table(bills_df, traffic_df, site_master),
+        'forecast': lambda: build_forecast_table(matrix),
+        'site_plan': lambda: allocate_plan(datasets['plan'], matrix),
+        'tariff_recommendation': lambda: recommend_tariffs(matrix, site_master, load_tariff_book())
+    }
+
+    tables = {}
+    timings = {}
+    for name in ARTIFACT_NAMES:
+        start = time.perf_counter()
+        tables[name] = builders[name]()
+        timings[name] = time.perf_counter() - start
+    return tables, timings
+
+
+def run_precompute(
+    data_dir: Path,
+    artifacts_dir: Optional[Path] = None,
+    n_workers: Optional[int] = None,
+    force: bool = False
+) -> Dict:
+    """
+    Materialize all derived tables for the current data version.
+
+    Args:
+        data_dir: Directory containing data files
+        artifacts_dir: Artifact root (default: <data_dir>/artifacts)
+        n_workers: Worker processes for fleet jobs (default: CPU count)
+        force: Rebuild even if the version is already materialized
+
+    Returns:
+        Manifest of the data version
+    """
+    # Imported here: data_access imports ArtifactStore from this module
+    from src.data_access import DataAccessLayer
+
+    dal = DataAccessLayer(Path(data_dir))
+    store = ArtifactStore(artifacts_dir or dal.artifacts_dir)
+    data_version = dal.get_data_version()
+
+    manifest = store.load_manifest(data_version)
+    # Versions materialized before an artifact was added are rebuilt
+    if manifest is not None and set(ARTIFACT_NAMES) <= set(manifest['artifacts']) and not force:
+        return manifest
+
+    datasets = dal.read_all().as_dict()
+    tables, timings = build_artifacts(datasets, n_workers=n_workers)
+    store.save(data_version, tables, timings)
+    return store.load_manifest(data_version)
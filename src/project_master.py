@@ -1,9 +1,70 @@
 """과제 마스터 관리"""
 
+import os
+import re
+import threading
 import pandas as pd
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
+from src.rollups import RollupStore
+
+
+# 과제 KPI 집계 기준과 금액 항목
+PROJECT_ROLLUP_DIMENSIONS = ['status', 'domain']
+PROJECT_ROLLUP_MEASURES = ['target_savings_krw', 'actual_savings_krw', 'verified_savings_krw']
+
+# 대분류별 과제 ID 접두어
+DOMAIN_PREFIX_MAP = {
+    '억세스분야': 'ACCESS',
+    '설비분야': 'FACILITY',
+    'Core/전송': 'CORE'
+}
+
+PROJECT_ID_PATTERN = re.compile(r'^PRJ_([A-Z]+)_(\d+)$')
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, None if missing."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ProjectRegistry:
+    """
+    과제 목록의 메모리 인덱스 (project_id, 대분류별 조회와 ID 채번)
+
+    읽어 들인 파일의 서명(mtime, 크기)을 기억해, 다른 곳에서 파일이
+    바뀌었을 때만 다시 읽는다.
+    """
+
+    def __init__(self, df: pd.DataFrame, signature: Optional[Tuple[int, int]]):
+        self.df = df.reset_index(drop=True)
+        self.signature = signature
+        records = self.df.to_dict('records')
+        self.by_id: Dict[str, Dict] = {record['project_id']: record for record in records}
+        self.by_domain: Dict[str, List[str]] = {}
+        # 접두어별 마지막 번호 (다음 ID = 마지막 번호 + 1)
+        self.last_number: Dict[str, int] = {}
+        for record in records:
+            self.by_domain.setdefault(record['domain'], []).append(record['project_id'])
+            match = PROJECT_ID_PATTERN.match(str(record['project_id']))
+            if match:
+                prefix, number = match.group(1), int(match.group(2))
+                self.last_number[prefix] = max(self.last_number.get(prefix, 0), number)
+
+    def next_id(self, domain: str) -> str:
+        """대분류의 다음 과제 ID"""
+        prefix = DOMAIN_PREFIX_MAP.get(domain, 'OTHER')
+        return f"PRJ_{prefix}_{self.last_number.get(prefix, 0) + 1:03d}"
+
+
+# 프로세스 내 과제 레지스트리 (파일 경로별)
+_REGISTRIES: Dict[Path, ProjectRegistry] = {}
+_REGISTRY_LOCK = threading.RLock()
 
 
 class ProjectMasterManager:
@@ -19,6 +80,11 @@ class ProjectMasterManager:
         self.data_dir = data_dir
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.file_path = self.data_dir / "project_master.parquet"
+        self.rollups = RollupStore(
+            self.data_dir / "project_master_rollups.json",
+            dimensions=PROJECT_ROLLUP_DIMENSIONS,
+            measures=PROJECT_ROLLUP_MEASURES
+        )
         
         # 초기 데이터가 없으면 생성
         if not self.file_path.exists():
@@ -167,12 +233,47 @@ class ProjectMasterManager:
         df = pd.DataFrame(initial_projects)
         df.to_parquet(self.file_path, index=False)
     
+    def _registry(self) -> ProjectRegistry:
+        """캐시된 과제 레지스트리 (파일이 바뀌었으면 다시 읽음)"""
+        key = self.file_path.resolve()
+        with _REGISTRY_LOCK:
+            registry = _REGISTRIES.get(key)
+            signature = _file_signature(self.file_path)
+            if signature is None:
+                self._create_initial_projects()
+                signature = _file_signature(self.file_path)
+            if registry is None or registry.signature != signature:
+                registry = ProjectRegistry(pd.read_parquet(self.file_path), signature)
+                _REGISTRIES[key] = registry
+            return registry
+    
+    def _write_through(self, df: pd.DataFrame) -> ProjectRegistry:
+        """과제 목록을 저장하고 레지스트리를 갱신"""
+        df.to_parquet(self.file_path, index=False)
+        registry = ProjectRegistry(df, _file_signature(self.file_path))
+        _REGISTRIES[self.file_path.resolve()] = registry
+        return registry
+    
     def load_projects(self) -> pd.DataFrame:
         """과제 목록 로드"""
-        if not self.file_path.exists():
-            self._create_initial_projects()
+        return self._registry().df.copy()
+    
+    def list_projects(self, domain: Optional[str] = None) -> List[Dict]:
+        """
+        과제 목록 조회 (등록 순)
+        
+        Args:
+            domain: 대분류 (None이면 전체)
         
-        return pd.read_parquet(self.file_path)
+        Returns:
+            과제 정보 목록
+        """
+        registry = self._registry()
+        if domain is None:
+            project_ids = list(registry.by_id)
+        else:
+            project_ids = registry.by_domain.get(domain, [])
+        return [dict(registry.by_id[project_id]) for project_id in project_ids]
     
     def add_project(
         self,
@@ -193,44 +294,30 @@ class ProjectMasterManager:
         Returns:
             생성된 project_id
         """
-        df = self.load_projects()
-        
-        # Generate new project_id
-        domain_prefix_map = {
-            '억세스분야': 'ACCESS',
-            '설비분야': 'FACILITY',
-            'Core/전송': 'CORE'
-        }
-        prefix = domain_prefix_map.get(domain, 'OTHER')
-        existing_ids = df[df['domain'] == domain]['project_id'].tolist()
-        
-        # Find next available number
-        max_num = 0
-        for pid in existing_ids:
-            try:
-                num = int(pid.split('_')[-1])
-                max_num = max(max_num, num)
-            except:
-                pass
-        
-        new_id = f"PRJ_{prefix}_{max_num + 1:03d}"
-        
-        # Create new project
-        new_project = {
-            'project_id': new_id,
-            'project_name': project_name,
-            'domain': domain,
-            'status': status,
-            'target_savings_krw': target_savings_krw,
-            'actual_savings_krw': 0,
-            'verified_savings_krw': 0,
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
-        }
-        
-        # Append and save
-        df = pd.concat([df, pd.DataFrame([new_project])], ignore_index=True)
-        df.to_parquet(self.file_path, index=False)
+        with _REGISTRY_LOCK:
+            registry = self._registry()
+            rollups = self.load_rollups()
+            
+            # 대분류 접두어별 번호로 새 ID 채번
+            new_id = registry.next_id(domain)
+            
+            # Create new project
+            new_project = {
+                'project_id': new_id,
+                'project_name': project_name,
+                'domain': domain,
+                'status': status,
+                'target_savings_krw': target_savings_krw,
+                'actual_savings_krw': 0,
+                'verified_savings_krw': 0,
+                'created_at': datetime.now().isoformat(),
+                'updated_at': datetime.now().isoformat()
+            }
+            
+            # Append and save
+            df = pd.concat([registry.df, pd.DataFrame([new_project])], ignore_index=True)
+            self._write_through(df)
+            self.rollups.update(rollups, self.file_path, added=[new_project])
         
         return new_id
     
@@ -239,7 +326,8 @@ class ProjectMasterManager:
         project_id: str,
         actual_savings_krw: Optional[float] = None,
         verified_savings_krw: Optional[float] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        verified_ci_krw: Optional[Tuple[float, float]] = None
     ) -> bool:
         """
         과제 정보 업데이트
@@ -249,41 +337,70 @@ class ProjectMasterManager:
             actual_savings_krw: 실적 절감액
             verified_savings_krw: 확정 절감액
             status: 진행 상태
+            verified_ci_krw: 확정 절감액 신뢰구간 (하한, 상한)
         
         Returns:
             성공 여부
         """
-        df = self.load_projects()
-        
-        if project_id not in df['project_id'].values:
-            return False
-        
-        mask = df['project_id'] == project_id
-        
-        if actual_savings_krw is not None:
-            df.loc[mask, 'actual_savings_krw'] = actual_savings_krw
-        
-        if verified_savings_krw is not None:
-            df.loc[mask, 'verified_savings_krw'] = verified_savings_krw
+        with _REGISTRY_LOCK:
+            registry = self._registry()
+            if project_id not in registry.by_id:
+                return False
+            
+            rollups = self.load_rollups()
+            before = [registry.by_id[project_id]]
+            df = registry.df.copy()
+            mask = df['project_id'] == project_id
+            
+            if actual_savings_krw is not None:
+                df.loc[mask, 'actual_savings_krw'] = actual_savings_krw
+            
+            if verified_savings_krw is not None:
+                df.loc[mask, 'verified_savings_krw'] = verified_savings_krw
+            
+            if status is not None:
+                df.loc[mask, 'status'] = status
+            
+            if verified_ci_krw is not None:
+                df.loc[mask, 'verified_ci_lower_krw'] = verified_ci_krw[0]
+                df.loc[mask, 'verified_ci_upper_krw'] = verified_ci_krw[1]
+            
+            df.loc[mask, 'updated_at'] = datetime.now().isoformat()
+            
+            registry = self._write_through(df)
+            self.rollups.update(rollups, self.file_path, added=[registry.by_id[project_id]], removed=before)
+        return True
+    
+    def load_rollups(self) -> Dict:
+        """과제 KPI 누적 집계 로드 (과제 파일이 바뀌었으면 재집계)"""
+        return self.rollups.load(self.file_path, self.load_projects)
+    
+    def get_totals(self) -> Dict[str, float]:
+        """
+        전체 과제 KPI 합계
         
-        if status is not None:
-            df.loc[mask, 'status'] = status
+        Returns:
+            count(과제 수)와 목표/실적/확정 절감액 합계
+        """
+        rollups = self.load_rollups()
+        return {'count': rollups['count'], **rollups['totals']}
+    
+    def get_rollup(self, dimension: str) -> pd.DataFrame:
+        """
+        기준별 과제 KPI 합계
         
-        df.loc[mask, 'updated_at'] = datetime.now().isoformat()
+        Args:
+            dimension: 'status' 또는 'domain'
         
-        df.to_parquet(self.file_path, index=False)
-        return True
+        Returns:
+            기준 값, count, 목표/실적/확정 절감액 합계
+        """
+        return self.rollups.frame(self.load_rollups(), dimension)
     
     def get_project(self, project_id: str) -> Optional[Dict]:
         """특정 과제 조회"""
-        df = self.load_projects()
-        
-        project_rows = df[df['project_id'] == project_id]
-        
-        if len(project_rows) == 0:
-            return None
-        
-        return project_rows.iloc[0].to_dict()
+        project = self._registry().by_id.get(project_id)
+        return dict(project) if project is not None else None
 
 
 
@@ -0,0 +1,171 @@
+"""Persisted running rollups maintained incrementally next to a record file."""
+
+import json
+import math
+import os
+import pandas as pd
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+
+class RollupStore:
+    """
+    Running totals of record measures, overall and per dimension value.
+
+    The rollup lives in a JSON file next to the records and remembers the
+    signature (mtime, size) of the record file it describes. Writers update
+    it by applying the rows they added or removed; a rollup whose signature
+    no longer matches the records (edited elsewhere, or written before
+    rollups existed) is rebuilt from the records once.
+    """
+
+    def __init__(self, path: Path, dimensions: Sequence[str], measures: Sequence[str]):
+        """
+        Initialize rollup store.
+
+        Args:
+            path: JSON file holding the rollup
+            dimensions: Record columns to group by
+            measures: Numeric record columns to sum
+        """
+        self.path = Path(path)
+        self.dimensions = list(dimensions)
+        self.measures = list(measures)
+
+    @staticmethod
+    def _signature(source: Path) -> Optional[List[int]]:
+        """(mtime_ns, size) of the record file, None if missing."""
+        try:
+            stat = os.stat(source)
+        except FileNotFoundError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _empty(self) -> Dict:
+        return {
+            'source': None,
+            'count': 0,
+            'totals': {m: 0.0 for m in self.measures},
+            'groups': {d: {} for d in self.dimensions}
+        }
+
+    def _read(self) -> Optional[Dict]:
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if set(state.get('groups', {})) != set(self.dimensions):
+            return None
+        return state
+
+    def _write(self, state: Dict) -> None:
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def _apply(self, state: Dict, rows: Iterable[Dict], sign: int) -> None:
+        for row in rows:
+            values = {}
+            for m in self.measures:
+                value = row.get(m)
+                values[m] = 0.0 if value is None or pd.isna(value) else float(value)
+            state['count'] += sign
+            for m in self.measures:
+                state['totals'][m] += sign * values[m]
+
+            for d in self.dimensions:
+                key = row.get(d)
+                if key is None or (isinstance(key, float) and math.isnan(key)):
+                    continue
+                groups = state['groups'][d]
+                group = groups.setdefault(str(key), {'count': 0, **{m: 0.0 for m in self.measures}})
+                group['count'] += sign
+                for m in self.measures:
+                    group[m] += sign * values[m]
+                if group['count'] <= 0:
+                    del groups[str(key)]
+
+    def rebuild(self, records: pd.DataFrame, source: Path) -> Dict:
+        """
+        Recompute the rollup from all records and persist it.
+
+        Args:
+            records: Every record
+            source: Record file the rollup describes
+
+        Returns:
+            Rollup state
+        """
+        state = self._empty()
+        self._apply(state, records.to_dict('records'), 1)
+        state['source'] = self._signature(source)
+        self._write(state)
+        return state
+
+    def load(self, source: Path, load_records: Callable[[], pd.DataFrame]) -> Dict:
+        """
+        Rollup state matching the current record file.
+
+        Args:
+            source: Record file the rollup describes
+            load_records: Reads all records (only called to rebuild)
+
+        Returns:
+            Rollup state
+        """
+        state = self._read()
+        signature = self._signature(source)
+        if state is not None and state['source'] == signature:
+            return state
+        if signature is None:
+            return self._empty()
+        return self.rebuild(load_records(), source)
+
+    def update(
+        self,
+        state: Dict,
+        source: Path,
+        added: Iterable[Dict] = (),
+        removed: Iterable[Dict] = ()
+    ) -> Dict:
+        """
+        Apply a write to a rollup loaded before the write and persist it.
+
+        Args:
+            state: Rollup state loaded before the records were written
+            source: Record file that was just written
+            added: Rows added (or new versions of updated rows)
+            removed: Rows removed (or old versions of updated rows)
+
+        Returns:
+            Updated rollup state
+        """
+        self._apply(state, removed, -1)
+        self._apply(state, added, 1)
+        state['source'] = self._signature(source)
+        self._write(state)
+        return state
+
+    def frame(self, state: Dict, dimension: str) -> pd.DataFrame:
+        """
+        Per-value rollup of one dimension.
+
+        Args:
+            state: Rollup state
+            dimension: One of the store's dimensions
+
+        Returns:
+            dimension, count and measure columns (sorted by dimension value)
+        """
+        if dimension not in self.dimensions:
+            raise ValueError(f"집계 차원이 아닙니다: {dimension}")
+        groups = state['groups'][dimension]
+        frame = pd.DataFrame(
+            [{dimension: key, **values} for key, values in groups.items()],
+            columns=[dimension, 'count'] + self.measures
+        )
+        return frame.sort_values(dimension).reset_index(drop=True)
@@ -4,6 +4,7 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Tuple
+from src.tariffs import load_tariff_book
 
 
 def generate_sample_data(data_dir: Path) -> None:
@@ -24,6 +25,10 @@ def generate_sample_data(data_dir: Path) -> None:
     
     # Configuration
     np.random.seed(42)
+    # Current 정액/종량 rates (config/tariffs.yaml)
+    tariff_book = load_tariff_book()
+    fixed_tariff = tariff_book.tariff_for("정액")
+    volume_tariff = tariff_book.tariff_for("종량")
     # 2024.01 ~ 2026.04 (28 months)
     months = []
     for year in range(2024, 2026):
@@ -187,11 +192,11 @@ def generate_sample_data(data_dir: Path) -> None:
             
             # Cost calculation (more realistic)
             if contract_type == "정액":
-                basic_charge = contract_power_kw * 8000  # 기본요금
-                energy_charge = kwh_bill * 80  # 전력량요금
+                basic_charge = contract_power_kw * fixed_tariff.basic_charge_krw_per_kw  # 기본요금
+                energy_charge = kwh_bill * fixed_tariff.base_energy_rate  # 전력량요금
                 cost_bill = basic_charge + energy_charge
             else:
-                cost_bill = kwh_bill * 120
+                cost_bill = kwh_bill * volume_tariff.base_energy_rate
             
             bills.append({
                 'yymm': int(month),  # Convert to int for consistency
@@ -248,9 +253,12 @@ def generate_sample_data(data_dir: Path) -> None:
         
         # Cost estimation
         if bill_row['contract_type'] == "정액":
-            cost_actual_est = bill_row['contract_power_kw'] * 8000 + kwh_actual * 80
+            cost_actual_est = (
+                bill_row['contract_power_kw'] * fixed_tariff.basic_charge_krw_per_kw
+                + kwh_actual * fixed_tariff.base_energy_rate
+            )
         else:
-            cost_actual_est = kwh_actual * 120
+            cost_actual_est = kwh_actual * volume_tariff.base_energy_rate
         
         actual.append({
             'yymm': bill_row['yymm'],
@@ -0,0 +1,240 @@
+"""Difference-in-differences savings validation with matched control sites."""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Optional, Sequence
+from src.site_matrix import SiteMonthMatrix
+
+
+# Site attributes a control must share with its treated site
+DEFAULT_MATCH_ON = ('site_type',)
+
+# Bound on treated x control distances evaluated at once
+NN_CHUNK_ELEMENTS = 4_000_000
+
+
+def seasonal_factors(matrix: SiteMonthMatrix, measure: str = 'kwh_bill') -> np.ndarray:
+    """
+    Fleet month-of-year factors aligned with the matrix months.
+
+    Each month's fleet mean divided by the overall mean, averaged over
+    the same calendar month of every year (1.0 where undefined).
+
+    Args:
+        matrix: Site x month matrix store
+        measure: Measure to derive the seasonality from
+
+    Returns:
+        Factor per matrix column
+    """
+    with np.errstate(invalid='ignore'):
+        monthly_mean = np.nanmean(matrix.measure(measure).astype(np.float64), axis=0)
+    overall = np.nanmean(monthly_mean)
+    month_of_year = matrix.months % 100
+
+    factors = np.ones(len(matrix.months))
+    if not np.isfinite(overall) or overall == 0:
+        return factors
+    for moy in np.unique(month_of_year):
+        cols = month_of_year == moy
+        value = np.nanmean(monthly_mean[cols]) / overall
+        if np.isfinite(value) and value > 0:
+            factors[cols] = value
+    return factors
+
+
+def _group_codes(site_master: pd.DataFrame, site_ids: np.ndarray, match_on: Sequence[str]) -> np.ndarray:
+    """Integer code of the attribute combination of each site (-1 if unknown)."""
+    columns = [col for col in match_on if col in site_master.columns]
+    if not columns:
+        return np.zeros(len(site_ids), dtype=np.int64)
+    attrs = site_master.drop_duplicates('site_id').set_index('site_id')[columns]
+    attrs = attrs.reindex(site_ids)
+    codes = pd.MultiIndex.from_frame(attrs.astype(str)).factorize()[0]
+    return np.where(attrs.notna().all(axis=1).to_numpy(), codes, -1)
+
+
+def nearest_neighbours(treated: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Index of the nearest candidate (Euclidean) for every treated row.
+
+    Distances are evaluated in chunks of treated rows so memory stays
+    bounded by NN_CHUNK_ELEMENTS.
+
+    Args:
+        treated: (n_treated, n_features) features
+        candidates: (n_candidates, n_features) features
+
+    Returns:
+        (n_treated,) candidate indices
+    """
+    # |t - c|^2 = |t|^2 - 2 t.c + |c|^2; |t|^2 does not change the argmin
+    cand_sq = (candidates ** 2).sum(axis=1)
+    chunk = max(1, NN_CHUNK_ELEMENTS // max(1, len(candidates)))
+    result = np.empty(len(treated), dtype=np.int64)
+    for start in range(0, len(treated), chunk):
+        block = treated[start:start + chunk]
+        dist = cand_sq[None, :] - 2.0 * block @ candidates.T
+        result[start:start + chunk] = np.argmin(dist, axis=1)
+    return result
+
+
+@dataclass
+class SavingsEstimate:
+    """
+    Result of a difference-in-differences validation.
+
+    `diff` holds, per treated site (row) and month (column, pre-period
+    months first), the deseasonalized kWh of the treated site minus its
+    matched control. Site savings are the pre-period mean of `diff` minus
+    its post-period mean, re-seasonalized with the post-period factors.
+    """
+    treated_ids: np.ndarray
+    control_ids: np.ndarray
+    pre_months: np.ndarray
+    post_months: np.ndarray
+    diff: np.ndarray
+    post_factor: float
+    unit_price: np.ndarray
+    n_excluded: int = 0
+
+    @property
+    def n_pre(self) -> int:
+        return len(self.pre_months)
+
+    @property
+    def site_kwh_savings(self) -> np.ndarray:
+        """Savings per treated site (kWh/month, positive = reduction)."""
+        pre = self.diff[:, :self.n_pre].mean(axis=1)
+        post = self.diff[:, self.n_pre:].mean(axis=1)
+        return (pre - post) * self.post_factor
+
+    @property
+    def kwh_savings_per_month(self) -> float:
+        return float(self.site_kwh_savings.sum())
+
+    @property
+    def krw_savings_per_month(self) -> float:
+        return float((self.site_kwh_savings * self.unit_price).sum())
+
+    @property
+    def kwh_savings_total(self) -> float:
+        return self.kwh_savings_per_month * len(self.post_months)
+
+    @property
+    def krw_savings_total(self) -> float:
+        return self.krw_savings_per_month * len(self.post_months)
+
+    def site_frame(self) -> pd.DataFrame:
+        """Per treated site: matched control, savings kWh/month and KRW/month."""
+        return pd.DataFrame({
+            'site_id': self.treated_ids,
+            'control_site_id': self.control_ids,
+            'kwh_savings': self.site_kwh_savings,
+            'unit_price': self.unit_price,
+            'krw_savings': self.site_kwh_savings * self.unit_price
+        })
+
+
+def estimate_savings(
+    matrix: SiteMonthMatrix,
+    site_master: pd.DataFrame,
+    treated_site_ids: Sequence[str],
+    go_live_yymm: int,
+    pre_months: int = 6,
+    post_months: int = 6,
+    match_on: Sequence[str] = DEFAULT_MATCH_ON
+) -> Optional[SavingsEstimate]:
+    """
+    Difference-in-differences savings of a treated site set.
+
+    Controls are untreated sites with complete data that share the
+    `match_on` attributes, picked by nearest neighbour (with replacement)
+    on pre-period deseasonalized level (log) and trend. Treated sites
+    without complete data are excluded; treated sites without a control
+    in their attribute group are matched against the whole pool.
+
+    Args:
+        matrix: Site x month matrix store (kwh_bill, cost_bill)
+        site_master: Site master (match_on attributes)
+        treated_site_ids: Sites where the measure went live
+        go_live_yymm: First month of the post period
+        pre_months: Months before go-live
+        post_months: Months from go-live on
+        match_on: Attributes a control must share
+
+    Returns:
+        SavingsEstimate, or None if the periods or groups are empty
+    """
+    go_live = matrix.month_position(go_live_yymm)
+    if go_live is None:
+        return None
+    pre_cols = np.arange(max(0, go_live - pre_months), go_live)
+    post_cols = np.arange(go_live, min(len(matrix.months), go_live + post_months))
+    if len(pre_cols) == 0 or len(post_cols) == 0:
+        return None
+    cols = np.concatenate([pre_cols, post_cols])
+
+    factors = seasonal_factors(matrix)
+    kwh = matrix.measure('kwh_bill')[:, cols].astype(np.float64) / factors[cols]
+    complete = np.isfinite(kwh).all(axis=1)
+
+    treated_pos = matrix.site_positions(treated_site_ids)
+    treated_pos = np.unique(treated_pos[treated_pos >= 0])
+    is_treated = np.zeros(len(matrix.site_ids), dtype=bool)
+    is_treated[treated_pos] = True
+    n_excluded = int(len(treated_pos) - (is_treated & complete).sum())
+
+    treated_pos = np.flatnonzero(is_treated & complete)
+    pool_pos = np.flatnonzero(~is_treated & complete)
+    if len(treated_pos) == 0 or len(pool_pos) == 0:
+        return None
+
+    # Matching features: log level and relative trend of the pre period
+    pre = kwh[:, :len(pre_cols)]
+    level = np.log1p(np.maximum(pre.mean(axis=1), 0))
+    if len(pre_cols) > 1:
+        x = np.arange(len(pre_cols)) - (len(pre_cols) - 1) / 2
+        slope = (pre * x).sum(axis=1) / (x ** 2).sum()
+        trend = slope / np.maximum(pre.mean(axis=1), 1e-9)
+    else:
+        trend = np.zeros(len(level))
+    features = np.column_stack([level, trend])
+    scale = features[pool_pos].std(axis=0)
+    features = features / np.where(scale > 0, scale, 1.0)
+
+    codes = _group_codes(site_master, matrix.site_ids, match_on)
+    control_pos = np.empty(len(treated_pos), dtype=np.int64)
+    matched = np.zeros(len(treated_pos), dtype=bool)
+    for code in np.unique(codes[treated_pos]):
+        t_idx = np.flatnonzero(codes[treated_pos] == code)
+        pool = pool_pos[codes[pool_pos] == code] if code >= 0 else pool_pos[:0]
+        if len(pool) == 0:
+            continue
+        control_pos[t_idx] = pool[nearest_neighbours(features[treated_pos[t_idx]], features[pool])]
+        matched[t_idx] = True
+    if not matched.all():
+        rest = np.flatnonzero(~matched)
+        control_pos[rest] = pool_pos[nearest_neighbours(features[treated_pos[rest]], features[pool_pos])]
+
+    diff = kwh[treated_pos] - kwh[control_pos]
+
+    # Unit price of each treated site in the post period (fleet average as fallback)
+    cost_post = matrix.measure('cost_bill')[:, post_cols].astype(np.float64)
+    kwh_post = matrix.measure('kwh_bill')[:, post_cols].astype(np.float64)
+    fleet_price = np.nansum(cost_post) / np.nansum(kwh_post) if np.nansum(kwh_post) > 0 else 0.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        site_price = np.nansum(cost_post[treated_pos], axis=1) / np.nansum(kwh_post[treated_pos], axis=1)
+    unit_price = np.where(np.isfinite(site_price) & (site_price > 0), site_price, fleet_price)
+
+    return SavingsEstimate(
+        treated_ids=matrix.site_ids[treated_pos],
+        control_ids=matrix.site_ids[control_pos],
+        pre_months=matrix.months[pre_cols],
+        post_months=matrix.months[post_cols],
+        diff=diff,
+        post_factor=float(factors[post_cols].mean()),
+        unit_price=unit_price,
+        n_excluded=n_excluded
+    )
@@ -0,0 +1,87 @@
+"""Per-site offset index for site-level time-series lookups."""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, Tuple
+
+
+class SiteIndex:
+    """
+    Site-sorted layout of a long-format dataset with an offset index.
+
+    Rows are stored sorted by (site_id, yymm) so that one site's history is
+    a contiguous row range. Lookups slice that range instead of scanning
+    the whole frame.
+    """
+
+    def __init__(self, df: pd.DataFrame, site_col: str = 'site_id', time_col: str = 'yymm'):
+        """
+        Build the index.
+
+        Args:
+            df: Long-format dataframe with one row per site and month
+            site_col: Site identifier column
+            time_col: Time column used as secondary sort key
+        """
+        self.site_col = site_col
+
+        sort_cols = [site_col, time_col] if time_col in df.columns else [site_col]
+        self.frame = df.sort_values(sort_cols, kind='mergesort').reset_index(drop=True)
+
+        site_values = self.frame[site_col].to_numpy()
+        if len(site_values) > 0:
+            # Rows are sorted, so a site starts wherever the value changes
+            boundaries = np.flatnonzero(site_values[1:] != site_values[:-1]) + 1
+            starts = np.concatenate(([0], boundaries))
+            stops = np.concatenate((boundaries, [len(site_values)]))
+        else:
+            starts = np.array([], dtype=np.int64)
+            stops = np.array([], dtype=np.int64)
+
+        self.site_ids = site_values[starts]
+        self.starts = starts.astype(np.int64)
+        self.stops = stops.astype(np.int64)
+        self._offsets: Dict[str, Tuple[int, int]] = {
+            site_id: (int(start), int(stop))
+            for site_id, start, stop in zip(self.site_ids, self.starts, self.stops)
+        }
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, site_id) -> bool:
+        return site_id in self._offsets
+
+    def row_range(self, site_id) -> Tuple[int, int]:
+        """Return the (start, stop) row range of a site, (0, 0) if absent."""
+        return self._offsets.get(site_id, (0, 0))
+
+    def get(self, site_id) -> pd.DataFrame:
+        """
+        Get one site's history.
+
+        Args:
+            site_id: Site ID
+
+        Returns:
+            Rows of the site sorted by month (empty frame if unknown)
+        """
+        start, stop = self.row_range(site_id)
+        return self.frame.iloc[start:stop]
+
+    def get_many(self, site_ids: Iterable) -> pd.DataFrame:
+        """
+        Get histories for several sites as one frame.
+
+        Args:
+            site_ids: Site IDs (unknown IDs are ignored)
+
+        Returns:
+            Concatenated rows in the order of the given site IDs
+        """
+        ranges = [self._offsets[s] for s in dict.fromkeys(site_ids) if s in self._offsets]
+        if not ranges:
+            return self.frame.iloc[0:0]
+
+        positions = np.concatenate([np.arange(start, stop) for start, stop in ranges])
+        return self.frame.iloc[positions]
@@ -0,0 +1,219 @@
+"""Dense site x month matrix store for fleet time-series analytics."""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional
+
+
+# Measure name -> source dataset
+MATRIX_MEASURES = {
+    'kwh_bill': 'bills',
+    'cost_bill': 'bills',
+    'contract_power_kw': 'bills',
+    'kwh_actual': 'actual',
+    'gb_traffic': 'traffic'
+}
+
+
+def month_range(start_yymm: int, end_yymm: int) -> List[int]:
+    """
+    Build a contiguous list of YYYYMM months.
+
+    Args:
+        start_yymm: First month (e.g., 202401)
+        end_yymm: Last month (inclusive)
+
+    Returns:
+        List of YYYYMM integers without gaps
+    """
+    months = []
+    year, month = divmod(int(start_yymm), 100)
+    while year * 100 + month <= int(end_yymm):
+        months.append(year * 100 + month)
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+    return months
+
+
+def add_months(yymm: int, n: int) -> int:
+    """
+    Shift a YYYYMM month by n months.
+
+    Args:
+        yymm: Month (e.g., 202412)
+        n: Months to add (negative to go back)
+
+    Returns:
+        Shifted YYYYMM integer
+    """
+    year, month = divmod(int(yymm), 100)
+    total = year * 12 + (month - 1) + n
+    return (total // 12) * 100 + total % 12 + 1
+
+
+@dataclass
+class SiteMonthMatrix:
+    """
+    Site x month matrices, one float32 array per measure.
+
+    Rows follow `site_ids`, columns follow `months` (a contiguous YYYYMM
+    range), so shifting a column by 12 is a year-over-year comparison.
+    Gaps are NaN and `observed[measure]` holds the matching boolean mask.
+    """
+    site_ids: np.ndarray
+    months: np.ndarray
+    values: Dict[str, np.ndarray]
+    observed: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __post_init__(self):
+        self._site_pos = {site_id: i for i, site_id in enumerate(self.site_ids)}
+        self._month_pos = {int(m): j for j, m in enumerate(self.months)}
+        for name, arr in self.values.items():
+            if name not in self.observed:
+                self.observed[name] = ~np.isnan(arr)
+
+    @property
+    def shape(self):
+        return len(self.site_ids), len(self.months)
+
+    def measure(self, name: str) -> np.ndarray:
+        """Get the (sites x months) array of a measure."""
+        if name not in self.values:
+            raise KeyError(f"지원하지 않는 측정값: {name}")
+        return self.values[name]
+
+    def site_position(self, site_id) -> Optional[int]:
+        """Row position of a site (None if absent)."""
+        return self._site_pos.get(site_id)
+
+    def site_positions(self, site_ids) -> np.ndarray:
+        """Row positions of several sites (-1 for unknown IDs)."""
+        return np.array([self._site_pos.get(s, -1) for s in site_ids], dtype=np.int64)
+
+    def month_position(self, yymm) -> Optional[int]:
+        """Column position of a month (None if outside the range)."""
+        return self._month_pos.get(int(yymm))
+
+    def lag(self, name: str, periods: int) -> np.ndarray:
+        """
+        Shift a measure along the month axis.
+
+        Args:
+            name: Measure name
+            periods: Months to shift (12 = same month last year)
+
+        Returns:
+            Array aligned with the current months, NaN where no lagged value
+        """
+        arr = self.measure(name)
+        lagged = np.full_like(arr, np.nan)
+        if periods == 0:
+            return arr.copy()
+        if abs(periods) < arr.shape[1]:
+            if periods > 0:
+                lagged[:, periods:] = arr[:, :-periods]
+            else:
+                lagged[:, :periods] = arr[:, -periods:]
+        return lagged
+
+    def site_series(self, site_id, name: str) -> pd.Series:
+        """Get one site's time series of a measure, indexed by yymm."""
+        pos = self.site_position(site_id)
+        if pos is None:
+            return pd.Series(dtype='float32')
+        return pd.Series(self.measure(name)[pos], index=self.months, name=name)
+
+    def to_frame(self, name: str) -> pd.DataFrame:
+        """Get a measure as a wide DataFrame (site_id x yymm)."""
+        return pd.DataFrame(self.measure(name), index=self.site_ids, columns=self.months)
+
+
+def _fill_matrix(
+    df: pd.DataFrame,
+    column: str,
+    site_axis: pd.Index,
+    month_axis: pd.Index
+) -> np.ndarray:
+    """Scatter a long-format column into a (sites x months) float32 array."""
+    arr = np.full((len(site_axis), len(month_axis)), np.nan, dtype=np.float32)
+    if df is None or len(df) == 0 or column not in df.columns:
+        return arr
+
+    rows = site_axis.get_indexer(df['site_id'])
+    cols = month_axis.get_indexer(df['yymm'].astype(int))
+    valid = (rows >= 0) & (cols >= 0)
+    values = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float32)
+    arr[rows[valid], cols[valid]] = values[valid]
+    return arr
+
+
+def build_site_month_matrix(
+    bills_df: pd.DataFrame,
+    actual_df: Optional[pd.DataFrame] = None,
+    traffic_df: Optional[pd.DataFrame] = None,
+    site_ids: Optional[List[str]] = None
+) -> SiteMonthMatrix:
+    """
+    Build the site x month matrix store from long-format datasets.
+
+    Args:
+        bills_df: Bills dataframe (kwh_bill, cost_bill, contract_power_kw)
+        actual_df: Actual usage dataframe (kwh_actual, optional)
+        traffic_df: Traffic dataframe (gb_traffic, optional)
+        site_ids: Site axis (defaults to every site seen in the datasets)
+
+    Returns:
+        SiteMonthMatrix with one float32 array per measure
+    """
+    sources = {'bills': bills_df, 'actual': actual_df, 'traffic': traffic_df}
+    frames = [df for df in sources.values() if df is not None and len(df) > 0]
+
+    if site_ids is None:
+        site_ids = sorted(set().union(*[df['site_id'].dropna().unique() for df in frames])) if frames else []
+
+    observed_months = [df['yymm'].astype(int) for df in frames]
+    if observed_months:
+        all_months = pd.concat(observed_months)
+        months = month_range(all_months.min(), all_months.max())
+    else:
+        months = []
+
+    site_axis = pd.Index(site_ids)
+    month_axis = pd.Index(months)
+
+    values = {
+        measure: _fill_matrix(sources[dataset], measure, site_axis, month_axis)
+        for measure, dataset in MATRIX_MEASURES.items()
+    }
+
+    return SiteMonthMatrix(
+        site_ids=np.asarray(site_ids, dtype=object),
+        months=np.asarray(months, dtype=np.int64),
+        values=values
+    )
+
+
+def build_fleet_matrix(datasets: Mapping[str, pd.DataFrame]) -> SiteMonthMatrix:
+    """
+    Build the matrix store of a full dataset bundle.
+
+    The one matrix every derived table reads, online (DataAccessLayer) and
+    offline (precompute): sites follow the site master and all measures,
+    traffic included, are filled.
+
+    Args:
+        datasets: 'bills', 'actual', 'traffic', 'site_master' dataframes
+
+    Returns:
+        SiteMonthMatrix
+    """
+    site_master = datasets['site_master']
+    site_ids = sorted(site_master['site_id'].unique()) if len(site_master) > 0 else None
+    return build_site_month_matrix(
+        datasets['bills'],
+        datasets['actual'],
+        datasets['traffic'],
+        site_ids=site_ids
+    )
@@ -0,0 +1,201 @@
+"""Process startup helpers: background data preparation and start timings."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from src.config_loader import DATASET_FILES
+
+
+# Reference point for start timings (first import of this module)
+_PROCESS_START = time.perf_counter()
+
+_timings: Dict[str, float] = {}
+_jobs: Dict[str, Dict] = {}
+_jobs_lock = threading.Lock()
+
+
+def record_timing(name: str, seconds: float) -> None:
+    """
+    Record a startup timing and print it once.
+
+    Args:
+        name: Step name (e.g. 'imports:app')
+        seconds: Elapsed seconds
+    """
+    if name in _timings:
+        return
+    _timings[name] = seconds
+    print(f"[startup] {name}: {seconds:.3f}s")
+
+
+def get_startup_timings() -> Dict[str, float]:
+    """Get recorded startup timings (step name -> seconds)."""
+    return dict(_timings)
+
+
+def seconds_since_start() -> float:
+    """Seconds elapsed since process start."""
+    return time.perf_counter() - _PROCESS_START
+
+
+def _prepare_data(data_dir: Path, job: Dict) -> None:
+    """Worker thread: generate missing sample data."""
+    start = time.perf_counter()
+    try:
+        # Imported here: generation pulls in the full sample data module
+        from src.sample_data import generate_sample_data
+        generate_sample_data(data_dir)
+        job['status'] = 'ready'
+    except Exception as e:
+        job['status'] = 'failed'
+        job['error'] = str(e)
+    finally:
+        record_timing('data_generation', time.perf_counter() - start)
+
+
+def ensure_data_ready(data_dir: Path) -> str:
+    """
+    Verify datasets exist, generating them in a background thread if not.
+
+    Only one generation thread runs per data directory and process; later
+    calls just report its progress.
+
+    Args:
+        data_dir: Directory containing data files
+
+    Returns:
+        'ready', 'generating' or 'failed'
+    """
+    key = str(Path(data_dir).resolve())
+    with _jobs_lock:
+        job = _jobs.get(key)
+        if job is not None and job['status'] != 'ready':
+            return job['status']
+
+        if all((Path(data_dir) / f).exists() for f in DATASET_FILES.values()):
+            return 'ready'
+
+        Path(data_dir).mkdir(parents=True, exist_ok=True)
+        job = {'status': 'generating', 'error': None, 'started_at': time.time()}
+        _jobs[key] = job
+        thread = threading.Thread(
+            target=_prepare_data,
+            args=(Path(data_dir), job),
+            name='pylon-data-generation',
+            daemon=True
+        )
+        thread.start()
+        return job['status']
+
+
+def data_job_error(data_dir: Path) -> Optional[str]:
+    """Error message of a failed background generation (None otherwise)."""
+    job = _jobs.get(str(Path(data_dir).resolve()))
+    return job.get('error') if job else None
+
+
+# ---------------------------------------------------------------------------
+# Cache warm-up
+# ---------------------------------------------------------------------------
+
+# Re-warm before the loaders' one-hour cache TTL expires
+WARM_UP_MAX_AGE_SECONDS = 50 * 60
+
+_warm_state: Dict[str, Dict] = {}
+_warm_lock = threading.Lock()
+
+
+def warm_up(dal) -> Dict[str, float]:
+    """
+    Load all datasets and build the shared derived structures.
+
+    Every step goes through the DataAccessLayer's cached methods, so later
+    sessions hit warm caches. Steps that fail are logged and skipped.
+
+    Args:
+        dal: DataAccessLayer instance
+
+    Returns:
+        Step name -> seconds
+    """
+    steps = [
+        ('load_bills', dal.load_bills),
+        ('load_actual', dal.load_actual),
+        ('load_plan', dal.load_plan),
+        ('load_traffic', dal.load_traffic),
+        ('load_site_master', dal.load_site_master),
+        ('site_index:bills', lambda: dal.load_site_index('bills')),
+        ('site_index:actual', lambda: dal.load_site_index('actual')),
+        ('site_month_matrix', dal.load_site_month_matrix)
+    ]
+    # Imported here: the readiness check must not pull in the analytics stack
+    from src.precompute import ARTIFACT_NAMES
+
+    steps += [(f'derived:{name}', lambda name=name: dal.load_derived_table(name)) for name in ARTIFACT_NAMES]
+
+    timings = {}
+    total_start = time.perf_counter()
+    for name, step in steps:
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            print(f"[warm-up] {name} 실패: {e}")
+        timings[name] = time.perf_counter() - start
+        print(f"[warm-up] {name}: {timings[name]:.3f}s")
+    timings['total'] = time.perf_counter() - total_start
+    print(f"[warm-up] total: {timings['total']:.3f}s")
+    return timings
+
+
+def _run_warm_up(dal, state: Dict) -> None:
+    """Worker thread: warm the caches and record the result."""
+    try:
+        state['timings'] = warm_up(dal)
+    finally:
+        state['running'] = False
+        state['finished_at'] = time.time()
+
+
+def schedule_warm_up(dal) -> bool:
+    """
+    Warm the caches in a background thread when needed.
+
+    Runs once per process and data version, and again when the previous
+    warm-up is older than WARM_UP_MAX_AGE_SECONDS.
+
+    Args:
+        dal: DataAccessLayer instance
+
+    Returns:
+        True if a warm-up was started
+    """
+    key = str(Path(dal.data_dir).resolve())
+    data_version = dal.get_data_version()
+
+    with _warm_lock:
+        state = _warm_state.get(key)
+        if state is not None:
+            if state['running']:
+                return False
+            fresh = time.time() - state['finished_at'] < WARM_UP_MAX_AGE_SECONDS
+            if state['data_version'] == data_version and fresh:
+                return False
+
+        state = {'data_version': data_version, 'running': True, 'finished_at': None, 'timings': {}}
+        _warm_state[key] = state
+        thread = threading.Thread(
+            target=_run_warm_up,
+            args=(dal, state),
+            name='pylon-warm-up',
+            daemon=True
+        )
+        thread.start()
+        return True
+
+
+def get_warm_up_timings(data_dir: Path) -> Dict[str, float]:
+    """Step timings of the last finished warm-up (empty if none)."""
+    state = _warm_state.get(str(Path(data_dir).resolve()))
+    return dict(state['timings']) if state else {}
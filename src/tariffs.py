@@ -0,0 +1,314 @@
+"""Declarative tariff model and vectorized fleet bill engine."""
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional, Sequence, Tuple
+from src.config_loader import load_tariff_config
+from src.site_matrix import SiteMonthMatrix
+
+
+@dataclass(frozen=True)
+class Tariff:
+    """
+    One tariff: basic, energy (seasonal / time-of-use) and penalty charges.
+
+    The energy rate of a calendar month is the time-of-use blend
+    (sum of share x rate, or the flat energy charge) times the month's
+    seasonal multiplier.
+    """
+    tariff_id: str
+    name: str
+    basic_charge_krw_per_kw: float = 0.0
+    energy_charge_krw_per_kwh: float = 0.0
+    penalty_krw_per_kw: float = 0.0
+    # calendar month (1-12) -> multiplier on the energy rate
+    seasonal_multipliers: Dict[int, float] = field(default_factory=dict)
+    # period -> (share of kWh, energy rate)
+    time_of_use: Dict[str, tuple] = field(default_factory=dict)
+    # site voltages that may take the tariff (empty: all)
+    eligible_voltages: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(cls, tariff_id: str, config: Dict[str, Any]) -> 'Tariff':
+        """Build a tariff from its tariffs.yaml entry."""
+        multipliers = {}
+        for season in (config.get('seasons') or {}).values():
+            for month in season.get('months', []):
+                multipliers[int(month)] = float(season.get('multiplier', 1.0))
+        time_of_use = {
+            period: (float(spec['share']), float(spec['energy_charge_krw_per_kwh']))
+            for period, spec in (config.get('time_of_use') or {}).items()
+        }
+        if time_of_use and not np.isclose(sum(share for share, _ in time_of_use.values()), 1.0):
+            raise ValueError(f"시간대별 사용 비중의 합이 1이 아닙니다: {tariff_id}")
+        return cls(
+            tariff_id=tariff_id,
+            name=config.get('name', tariff_id),
+            basic_charge_krw_per_kw=float(config.get('basic_charge_krw_per_kw', 0)),
+            energy_charge_krw_per_kwh=float(config.get('energy_charge_krw_per_kwh', 0)),
+            penalty_krw_per_kw=float(config.get('penalty_krw_per_kw', 0)),
+            seasonal_multipliers=multipliers,
+            time_of_use=time_of_use,
+            eligible_voltages=tuple(config.get('eligible_voltages') or ())
+        )
+
+    @property
+    def base_energy_rate(self) -> float:
+        """Energy rate before seasonal multipliers (KRW/kWh)."""
+        if self.time_of_use:
+            return sum(share * rate for share, rate in self.time_of_use.values())
+        return self.energy_charge_krw_per_kwh
+
+    def monthly_energy_rates(self) -> np.ndarray:
+        """Energy rate of each calendar month, index 0 = January."""
+        multipliers = np.array([self.seasonal_multipliers.get(m, 1.0) for m in range(1, 13)])
+        return self.base_energy_rate * multipliers
+
+    def scaled(self, basic_pct: float = 0.0, energy_pct: float = 0.0, penalty_pct: float = 0.0) -> 'Tariff':
+        """Copy with basic / energy / penalty rates changed by percentages."""
+        energy_factor = 1 + energy_pct / 100
+        return replace(
+            self,
+            basic_charge_krw_per_kw=self.basic_charge_krw_per_kw * (1 + basic_pct / 100),
+            energy_charge_krw_per_kwh=self.energy_charge_krw_per_kwh * energy_factor,
+            penalty_krw_per_kw=self.penalty_krw_per_kw * (1 + penalty_pct / 100),
+            time_of_use={p: (share, rate * energy_factor) for p, (share, rate) in self.time_of_use.items()}
+        )
+
+
+@dataclass
+class TariffBook:
+    """Tariff set plus the current tariff of each contract type."""
+    tariffs: Dict[str, Tariff]
+    contract_type_tariffs: Dict[str, str]
+    demand_hours_per_month: float = 720.0
+
+    def tariff_for(self, contract_type: str) -> Tariff:
+        """Current tariff of a contract type."""
+        return self.tariffs[self.contract_type_tariffs[contract_type]]
+
+    def scaled(self, basic_pct: float = 0.0, energy_pct: float = 0.0, penalty_pct: float = 0.0) -> 'TariffBook':
+        """Copy with every tariff's rates changed by percentages (rate-change scenario)."""
+        return replace(self, tariffs={
+            tariff_id: tariff.scaled(basic_pct, energy_pct, penalty_pct)
+            for tariff_id, tariff in self.tariffs.items()
+        })
+
+
+def load_tariff_book(config: Optional[Dict[str, Any]] = None) -> TariffBook:
+    """
+    Build the tariff book from the tariff configuration.
+
+    Args:
+        config: Parsed tariffs.yaml (loaded with load_tariff_config if None)
+
+    Returns:
+        TariffBook
+    """
+    if config is None:
+        config = load_tariff_config()
+    tariffs = {tariff_id: Tariff.from_config(tariff_id, spec) for tariff_id, spec in config['tariffs'].items()}
+    mapping = dict(config.get('contract_type_tariffs', {}))
+    unknown = set(mapping.values()) - set(tariffs)
+    if unknown:
+        raise ValueError(f"정의되지 않은 요금제: {sorted(unknown)}")
+    return TariffBook(tariffs, mapping, float(config.get('demand_hours_per_month', 720)))
+
+
+@dataclass
+class BillComponents:
+    """(sites x months) bill components in KRW; NaN where usage is missing."""
+    basic: np.ndarray
+    energy: np.ndarray
+    penalty: np.ndarray
+
+    @property
+    def total(self) -> np.ndarray:
+        return self.basic + self.energy + self.penalty
+
+
+def compute_bills(
+    kwh: np.ndarray,
+    contract_kw: np.ndarray,
+    months: Sequence[int],
+    tariff_ids: Sequence[Optional[str]],
+    book: TariffBook
+) -> BillComponents:
+    """
+    Bills of many sites and months under per-site tariffs, in one pass.
+
+    Tariff parameters are gathered per site (basic, penalty) and per
+    site x calendar month (energy rate) with integer indexing, so the cost
+    is a few array operations regardless of the number of tariffs.
+
+    Args:
+        kwh: (sites, months) billed kWh
+        contract_kw: (sites, months) contract power (NaN treated as 0)
+        months: YYYYMM of the columns
+        tariff_ids: Tariff of each site (None: no bill, NaN row)
+        book: Tariff book
+
+    Returns:
+        BillComponents
+    """
+    ids = list(book.tariffs)
+    codes = pd.Index(ids).get_indexer(pd.Index(tariff_ids, dtype=object))
+    unknown = {t for t, c in zip(tariff_ids, codes) if c < 0 and t is not None}
+    if unknown:
+        raise ValueError(f"정의되지 않은 요금제: {sorted(unknown)}")
+
+    basic_rates = np.array([book.tariffs[t].basic_charge_krw_per_kw for t in ids] + [np.nan])
+    penalty_rates = np.array([book.tariffs[t].penalty_krw_per_kw for t in ids] + [np.nan])
+    energy_rates = np.vstack([book.tariffs[t].monthly_energy_rates() for t in ids] + [np.full(12, np.nan)])
+
+    # Sites without a tariff index the trailing NaN row
+    codes = np.where(codes < 0, len(ids), codes)
+    month_of_year = np.asarray(months, dtype=np.int64) % 100 - 1
+
+    kwh = kwh.astype(np.float64)
+    contract = np.nan_to_num(contract_kw.astype(np.float64))
+    observed = ~np.isnan(kwh)
+
+    energy = kwh * energy_rates[codes][:, month_of_year]
+    basic = np.where(observed, contract * basic_rates[codes][:, None], np.nan)
+    excess_kw = np.maximum(kwh / book.demand_hours_per_month - contract, 0)
+    penalty = excess_kw * penalty_rates[codes][:, None]
+    return BillComponents(basic=basic, energy=energy, penalty=penalty)
+
+
+def site_tariff_ids(site_ids: Sequence[str], site_master: pd.DataFrame, book: TariffBook) -> np.ndarray:
+    """
+    Current tariff of each site from its contract type.
+
+    Args:
+        site_ids: Sites (matrix row order)
+        site_master: Site master (site_id, contract_type)
+        book: Tariff book
+
+    Returns:
+        Tariff ID per site (None for unknown sites or contract types)
+    """
+    contract_type = site_master.drop_duplicates('site_id').set_index('site_id')['contract_type']
+    tariff_ids = contract_type.reindex(site_ids).map(book.contract_type_tariffs)
+    return tariff_ids.astype(object).where(tariff_ids.notna(), None).to_numpy()
+
+
+def simulate_fleet_bills(
+    matrix: SiteMonthMatrix,
+    tariff_ids: Sequence[Optional[str]],
+    book: TariffBook,
+    months: Optional[Sequence[int]] = None
+) -> BillComponents:
+    """
+    Fleet bills of the matrix months under a tariff book.
+
+    Args:
+        matrix: Site x month matrix store (kwh_bill, contract_power_kw)
+        tariff_ids: Tariff of each matrix site
+        book: Tariff book (e.g. book.scaled(...) for a rate-change scenario)
+        months: Restrict to these YYYYMM months (all if None)
+
+    Returns:
+        BillComponents over the selected months
+    """
+    cols = np.arange(len(matrix.months))
+    if months is not None:
+        cols = cols[np.isin(matrix.months, np.asarray(months, dtype=np.int64))]
+    return compute_bills(
+        matrix.measure('kwh_bill')[:, cols],
+        matrix.measure('contract_power_kw')[:, cols],
+        matrix.months[cols],
+        tariff_ids,
+        book
+    )
+
+
+def recommend_tariffs(
+    matrix: SiteMonthMatrix,
+    site_master: pd.DataFrame,
+    book: TariffBook,
+    recent_months: int = 12,
+    min_months: int = 6
+) -> pd.DataFrame:
+    """
+    Cheapest eligible tariff of every site over its recent bills.
+
+    Each tariff prices the whole fleet in one compute_bills pass; sites are
+    compared over the same observed months and the saving is annualized
+    from them. A tariff is eligible for a site if the site's voltage is in
+    its eligible_voltages (or the list is empty); the current tariff always is.
+
+    Args:
+        matrix: Site x month matrix store (kwh_bill, contract_power_kw)
+        site_master: Site master (site_id, contract_type, voltage, region, site_type)
+        book: Tariff book
+        recent_months: Number of most recent months evaluated
+        min_months: Minimum observed months for a recommendation
+
+    Returns:
+        site_id, region, site_type, contract_type, current_tariff,
+        recommended_tariff, current_cost_annual, recommended_cost_annual,
+        savings_annual_est, recommendation (sites with a current tariff and
+        enough history)
+    """
+    columns = ['site_id', 'region', 'site_type', 'contract_type', 'current_tariff',
+               'recommended_tariff', 'current_cost_annual', 'recommended_cost_annual',
+               'savings_annual_est', 'recommendation']
+    months = matrix.months[-recent_months:]
+    current_ids = site_tariff_ids(matrix.site_ids, site_master, book)
+    n_observed = (~np.isnan(matrix.measure('kwh_bill')[:, -recent_months:])).sum(axis=1)
+    keep = (current_ids != None) & (n_observed >= min_months)  # noqa: E711
+    if len(months) == 0 or not keep.any():
+        return pd.DataFrame(columns=columns)
+
+    site_ids = matrix.site_ids[keep]
+    n_observed = n_observed[keep]
+    current_ids = current_ids[keep]
+    master = site_master.drop_duplicates('site_id').set_index('site_id').reindex(site_ids)
+    voltage = master['voltage'].to_numpy() if 'voltage' in master.columns else np.full(len(site_ids), None)
+
+    sub = SiteMonthMatrix(
+        site_ids=site_ids,
+        months=months,
+        values={m: matrix.measure(m)[keep][:, -recent_months:] for m in ('kwh_bill', 'contract_power_kw')}
+    )
+    tariff_list = list(book.tariffs)
+    annual_costs = np.empty((len(site_ids), len(tariff_list)))
+    for k, tariff_id in enumerate(tariff_list):
+        tariff = book.tariffs[tariff_id]
+        bills = simulate_fleet_bills(sub, np.full(len(site_ids), tariff_id, dtype=object), book)
+        annual = np.nansum(bills.total, axis=1) * 12 / n_observed
+        eligible = (
+            np.isin(voltage, tariff.eligible_voltages) if tariff.eligible_voltages
+            else np.ones(len(site_ids), dtype=bool)
+        )
+        annual_costs[:, k] = np.where(eligible | (current_ids == tariff_id), annual, np.inf)
+
+    current_pos = pd.Index(tariff_list).get_indexer(current_ids)
+    best_pos = np.argmin(annual_costs, axis=1)
+    rows = np.arange(len(site_ids))
+    current_cost = annual_costs[rows, current_pos]
+    # Ties keep the current tariff
+    best_pos = np.where(annual_costs[rows, best_pos] < current_cost, best_pos, current_pos)
+    best_cost = annual_costs[rows, best_pos]
+
+    names = np.array([book.tariffs[t].name for t in tariff_list], dtype=object)
+    recommended = np.array(tariff_list, dtype=object)[best_pos]
+    result = pd.DataFrame({
+        'site_id': site_ids,
+        'region': master['region'].to_numpy() if 'region' in master.columns else None,
+        'site_type': master['site_type'].to_numpy() if 'site_type' in master.columns else None,
+        'contract_type': master['contract_type'].to_numpy(),
+        'current_tariff': current_ids,
+        'recommended_tariff': recommended,
+        'current_cost_annual': current_cost,
+        'recommended_cost_annual': best_cost,
+        'savings_annual_est': current_cost - best_cost,
+        'recommendation': np.where(
+            best_pos != current_pos,
+            names[current_pos] + ' → ' + names[best_pos],
+            '현행 유지'
+        )
+    })
+    return result[columns].reset_index(drop=True)
@@ -4,7 +4,12 @@ import pandas as pd
 import streamlit as st
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
+from src.rollups import RollupStore
+
+
+# Dimensions the running savings rollups are kept by
+SAVINGS_ROLLUP_DIMENSIONS = ['category', 'yymm', 'site_id', 'project_id']
 
 
 class VerifiedSavingsManager:
@@ -20,12 +25,18 @@ class VerifiedSavingsManager:
         self.data_dir = data_dir
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.savings_file = self.data_dir / "verified_savings.parquet"
+        self.rollups = RollupStore(
+            self.data_dir / "verified_savings_rollups.json",
+            dimensions=SAVINGS_ROLLUP_DIMENSIONS,
+            measures=['verified_savings_krw']
+        )
     
     def load_savings(self) -> pd.DataFrame:
         """Load all verified savings from storage."""
         if not self.savings_file.exists():
             return pd.DataFrame(columns=[
-                'id', 'yymm', 'site_id', 'category', 'verified_savings_krw', 'notes', 'created_at'
+                'id', 'yymm', 'site_id', 'category', 'project_id', 'verified_savings_krw', 'notes', 'created_at',
+                'ci_lower_krw', 'ci_upper_krw', 'ci_level', 'ci_resamples'
             ])
         
         try:
@@ -35,12 +46,14 @@ class VerifiedSavingsManager:
             st.error(f"검증 절감 데이터 로드 실패: {e}")
             return pd.DataFrame()
     
-    def save_savings(self, df: pd.DataFrame) -> None:
-        """Save verified savings to storage."""
+    def save_savings(self, df: pd.DataFrame) -> bool:
+        """Save verified savings to storage (False if the write failed)."""
         try:
             df.to_parquet(self.savings_file, index=False)
+            return True
         except Exception as e:
             st.error(f"검증 절감 저장 실패: {e}")
+            return False
     
     def create_verified_saving(
         self,
@@ -48,8 +61,10 @@ class VerifiedSavingsManager:
         site_id: Optional[str],
         category: str,
         verified_savings_krw: float,
-        notes: str = ""
-    ) -> str:
+        notes: str = "",
+        interval: Optional[Dict[str, float]] = None,
+        project_id: Optional[str] = None
+    ) -> Optional[str]:
         """
         Create a new verified saving record.
         
@@ -59,11 +74,15 @@ class VerifiedSavingsManager:
             category: Category (e.g., "3G Phase-Out", "계약전력 최적화")
             verified_savings_krw: Verified savings amount in KRW
             notes: Additional notes
+            interval: Bootstrap interval columns (ci_lower_krw, ci_upper_krw,
+                ci_level, ci_resamples); records without one keep NaN
+            project_id: Project the saving is confirmed for (optional)
         
         Returns:
-            Created record ID
+            Created record ID (None if the record could not be saved)
         """
         savings_df = self.load_savings()
+        rollups = self.load_rollups()
         
         # Generate ID
         if len(savings_df) == 0:
@@ -79,23 +98,42 @@ class VerifiedSavingsManager:
             'yymm': yymm,
             'site_id': site_id if site_id else "전체",
             'category': category,
+            'project_id': project_id,
             'verified_savings_krw': verified_savings_krw,
             'notes': notes,
-            'created_at': datetime.now().isoformat()
+            'created_at': datetime.now().isoformat(),
+            **(interval or {})
         }])
         
         # Append
-        savings_df = pd.concat([savings_df, new_record], ignore_index=True)
-        self.save_savings(savings_df)
+        savings_df = new_record if len(savings_df) == 0 else pd.concat([savings_df, new_record], ignore_index=True)
+        if not self.save_savings(savings_df):
+            return None
+        
+        # Running rollups only change by the inserted record (once it is stored)
+        self.rollups.update(rollups, self.savings_file, added=new_record.to_dict('records'))
         
         return saving_id
     
+    def load_rollups(self) -> Dict:
+        """Running rollups of the stored records (rebuilt if out of date)."""
+        return self.rollups.load(self.savings_file, self.load_savings)
+    
     def get_total_verified_savings(self) -> float:
         """Get total verified savings."""
-        savings_df = self.load_savings()
-        if len(savings_df) == 0:
-            return 0.0
-        return savings_df['verified_savings_krw'].sum()
+        return self.load_rollups()['totals']['verified_savings_krw']
+    
+    def get_savings_rollup(self, dimension: str) -> pd.DataFrame:
+        """
+        Get verified savings totals by one dimension.
+        
+        Args:
+            dimension: 'category', 'yymm', 'site_id' or 'project_id'
+        
+        Returns:
+            dimension, count and verified_savings_krw columns
+        """
+        return self.rollups.frame(self.load_rollups(), dimension)
     
     def get_savings_by_category(self, category: str) -> pd.DataFrame:
         """Get savings filtered by category."""
@@ -0,0 +1,44 @@
+"""Shared fixtures: copies of the sample datasets outside the repo tree."""
+
+import shutil
+import pandas as pd
+import pytest
+import streamlit as st
+from pathlib import Path
+from src.config_loader import DATASET_FILES
+
+# Sample datasets checked into the repo (independent of the working directory)
+SAMPLE_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def _clear_loader_caches() -> None:
+    """Drop cached datasets: the per-dataset loaders are not keyed on the data directory."""
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+@pytest.fixture
+def sample_data_dir(tmp_path) -> Path:
+    """Fresh copy of the sample datasets, so tests never read or write data/."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for file_name in DATASET_FILES.values():
+        # copyfile (not copy2): a new modification time gives the copy its own data version
+        shutil.copyfile(SAMPLE_DATA_DIR / file_name, data_dir / file_name)
+    _clear_loader_caches()
+    return data_dir
+
+
+@pytest.fixture
+def small_data_dir(tmp_path) -> Path:
+    """The sample datasets cut down to their first 20 sites."""
+    data_dir = tmp_path / "small_data"
+    data_dir.mkdir()
+    site_master = pd.read_parquet(SAMPLE_DATA_DIR / DATASET_FILES['site_master']).head(20)
+    for name, file_name in DATASET_FILES.items():
+        df = pd.read_parquet(SAMPLE_DATA_DIR / file_name)
+        if 'site_id' in df.columns:
+            df = df[df['site_id'].isin(site_master['site_id'])]
+        df.to_parquet(data_dir / file_name, index=False)
+    _clear_loader_caches()
+    return data_dir
@@ -0,0 +1,41 @@
+"""Unit tests for action management."""
+
+import pytest
+from src.actions import ActionManager
+from src.models import ActionCategory
+
+
+class TestCreateActions:
+    """Tests for single and bulk action creation."""
+
+    def test_bulk_ids_follow_existing(self, tmp_path):
+        """Test bulk actions get consecutive IDs after the existing ones, one per site."""
+        manager = ActionManager(tmp_path)
+        first = manager.create_action("담당자", ActionCategory.OTHER, "기존 조치")
+        actions = manager.create_actions(
+            owner="담당자",
+            category=ActionCategory.TARIFF_CHANGE,
+            descriptions=["A 변경", "B 변경"],
+            site_ids=["A", "B"]
+        )
+        stored = manager.load_actions()
+
+        assert first.id == "ACT0001"
+        assert [action.id for action in actions] == ["ACT0002", "ACT0003"]
+        assert stored['site_id'].tolist()[1:] == ["A", "B"]
+        assert (stored['category'] == ActionCategory.TARIFF_CHANGE.value).sum() == 2
+
+    def test_mismatched_lengths(self, tmp_path):
+        """Test descriptions must align with the sites."""
+        with pytest.raises(ValueError):
+            ActionManager(tmp_path).create_actions("담당자", ActionCategory.OTHER, ["x"], ["A", "B"])
+
+    def test_ids_past_four_digits(self, tmp_path):
+        """Test IDs keep increasing after ACT9999."""
+        manager = ActionManager(tmp_path)
+        manager.create_actions("담당자", ActionCategory.OTHER, ["x"] * 9999, [None] * 9999)
+        first = manager.create_action("담당자", ActionCategory.OTHER, "다음 조치")
+        second = manager.create_action("담당자", ActionCategory.OTHER, "그다음 조치")
+
+        assert first.id == "ACT10000"
+        assert second.id == "ACT10001"
@@ -284,11 +284,25 @@ class TestContractPowerRecommendation:
             {'yymm': '2403', 'kwh_bill': 48000, 'contract_power_kw': 100},
         ])
         
-        result = recommend_contract_power_adjustment(site_df, safety_margin=1.15)
+        result = recommend_contract_power_adjustment(site_df)
         
         assert result['current_contract_kw'] == 100
         assert result['savings_est'] > 0  # Should recommend reduction
         assert '감설' in result['recommendation']
+        assert list(site_df.columns) == ['yymm', 'kwh_bill', 'contract_power_kw']  # Input not modified
+    
+    def test_increase_with_exceedance_limit(self):
+        """Test an exceedance limit raises an undersized contract to a safe level."""
+        site_df = pd.DataFrame({
+            'kwh_bill': [36000.0, 36000.0, 36000.0, 72000.0],
+            'contract_power_kw': [40.0] * 4
+        })
+        
+        result = recommend_contract_power_adjustment(site_df, max_exceedance_prob=0.0)
+        
+        assert result['new_contract_kw'] == pytest.approx(100.0)
+        assert result['exceedance_prob'] == 0
+        assert '증설' in result['recommendation']
     
     def test_no_data(self):
         """Test with no data."""
@@ -0,0 +1,60 @@
+"""Unit tests for bounded chart helpers."""
+
+import numpy as np
+import pandas as pd
+from components.charts import lttb_indices, downsample_series, bin_2d, line_trace, scatter_figure
+
+
+class TestDownsampling:
+    """Tests for LTTB downsampling."""
+
+    def test_keeps_endpoints_and_peak(self):
+        """Test first/last points and a spike survive downsampling."""
+        x = np.arange(10_000, dtype=float)
+        y = np.sin(x / 500)
+        y[4321] = 50.0
+
+        idx = lttb_indices(x, y, 200)
+
+        assert len(idx) == 200
+        assert idx[0] == 0 and idx[-1] == 9_999
+        assert 4321 in idx
+        assert np.all(np.diff(idx) > 0)
+
+    def test_short_series_unchanged(self):
+        """Test series under the limit are returned as-is."""
+        x, y = downsample_series(['2024.01', '2024.02'], [1.0, 2.0], max_points=10)
+
+        assert list(x) == ['2024.01', '2024.02']
+
+    def test_line_trace_switches_to_webgl(self):
+        """Test long series are downsampled into a WebGL trace."""
+        trace = line_trace(np.arange(100_000), np.random.default_rng(0).random(100_000),
+                           max_points=8_000, webgl_threshold=5_000)
+
+        assert trace.type == 'scattergl'
+        assert len(trace.x) == 8_000
+
+
+class TestScatterFigure:
+    """Tests for scatter rendering modes."""
+
+    def test_modes_by_size(self):
+        """Test SVG, WebGL and binned modes by point count."""
+        rng = np.random.default_rng(1)
+        df = pd.DataFrame({'a': rng.random(2_000), 'b': rng.random(2_000), 'z': rng.random(2_000)})
+
+        svg = scatter_figure(df, 'a', 'b', color='z', webgl_threshold=5_000, max_points=10_000)
+        webgl = scatter_figure(df, 'a', 'b', color='z', webgl_threshold=1_000, max_points=10_000)
+        binned = scatter_figure(df, 'a', 'b', color='z', max_points=1_000, bins=20)
+
+        assert svg.data[0].type == 'scatter'
+        assert webgl.data[0].type == 'scattergl'
+        assert binned.data[0].type == 'heatmap'
+        assert np.asarray(binned.data[0].z).shape == (20, 20)
+
+    def test_bin_counts(self):
+        """Test binned counts add up to the number of points."""
+        _, _, z = bin_2d(np.array([0.0, 0.1, 1.0]), np.array([0.0, 0.1, 1.0]), bins=2)
+
+        assert np.nansum(z) == 3
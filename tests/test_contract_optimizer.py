@@ -0,0 +1,86 @@
+"""Unit tests for the contract power optimizer."""
+
+import numpy as np
+import pytest
+from src.contract_optimizer import optimize_contract_power
+
+
+def _brute_force(demand, basic, penalty):
+    """Expected cost on a fine kW grid."""
+    grid = np.linspace(0, demand.max() * 1.2, 20001)
+    cost = basic * grid + penalty * np.maximum(demand[None, :] - grid[:, None], 0).mean(axis=1)
+    return grid[np.argmin(cost)], cost.min()
+
+
+class TestOptimizeContractPower:
+    """Tests for optimize_contract_power."""
+
+    def test_matches_brute_force(self):
+        """Test the chosen level is the cost minimum over a fine kW grid."""
+        rng = np.random.default_rng(3)
+        demand = rng.lognormal(4, 0.3, (50, 12))
+        result = optimize_contract_power(demand, np.full(50, 200.0), 8000, 12000, min_change_ratio=0)
+
+        for i in range(5):
+            _, best_cost = _brute_force(demand[i], 8000, 12000)
+            assert result['recommended_cost'][i] == pytest.approx(best_cost, rel=1e-6)
+        # Newsvendor: exceed with probability about basic / penalty
+        assert np.abs(result['exceedance_prob'] - 8000 / 12000).max() <= 1 / 12
+
+    def test_savings_and_exceedance(self):
+        """Test an oversized contract is reduced with a positive saving."""
+        demand = np.array([[50.0, 60.0, 70.0, 80.0]])
+        result = optimize_contract_power(demand, np.array([120.0]), 8000, 12000)
+
+        assert result['recommended_kw'][0] < 120
+        assert result['savings_est'][0] == pytest.approx(result['current_cost'][0] - result['recommended_cost'][0])
+        assert result['savings_est'][0] > 0
+        assert result['current_exceedance_prob'][0] == 0
+
+    def test_exceedance_limit(self):
+        """Test levels above the accepted exceedance probability are excluded."""
+        demand = np.array([[50.0, 60.0, 70.0, 80.0]])
+        result = optimize_contract_power(demand, np.array([120.0]), 8000, 12000, max_exceedance_prob=0.25)
+
+        assert result['recommended_kw'][0] == pytest.approx(70.0)
+        assert result['exceedance_prob'][0] == pytest.approx(0.25)
+
+    def test_small_change_and_missing_history(self):
+        """Test changes within the band and sites without demand keep the contract."""
+        demand = np.array([[95.0, 95.0, np.nan], [np.nan, np.nan, np.nan]])
+        result = optimize_contract_power(demand, np.array([100.0, 30.0]), 8000, 12000)
+
+        np.testing.assert_allclose(result['recommended_kw'], [100.0, 30.0])
+        np.testing.assert_allclose(result['savings_est'], [0.0, 0.0])
+        assert np.isnan(result['exceedance_prob'][1])
+
+    def test_chunked_equals_single_batch(self, monkeypatch):
+        """Test chunking over sites does not change the decision."""
+        rng = np.random.default_rng(5)
+        demand = rng.lognormal(4, 0.3, (30, 12))
+        current = rng.uniform(30, 120, 30)
+        full = optimize_contract_power(demand, current, 8000, 12000)
+        monkeypatch.setattr('src.contract_optimizer.OPTIMIZER_CHUNK_SITES', 7)
+        chunked = optimize_contract_power(demand, current, 8000, 12000)
+
+        np.testing.assert_allclose(chunked['recommended_kw'], full['recommended_kw'])
+        np.testing.assert_allclose(chunked['savings_est'], full['savings_est'])
+
+    def test_flat_cost_segment(self):
+        """Test float ties keep the current contract and otherwise pick the lowest kW."""
+        # basic / penalty = 2/3 = P(D > C) for C in [10.1, 20.3]: the cost is flat there
+        demand = np.array([[10.1, 20.3, 30.7], [10.1, 20.3, 30.7]])
+        result = optimize_contract_power(demand, np.array([20.3, 40.0]), 8000, 12000)
+
+        assert result['recommended_cost'][0] == pytest.approx(result['current_cost'][0])
+        np.testing.assert_allclose(result['recommended_kw'], [20.3, 10.1])
+        assert result['savings_est'][0] == 0
+        assert result['savings_est'][1] > 1000
+
+    def test_min_saving(self):
+        """Test changes saving less than min_saving_krw keep the current contract."""
+        demand = np.array([[50.0, 60.0, 70.0, 80.0]])
+        result = optimize_contract_power(demand, np.array([120.0]), 8000, 12000, min_saving_krw=1e6)
+
+        assert result['recommended_kw'][0] == 120.0
+        assert result['savings_est'][0] == 0
@@ -0,0 +1,114 @@
+"""Unit tests for the price/volume variance decomposition."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.analytics import decompose_cost_variance
+from src.cost_variance import build_site_variance, rollup_variance
+
+
+def _data():
+    rng = np.random.default_rng(7)
+    sites = [f'S{i}' for i in range(6)]
+    months = [202401, 202402, 202501, 202502]
+    bills = pd.DataFrame(
+        [(ym, s) for ym in months for s in sites], columns=['yymm', 'site_id']
+    )
+    bills['kwh_bill'] = rng.uniform(100, 1000, len(bills)).round(1)
+    bills['cost_bill'] = (bills['kwh_bill'] * rng.uniform(90, 140, len(bills))).round(0)
+    site_master = pd.DataFrame({
+        'site_id': sites,
+        'region': ['서울', '서울', '부산', '부산', '대구', '대구'],
+        'site_type': ['A', 'B'] * 3,
+        'contract_type': ['정액', '종량'] * 3,
+        'network_gen': ['5G', 'LTE', '3G', '5G', 'LTE', '3G']
+    })
+    plan = pd.DataFrame({
+        'yymm': months,
+        'site_id': [None] * 4,
+        'kwh_plan': [3000.0, 3100.0, 3200.0, 3300.0],
+        'cost_plan': [360000.0, 372000.0, 390000.0, 400000.0]
+    })
+    return bills, site_master, plan
+
+
+class TestSiteVariance:
+    """Tests for build_site_variance."""
+
+    def test_effects_reconcile_per_site(self):
+        """Test usage + price effects equal the cost change of every site-month."""
+        bills, site_master, _ = _data()
+        result = build_site_variance(bills, site_master)
+
+        assert set(result['yymm']) == {202501, 202502}
+        np.testing.assert_allclose(
+            result['usage_effect'] + result['price_effect'],
+            result['cost_actual'] - result['cost_base']
+        )
+
+    def test_single_site_matches_scalar(self):
+        """Test one site-month equals decompose_cost_variance."""
+        bills, site_master, _ = _data()
+        row = build_site_variance(bills, site_master).iloc[0]
+
+        expected = decompose_cost_variance(row['cost_actual'], row['cost_base'], row['kwh_actual'], row['kwh_base'])
+        assert row['usage_effect'] == pytest.approx(expected['usage_effect'])
+        assert row['price_effect'] == pytest.approx(expected['price_effect'])
+
+    def test_new_site_uses_fleet_price(self):
+        """Test a site without prior-year volume is valued at the fleet price."""
+        bills, site_master, _ = _data()
+        bills = bills[~((bills['site_id'] == 'S0') & (bills['yymm'] == 202401))]
+        result = build_site_variance(bills, site_master)
+        row = result[(result['site_id'] == 'S0') & (result['yymm'] == 202501)].iloc[0]
+
+        assert row['kwh_base'] == 0
+        assert row['price_base'] > 0
+        assert row['usage_effect'] + row['price_effect'] == pytest.approx(row['cost_actual'])
+
+    def test_plan_price_baseline(self):
+        """Test the plan baseline values prior-year volume at the plan unit price."""
+        bills, site_master, plan = _data()
+        result = build_site_variance(bills, site_master, plan, baseline='plan_price')
+
+        assert np.allclose(result.loc[result['yymm'] == 202501, 'price_base'], 390000.0 / 3200.0)
+
+    def test_unknown_baseline(self):
+        """Test unsupported baselines are rejected."""
+        bills, site_master, _ = _data()
+        with pytest.raises(ValueError):
+            build_site_variance(bills, site_master, baseline='budget')
+
+
+class TestRollupVariance:
+    """Tests for rollup_variance."""
+
+    @pytest.mark.parametrize('dimension', ['region', 'site_type', 'contract_type', 'network_gen'])
+    def test_groups_reconcile(self, dimension):
+        """Test volume + mix + price equal the total in every group and groups sum to the fleet."""
+        bills, site_master, _ = _data()
+        site_variance = build_site_variance(bills, site_master)
+        groups = rollup_variance(site_variance, [dimension], by_month=True)
+        fleet = rollup_variance(site_variance).iloc[0]
+
+        np.testing.assert_allclose(
+            groups['volume_effect'] + groups['mix_effect'] + groups['price_effect'],
+            groups['total_variance']
+        )
+        assert groups['total_variance'].sum() == pytest.approx(fleet['total_variance'])
+        assert groups['price_effect'].sum() == pytest.approx(fleet['price_effect'])
+
+    def test_mix_effect_from_volume_shift(self):
+        """Test moving volume to a dearer site at constant prices is pure mix."""
+        bills = pd.DataFrame({
+            'yymm': [202401, 202401, 202501, 202501],
+            'site_id': ['A', 'B', 'A', 'B'],
+            'kwh_bill': [100.0, 100.0, 50.0, 150.0],
+            'cost_bill': [10000.0, 20000.0, 5000.0, 30000.0]
+        })
+        site_master = pd.DataFrame({'site_id': ['A', 'B'], 'region': ['서울', '서울']})
+        fleet = rollup_variance(build_site_variance(bills, site_master)).iloc[0]
+
+        assert fleet['volume_effect'] == pytest.approx(0.0)
+        assert fleet['price_effect'] == pytest.approx(0.0)
+        assert fleet['mix_effect'] == pytest.approx(5000.0)
@@ -0,0 +1,141 @@
+"""Unit tests for the data access layer's bulk loaders."""
+
+import threading
+import time
+import pandas as pd
+import pytest
+import src.data_access as data_access
+from src.data_access import DataAccessLayer, DatasetBundle, DATASET_FILES, DIMENSION_COLUMNS
+from src.savings_validation import estimate_savings
+
+
+class TestBulkLoading:
+    """Tests for read_all and load_all."""
+
+    def test_read_all_matches_single_reads(self, sample_data_dir):
+        """Test the bundle holds the same validated frames as read_dataset."""
+        dal = DataAccessLayer(sample_data_dir, generate_missing=False)
+        bundle = dal.read_all()
+
+        assert isinstance(bundle, DatasetBundle)
+        assert list(bundle.as_dict()) == list(DATASET_FILES)
+        for name, df in bundle.as_dict().items():
+            pd.testing.assert_frame_equal(df, dal.read_dataset(name))
+
+    def test_reads_run_concurrently(self, sample_data_dir, monkeypatch):
+        """Test the dataset reads overlap instead of running one after another."""
+        dal = DataAccessLayer(sample_data_dir, generate_missing=False)
+        threads = set()
+
+        def slow_read(name):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.2)
+            return pd.DataFrame({'name': [name]})
+
+        monkeypatch.setattr(dal, 'read_dataset', slow_read)
+        start = time.perf_counter()
+        bundle = dal.read_all()
+        elapsed = time.perf_counter() - start
+
+        assert bundle.site_master['name'].iloc[0] == 'site_master'
+        assert len(threads) == len(DATASET_FILES)
+        assert elapsed < 0.2 * len(DATASET_FILES) / 2
+
+    def test_no_context_attached_in_bare_mode(self, sample_data_dir, monkeypatch):
+        """Test workers get no script context when the caller has none."""
+        calls = []
+        monkeypatch.setattr('src.data_access.add_script_run_ctx', lambda *args: calls.append(args))
+
+        DataAccessLayer(sample_data_dir, generate_missing=False).read_all()
+
+        assert calls == []
+
+    def test_load_all_uses_cached_loaders(self, sample_data_dir):
+        """Test load_all returns what the cached per-dataset loaders return."""
+        dal = DataAccessLayer(sample_data_dir, generate_missing=False)
+        bundle = dal.load_all()
+
+        pd.testing.assert_frame_equal(bundle.bills, dal.load_bills())
+        pd.testing.assert_frame_equal(bundle.traffic, dal.load_traffic())
+
+
+class TestDimensionDtypes:
+    """Tests for the opt-in dimension column dtypes."""
+
+    def _as_object(self, df):
+        dims = [col for col in DIMENSION_COLUMNS if col in df.columns]
+        return df.astype({col: object for col in dims}).where(df.notna(), None)
+
+    @pytest.mark.parametrize('mode', ['pyarrow', 'category'])
+    def test_same_values_less_memory(self, sample_data_dir, mode):
+        """Test dimension columns keep their values and shrink bills at least 3x."""
+        baseline = DataAccessLayer(sample_data_dir, generate_missing=False, dimension_dtype='object').read_dataset('bills')
+        bills = DataAccessLayer(sample_data_dir, generate_missing=False, dimension_dtype=mode).read_dataset('bills')
+
+        assert str(bills['region'].dtype) == ('string' if mode == 'pyarrow' else 'category')
+        assert bills['kwh_bill'].dtype == baseline['kwh_bill'].dtype
+        pd.testing.assert_frame_equal(self._as_object(bills), self._as_object(baseline))
+        assert baseline.memory_usage(deep=True).sum() >= 3 * bills.memory_usage(deep=True).sum()
+
+    def test_categories_aligned_across_datasets(self, sample_data_dir):
+        """Test every dataset shares one categorical dtype per column, so merges keep it."""
+        dal = DataAccessLayer(sample_data_dir, generate_missing=False, dimension_dtype='category')
+        bills = dal.read_dataset('bills')
+        actual = dal.read_dataset('actual')
+        site_master = dal.read_dataset('site_master')
+
+        assert bills['site_id'].dtype == actual['site_id'].dtype == site_master['site_id'].dtype
+        merged = bills.merge(site_master[['site_id', 'site_type']], on='site_id', how='left')
+        assert isinstance(merged['site_id'].dtype, pd.CategoricalDtype)
+        assert merged['site_type'].notna().all()
+
+    def test_unknown_mode(self, tmp_path):
+        """Test unsupported dimension dtypes are rejected."""
+        with pytest.raises(ValueError):
+            DataAccessLayer(tmp_path, generate_missing=False, dimension_dtype='numpy')
+
+
+class TestDataVersion:
+    """Tests for get_data_version."""
+
+    def test_tariff_config_changes_version(self, sample_data_dir, tmp_path, monkeypatch):
+        """Test editing the tariff config gives a new version for tariff-driven artifacts."""
+        tariff_path = tmp_path / "tariffs.yaml"
+        monkeypatch.setattr('src.data_access.TARIFF_CONFIG_PATH', tariff_path)
+        dal = DataAccessLayer(sample_data_dir, generate_missing=False)
+        without_config = dal.get_data_version()
+
+        tariff_path.write_text("demand_hours_per_month: 720\n", encoding='utf-8')
+        with_config = dal.get_data_version()
+        tariff_path.write_text("demand_hours_per_month: 730\n# edited\n", encoding='utf-8')
+
+        assert with_config != without_config
+        assert dal.get_data_version() != with_config
+
+
+class TestSavingsLoaders:
+    """Tests for the cached savings estimate and interval."""
+
+    def test_cached_per_inputs(self, sample_data_dir, monkeypatch):
+        """Test the DAL estimate matches estimate_savings and reruns skip the bootstrap."""
+        dal = DataAccessLayer(sample_data_dir, generate_missing=False)
+        site_master = dal.load_site_master()
+        treated = site_master.loc[site_master['network_gen'] == '5G', 'site_id'].tolist()
+        calls = []
+        bootstrap = data_access.bootstrap_savings_ci
+
+        def counted_bootstrap(*args, **kwargs):
+            calls.append(1)
+            return bootstrap(*args, **kwargs)
+
+        monkeypatch.setattr(data_access, 'bootstrap_savings_ci', counted_bootstrap)
+
+        estimate = dal.load_savings_estimate(treated, 202501, 3)
+        expected = estimate_savings(dal.load_site_month_matrix(), site_master, treated, 202501, 3, 3)
+        first = dal.load_savings_interval(treated, 202501, 3, 0.9)
+        second = dal.load_savings_interval(list(reversed(treated)), 202501, 3, 0.9)
+
+        assert estimate.krw_savings_per_month == pytest.approx(expected.krw_savings_per_month)
+        assert first.krw_lower == second.krw_lower
+        assert len(calls) == 1
+        assert dal.load_savings_interval(treated, 202501, 3, 0.95).krw_lower != first.krw_lower
@@ -0,0 +1,152 @@
+"""Unit tests for derived page tables."""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.derived_tables import (
+    build_contract_optimization_table,
+    build_zero_usage_table,
+    zero_usage_summary,
+    build_risk_frame,
+    build_overcharge_table,
+    build_efficiency_table
+)
+from src.analytics import calculate_risk_score
+
+
+@pytest.fixture
+def site_master():
+    """Site master for four sites."""
+    return pd.DataFrame({
+        'site_id': [f"SITE{i:04d}" for i in range(4)],
+        'site_name': [f"국소{i}" for i in range(4)],
+        'region': ['서울', '부산', '서울', '대구'],
+        'site_type': ['기지국', '중계기', '기지국', '국사'],
+        'voltage': ['저압', '저압', '고압', '고압']
+    })
+
+
+@pytest.fixture
+def bills_df():
+    """Six months of bills; SITE0003 uses zero kWh for four months."""
+    rows = []
+    for i in range(4):
+        for m in range(1, 7):
+            kwh = 0.0 if (i == 3 and m > 2) else 10000.0 * (i + 1)
+            rows.append({
+                'site_id': f"SITE{i:04d}",
+                'yymm': 202400 + m,
+                'kwh_bill': kwh,
+                'cost_bill': kwh * 120,
+                'contract_type': '정액',
+                'contract_power_kw': 100.0,
+                'region': ['서울', '부산', '서울', '대구'][i]
+            })
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def actual_df(bills_df):
+    """Actual usage 10% below the bills for SITE0000, equal elsewhere."""
+    actual = bills_df[['site_id', 'yymm', 'kwh_bill']].rename(columns={'kwh_bill': 'kwh_actual'})
+    actual.loc[actual['site_id'] == 'SITE0000', 'kwh_actual'] *= 0.9
+    actual['cost_actual_est'] = actual['kwh_actual'] * 120
+    actual['data_source'] = 'AMI'
+    actual['confidence'] = 0.9
+    actual['region'] = 'ignored'
+    return actual
+
+
+class TestContractOptimizationTable:
+    """Tests for contract power recommendation table."""
+
+    def test_reduction_recommended(self, bills_df, site_master):
+        """Test oversized contracts get a reduction recommendation."""
+        result = build_contract_optimization_table(bills_df, site_master)
+
+        row = result.set_index('site_id').loc['SITE0000']
+        assert row['savings_est'] > 0
+        assert row['recommendation'].startswith("계약전력 감설 권고")
+        assert row['region'] == '서울'
+
+
+class TestZeroUsage:
+    """Tests for zero-usage tables."""
+
+    def test_summary(self, bills_df, site_master):
+        """Test zero months are counted and listed newest first."""
+        zero = build_zero_usage_table(bills_df, site_master)
+
+        summary = zero_usage_summary(zero, months=3)
+
+        assert summary['site_id'].tolist() == ['SITE0003']
+        assert summary.iloc[0]['zero_months'] == 4
+        assert summary.iloc[0]['recent_zero_periods'] == '202406,202405,202404,202403'
+
+    def test_summary_empty(self):
+        """Test empty input gives an empty summary."""
+        assert len(zero_usage_summary(pd.DataFrame())) == 0
+
+
+class TestRiskFrame:
+    """Tests for risk-scored frame."""
+
+    def test_scores_match_rule(self, bills_df, actual_df):
+        """Test vectorized scores match calculate_risk_score."""
+        frame = build_risk_frame(bills_df, actual_df)
+
+        row = frame.iloc[0]
+        expected = calculate_risk_score(row['impact'], row['likelihood'], row['confidence'])
+        assert row['risk_score_raw'] == pytest.approx(expected['raw_score'])
+        assert row['risk_score_display'] == pytest.approx(expected['display_score'])
+
+    def test_keeps_bill_dimensions(self, bills_df, actual_df):
+        """Test actual-side dimensions do not collide with bill columns."""
+        frame = build_risk_frame(bills_df, actual_df)
+
+        assert 'region' in frame.columns
+        assert (frame['region'] != 'ignored').all()
+        assert len(frame) == len(bills_df)
+
+
+class TestOverchargeTable:
+    """Tests for overcharge list."""
+
+    def test_threshold(self, bills_df, actual_df, site_master):
+        """Test only site-months above the error threshold are listed."""
+        result = build_overcharge_table(bills_df, actual_df, site_master)
+
+        assert set(result['site_id']) == {'SITE0000'}
+        assert np.allclose(result['billing_error_pct'], 100 / 9)
+        assert result['site_name'].iloc[0] == '국소0'
+
+
+class TestEfficiencyTable:
+    """Tests for the kWh/GB efficiency table."""
+
+    def _traffic(self, bills_df):
+        traffic = bills_df[['yymm', 'site_id']].copy()
+        traffic['gb_traffic'] = 100.0
+        # SITE0001 skips 202403 (no MoM for 202404)
+        return traffic[~((traffic['site_id'] == 'SITE0001') & (traffic['yymm'] == 202403))]
+
+    def test_all_months_and_peers(self, bills_df, site_master):
+        """Test every site-month is joined and ranked within its peer group."""
+        master = site_master.assign(network_gen=['3G', '3G', '3G', 'LTE'], site_type='기지국')
+        result = build_efficiency_table(bills_df, self._traffic(bills_df), master)
+
+        assert len(result) == 23
+        jan = result[result['yymm'] == 202401].set_index('site_id')
+        assert jan.loc['SITE0000', 'kwh_per_gb'] == pytest.approx(100.0)
+        # 3G peers SITE0000..2 have 100/200/300 kWh/GB
+        assert jan.loc['SITE0002', 'peer_percentile'] == pytest.approx(100.0)
+        assert jan.loc['SITE0001', 'peer_median_kwh_per_gb'] == pytest.approx(200.0)
+        assert jan.loc['SITE0003', 'peer_percentile'] == pytest.approx(100.0)
+
+    def test_mom_only_for_consecutive_months(self, bills_df, site_master):
+        """Test month-over-month change needs the immediately preceding month."""
+        result = build_efficiency_table(bills_df, self._traffic(bills_df), site_master).set_index(['site_id', 'yymm'])
+
+        assert result.loc[('SITE0000', 202402), 'kwh_per_gb_mom_pct'] == pytest.approx(0.0)
+        assert np.isnan(result.loc[('SITE0001', 202404), 'kwh_per_gb_mom_pct'])
+        assert np.isnan(result.loc[('SITE0000', 202401), 'kwh_per_gb_mom_pct'])
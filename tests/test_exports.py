@@ -0,0 +1,155 @@
+"""Unit tests for chunked exports and the export cache."""
+
+import io
+import os
+import threading
+import pandas as pd
+import pytest
+from src.exports import ExportCache, available_formats, export_key, write_export
+
+
+def _table(n=1_000):
+    return pd.DataFrame({
+        'site_id': [f'SITE{i:04d}' for i in range(n)],
+        'region': ['서울' if i % 2 == 0 else '부산' for i in range(n)],
+        'cost_bill': [float(i) * 1.5 for i in range(n)]
+    })
+
+
+class TestWriteExport:
+    """Tests for chunked serialization."""
+
+    def test_csv_matches_single_shot_output(self):
+        """Test chunked CSV equals to_csv with a single BOM and header."""
+        df = _table()
+        with write_export(df, 'csv', chunk_rows=128) as file:
+            content = file.read()
+
+        assert content == df.to_csv(index=False).encode('utf-8-sig')
+
+    def test_large_export_rolls_over_to_disk(self):
+        """Test exports above the spool size are written to a temp file."""
+        with write_export(_table(), 'csv', chunk_rows=100, spool_max_bytes=1_024) as file:
+            assert file._rolled
+
+    def test_parquet_round_trip(self):
+        """Test chunked Parquet reads back to the same frame."""
+        df = _table()
+        with write_export(df, 'parquet', chunk_rows=300) as file:
+            result = pd.read_parquet(io.BytesIO(file.read()))
+
+        pd.testing.assert_frame_equal(result, df)
+
+    @pytest.mark.parametrize('engine', ['xlsxwriter', 'openpyxl'])
+    def test_xlsx_round_trip(self, engine, monkeypatch):
+        """Test streamed XLSX from either engine reads back to the same frame."""
+        pytest.importorskip(engine)
+        pytest.importorskip('openpyxl')
+        monkeypatch.setattr('src.exports._XLSX_ENGINES', [engine])
+        df = _table(250)
+        df.loc[3, 'cost_bill'] = float('nan')
+        with write_export(df, 'xlsx', chunk_rows=100) as file:
+            result = pd.read_excel(io.BytesIO(file.read()))
+
+        pd.testing.assert_frame_equal(result, df)
+
+    def test_unknown_format_rejected(self):
+        """Test unsupported formats raise ValueError."""
+        with pytest.raises(ValueError):
+            write_export(_table(), 'json')
+
+    def test_available_formats(self):
+        """Test CSV and Parquet are always offered."""
+        assert {'csv', 'parquet'} <= set(available_formats())
+
+
+class TestExportCache:
+    """Tests for the export artifact cache."""
+
+    def test_builds_once_per_key(self):
+        """Test repeated requests reuse the cached file."""
+        cache = ExportCache()
+        df = _table()
+        calls = []
+
+        def build():
+            calls.append(1)
+            return write_export(df, 'csv')
+
+        key = export_key('overcharge', 'abc123', {'regions': ['서울']}, 'csv')
+        with cache.get_stream(key, build) as first, cache.get_stream(key, build) as second:
+            assert first.read() == second.read()
+            assert first is not second
+        assert len(calls) == 1
+
+    def test_keeps_exports_on_disk(self):
+        """Test cached exports are files that eviction and clear remove."""
+        cache = ExportCache(max_entries=1)
+        df = _table(10)
+        with cache.get_stream('a', lambda: write_export(df, 'csv')) as stream:
+            path = stream.name
+        assert os.path.exists(path)
+
+        cache.get_stream('b', lambda: write_export(df, 'csv')).close()
+        assert not os.path.exists(path)
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_failed_build_is_not_cached(self):
+        """Test a failing build leaves no entry and the next request retries."""
+        cache = ExportCache()
+
+        def failing_build():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            cache.get_stream('a', failing_build)
+        assert 'a' not in cache
+        with cache.get_stream('a', lambda: write_export(_table(10), 'csv')) as stream:
+            assert stream.read()
+
+    def test_key_depends_on_version_and_filters(self):
+        """Test data version, filters and format all change the key."""
+        base = export_key('t', 'v1', {'regions': ['서울']}, 'csv')
+
+        assert base == export_key('t', 'v1', {'regions': ['서울']}, 'csv')
+        assert base != export_key('t', 'v2', {'regions': ['서울']}, 'csv')
+        assert base != export_key('t', 'v1', {'regions': ['부산']}, 'csv')
+        assert base != export_key('t', 'v1', {'regions': ['서울']}, 'parquet')
+
+    def test_evicts_least_recently_used(self):
+        """Test the cache is bounded by its entry count."""
+        cache = ExportCache(max_entries=2)
+        df = _table(10)
+        for key in ['a', 'b', 'c']:
+            cache.get_stream(key, lambda: write_export(df, 'csv')).close()
+
+        assert len(cache) == 2
+        assert 'a' not in cache
+
+    def test_builds_outside_the_cache_lock(self):
+        """Test different keys build concurrently and one key builds once."""
+        cache = ExportCache()
+        df = _table(10)
+        calls = []
+        # Both builds must be running at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def build(key):
+            calls.append(key)
+            barrier.wait()
+            return write_export(df, 'csv')
+
+        def request(key):
+            cache.get_stream(key, lambda: build(key)).close()
+
+        threads = [threading.Thread(target=request, args=(key,)) for key in ['a', 'b', 'a']]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not barrier.broken
+        assert sorted(calls) == ['a', 'b']
+        assert len(cache) == 2
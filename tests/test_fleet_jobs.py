@@ -0,0 +1,117 @@
+"""Unit tests for fleet job execution layer."""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.site_matrix import build_site_month_matrix
+from src.fleet_jobs import site_shard, run_fleet_job
+from src.analytics import calculate_anomaly_score, recommend_contract_power_adjustment
+
+
+@pytest.fixture
+def bills_df():
+    """Eight months of bills for twelve sites."""
+    rng = np.random.default_rng(7)
+    rows = []
+    for i in range(12):
+        for m in range(1, 9):
+            kwh = float(rng.uniform(5000, 50000))
+            rows.append({
+                'site_id': f"SITE{i:04d}",
+                'yymm': 202400 + m,
+                'kwh_bill': kwh,
+                'cost_bill': kwh * 120,
+                'contract_power_kw': 100.0
+            })
+    return pd.DataFrame(rows)
+
+
+class TestSiteShard:
+    """Tests for stable site sharding."""
+
+    def test_stable_assignment(self):
+        """Test the same site always lands in the same shard."""
+        first = site_shard(['SITE0001', 'SITE0002', 'SITE0003'], 4)
+        second = site_shard(['SITE0003', 'SITE0001'], 4)
+
+        assert first[0] == second[1]
+        assert first[2] == second[0]
+        assert ((first >= 0) & (first < 4)).all()
+
+
+class TestRunFleetJob:
+    """Tests for sharded job execution."""
+
+    def test_parallel_matches_serial(self, bills_df):
+        """Test results do not depend on the worker count."""
+        matrix = build_site_month_matrix(bills_df)
+
+        serial = run_fleet_job('anomaly', matrix, n_workers=1)
+        parallel = run_fleet_job('anomaly', matrix, n_workers=2)
+
+        pd.testing.assert_frame_equal(serial, parallel)
+        assert serial['site_id'].is_monotonic_increasing
+
+    def test_anomaly_matches_site_rule(self, bills_df):
+        """Test the vectorized z-score matches calculate_anomaly_score."""
+        matrix = build_site_month_matrix(bills_df)
+        result = run_fleet_job('anomaly', matrix, n_workers=1).set_index('site_id')
+
+        site_bills = bills_df[bills_df['site_id'] == 'SITE0005'].sort_values('yymm')
+        expected = calculate_anomaly_score(site_bills).iloc[-1]
+
+        assert result.loc['SITE0005', 'z_score'] == pytest.approx(expected['z_score'], rel=1e-4)
+
+    def test_anomaly_window_skips_missing_months(self, bills_df):
+        """Test windows span the last observed months when a site has no bill for a month."""
+        bills_df = bills_df[~((bills_df['site_id'] == 'SITE0003') & bills_df['yymm'].isin([202404, 202405]))]
+        matrix = build_site_month_matrix(bills_df)
+        result = run_fleet_job('anomaly', matrix, n_workers=1, all_months=True)
+        result = result[result['site_id'] == 'SITE0003'].set_index('yymm')
+
+        site_bills = bills_df[bills_df['site_id'] == 'SITE0003'].sort_values('yymm')
+        expected = calculate_anomaly_score(site_bills).set_index('yymm')
+
+        assert list(result.index) == list(expected.index)
+        np.testing.assert_allclose(result['z_score'], expected['z_score'], rtol=1e-4)
+        np.testing.assert_allclose(result['rolling_mean'], expected['rolling_mean'], rtol=1e-4)
+
+    def test_anomaly_all_months_in_one_job(self, bills_df):
+        """Test scoring all months at once matches one job per month."""
+        # Gaps inside the rolling windows
+        bills_df.loc[bills_df['site_id'].isin(['SITE0001', 'SITE0002']) & (bills_df['yymm'] == 202407), 'kwh_bill'] = np.nan
+        matrix = build_site_month_matrix(bills_df)
+
+        combined = run_fleet_job('anomaly', matrix, n_workers=1, all_months=True)
+        per_month = pd.concat(
+            [run_fleet_job('anomaly', matrix, n_workers=1, yymm=int(yymm)) for yymm in matrix.months],
+            ignore_index=True
+        ).sort_values(['site_id', 'yymm'], kind='mergesort').reset_index(drop=True)
+
+        pd.testing.assert_frame_equal(combined, per_month)
+        assert combined['yymm'].nunique() == len(matrix.months)
+
+    def test_contract_matches_site_rule(self, bills_df):
+        """Test the vectorized recommendation matches the per-site rule."""
+        matrix = build_site_month_matrix(bills_df)
+        result = run_fleet_job('contract', matrix, n_workers=1).set_index('site_id')
+
+        recent = bills_df[bills_df['site_id'] == 'SITE0003']
+        expected = recommend_contract_power_adjustment(recent)
+
+        assert result.loc['SITE0003', 'savings_est'] == pytest.approx(expected['savings_est'], rel=1e-3)
+
+    def test_site_subset(self, bills_df):
+        """Test restricting the job to a subset of sites."""
+        matrix = build_site_month_matrix(bills_df)
+
+        result = run_fleet_job('risk_likelihood', matrix, n_workers=1, site_ids=['SITE0002', 'SITE9999'])
+
+        assert result['site_id'].tolist() == ['SITE0002']
+
+    def test_unknown_job(self, bills_df):
+        """Test unknown job names are rejected."""
+        matrix = build_site_month_matrix(bills_df)
+
+        with pytest.raises(ValueError):
+            run_fleet_job('unknown', matrix)
@@ -0,0 +1,144 @@
+"""Unit tests for the batched forecasting engine."""
+
+import numpy as np
+import pytest
+from src.site_matrix import SiteMonthMatrix, month_range
+from src.forecasting import (
+    build_forecast_table,
+    fill_gaps,
+    forecast_series,
+    forecast_total,
+    holt_winters,
+    seasonal_naive
+)
+
+
+def _series(n=200, n_months=36, noise=0.02, seed=0):
+    """Seasonal series with a mild trend."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_months + 12)
+    season = 1 + 0.3 * np.sin(2 * np.pi * t / 12)
+    base = rng.lognormal(8, 0.4, n)[:, None]
+    y = base * season * (1 + 0.002 * t) * rng.normal(1, noise, (n, len(t)))
+    return y[:, :n_months], y[:, n_months:]
+
+
+class TestFillGaps:
+    """Tests for fill_gaps."""
+
+    def test_same_month_then_row_mean(self):
+        """Test gaps take the same month a year apart, else the row mean."""
+        y = np.arange(24, dtype=float)[None, :].repeat(3, axis=0)
+        y[0, 15] = np.nan
+        y[1, 5] = np.nan
+        y[1, 17] = np.nan
+        y[2, :] = np.nan
+        filled = fill_gaps(y)
+
+        assert filled[0, 15] == 3
+        assert filled[1, 5] == pytest.approx(np.nanmean(np.delete(np.arange(24.0), [5, 17])))
+        assert np.isnan(filled[2]).all()
+
+
+class TestModels:
+    """Tests for the seasonal models."""
+
+    def test_seasonal_naive_repeats_last_year(self):
+        """Test seasonal naive forecasts the last observed year."""
+        history, _ = _series(n=5, n_months=24)
+        point, sd = seasonal_naive(history, 12)
+
+        np.testing.assert_allclose(point, history[:, 12:])
+        assert (sd >= 0).all()
+
+    def test_holt_winters_tracks_seasonality(self):
+        """Test Holt-Winters beats seasonal naive on a trending seasonal series."""
+        history, future = _series(n=300, n_months=36, noise=0.01)
+        hw_point, _ = holt_winters(history, 12)
+        sn_point, _ = seasonal_naive(history, 12)
+
+        hw_error = np.abs(hw_point / future - 1).mean()
+        sn_error = np.abs(sn_point / future - 1).mean()
+        assert hw_error < sn_error
+        assert hw_error < 0.03
+
+    def test_interval_width_grows_with_horizon(self):
+        """Test the prediction interval does not shrink further ahead."""
+        history, _ = _series(n=50)
+        _, sd = holt_winters(history, 12)
+
+        assert (np.diff(sd, axis=1) >= -1e-9).all()
+
+
+class TestForecastSeries:
+    """Tests for forecast_series."""
+
+    def test_chunked_equals_single_batch(self, monkeypatch):
+        """Test chunking over sites does not change the forecast."""
+        history, _ = _series(n=30)
+        full = forecast_series(history, 202412, 6)
+        monkeypatch.setattr('src.forecasting.FORECAST_CHUNK_SITES', 7)
+        chunked = forecast_series(history, 202412, 6)
+
+        np.testing.assert_allclose(chunked.point, full.point)
+        np.testing.assert_allclose(chunked.upper, full.upper)
+
+    def test_months_and_bounds(self):
+        """Test forecast months follow the history and bounds bracket the point."""
+        history, _ = _series(n=10)
+        result = forecast_series(history, 202412, 3)
+
+        assert result.months.tolist() == [202501, 202502, 202503]
+        assert (result.lower <= result.point).all() and (result.point <= result.upper).all()
+        assert (result.lower >= 0).all()
+
+    def test_short_history_falls_back(self):
+        """Test Holt-Winters falls back to seasonal naive below two seasons."""
+        history, _ = _series(n=5, n_months=18)
+        hw = forecast_series(history, 202412, 12, model='holt_winters')
+        sn = forecast_series(history, 202412, 12, model='seasonal_naive')
+
+        np.testing.assert_allclose(hw.point, sn.point)
+
+    def test_invalid_arguments(self):
+        """Test unknown models and horizons are rejected."""
+        history, _ = _series(n=2)
+        with pytest.raises(ValueError):
+            forecast_series(history, 202412, 13)
+        with pytest.raises(ValueError):
+            forecast_series(history, 202412, 6, model='arima')
+
+
+class TestForecastTables:
+    """Tests for matrix-level forecasts."""
+
+    def _matrix(self):
+        history, _ = _series(n=20, n_months=28)
+        months = np.array(month_range(202401, 202604))
+        site_ids = np.array([f"S{i:02d}" for i in range(20)], dtype=object)
+        history[3, :] = np.nan
+        return SiteMonthMatrix(
+            site_ids=site_ids,
+            months=months,
+            values={'kwh_bill': history.astype(np.float32), 'cost_bill': (history * 120).astype(np.float32)}
+        )
+
+    def test_forecast_table_layout(self):
+        """Test one row per model, site and horizon; empty sites stay NaN."""
+        table = build_forecast_table(self._matrix(), horizon=12)
+
+        assert len(table) == 2 * 20 * 12
+        assert table['yymm'].min() == 202605 and table['yymm'].max() == 202704
+        assert table.loc[table['site_id'] == 'S03', 'kwh_bill_forecast'].isna().all()
+        assert table.loc[table['site_id'] != 'S03', 'cost_bill_forecast'].notna().all()
+
+    def test_total_of_site_subset(self):
+        """Test the subset total forecasts the summed series of those sites."""
+        matrix = self._matrix()
+        total = forecast_total(matrix, 'kwh_bill', site_ids=['S00', 'S01'], horizon=3)
+        expected = forecast_series(
+            matrix.measure('kwh_bill')[:2].astype(np.float64).sum(axis=0)[None, :], 202604, 3
+        )
+
+        np.testing.assert_allclose(total['forecast'], expected.point[0])
+        assert total['yymm'].tolist() == [202605, 202606, 202607]
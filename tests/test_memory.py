@@ -0,0 +1,69 @@
+"""Unit tests for memory accounting."""
+
+import numpy as np
+import pandas as pd
+from src.data_access import DataAccessLayer
+from src.memory import (
+    deep_size_bytes,
+    derived_memory_report,
+    session_state_report,
+    format_bytes,
+    process_rss_bytes
+)
+
+
+class TestMemory:
+    """Tests for memory measurement helpers."""
+
+    def test_dataframe_deep_size(self):
+        """Test string columns are counted deeply."""
+        df = pd.DataFrame({'site_id': [f"SITE{i:04d}" for i in range(1000)]})
+
+        assert deep_size_bytes(df) > df['site_id'].to_numpy().nbytes
+
+    def test_shared_objects_counted_once(self):
+        """Test an array referenced twice is not double counted."""
+        arr = np.zeros(10_000)
+
+        assert deep_size_bytes([arr, arr]) < 2 * arr.nbytes
+
+    def test_session_state_sorted(self):
+        """Test session-state keys are reported largest first."""
+        state = {
+            'small': 1,
+            'site_review_status': {f"SITE{i:04d}": {'reviewed': True} for i in range(500)}
+        }
+
+        report = session_state_report(state)
+
+        assert report.iloc[0]['name'] == 'site_review_status'
+        assert report.iloc[0]['rows'] == 500
+
+    def test_format_and_rss(self):
+        """Test byte formatting and RSS availability."""
+        assert format_bytes(2048) == "2.0 KB"
+        assert format_bytes(None) == "-"
+        assert process_rss_bytes() is None or process_rss_bytes() > 0
+
+    def test_derived_report_skips_unbuilt_caches(self, sample_data_dir, monkeypatch):
+        """Test caches not built yet are listed as not loaded instead of being built."""
+        dal = DataAccessLayer(sample_data_dir, generate_missing=False)
+
+        def fail(*args):
+            raise AssertionError("derived table built for the report")
+
+        monkeypatch.setattr(dal, 'resident_caches', lambda: ['site_month_matrix'])
+        monkeypatch.setattr(dal, 'load_derived_table', fail)
+        monkeypatch.setattr(dal, 'load_site_index', fail)
+        report = derived_memory_report(dal).set_index('name')
+
+        assert report.loc['site_month_matrix', 'bytes'] > 0
+        assert report.loc['derived:forecast', 'type'] == 'not loaded'
+        assert pd.isna(report.loc['site_index:bills', 'bytes'])
+
+    def test_resident_caches_follow_builds(self, sample_data_dir):
+        """Test a built cache of the current version is reported as resident."""
+        dal = DataAccessLayer(sample_data_dir, generate_missing=False)
+        dal.load_site_month_matrix()
+
+        assert 'site_month_matrix' in dal.resident_caches()
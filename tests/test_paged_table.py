@@ -0,0 +1,49 @@
+"""Unit tests for server-side table paging."""
+
+import pandas as pd
+from components.paged_table import filter_table, slice_table
+
+
+def _table(n=120):
+    return pd.DataFrame({
+        'site_id': [f'SITE{i:04d}' for i in range(n)],
+        'region': ['서울' if i % 3 == 0 else '부산' for i in range(n)],
+        'savings_est': [float((i * 37) % n) for i in range(n)]
+    })
+
+
+class TestSliceTable:
+    """Tests for filtering, sorting and paging."""
+
+    def test_returns_only_requested_page(self):
+        """Test a page holds page_size rows and the total counts all rows."""
+        page, n_rows = slice_table(_table(), page=2, page_size=50)
+
+        assert n_rows == 120
+        assert len(page) == 50
+        assert page['site_id'].iloc[0] == 'SITE0050'
+
+    def test_page_is_clamped(self):
+        """Test out-of-range pages fall back to the last page."""
+        page, _ = slice_table(_table(), page=99, page_size=50)
+
+        assert len(page) == 20
+        assert page['site_id'].iloc[-1] == 'SITE0119'
+
+    def test_sort_applies_before_slicing(self):
+        """Test the first page of a descending sort holds the global maxima."""
+        df = _table()
+        page, _ = slice_table(df, sort_by='savings_est', ascending=False, page=1, page_size=10)
+
+        expected = df['savings_est'].sort_values(ascending=False).head(10).tolist()
+        assert page['savings_est'].tolist() == expected
+
+    def test_query_filters_text_columns(self):
+        """Test search matches text columns case-insensitively."""
+        df = _table()
+        assert len(filter_table(df, '서울')) == 40
+        assert len(filter_table(df, 'site001')) == 10
+
+        page, n_rows = slice_table(df, query='서울', page=1, page_size=25)
+        assert n_rows == 40
+        assert (page['region'] == '서울').all()
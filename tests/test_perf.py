@@ -0,0 +1,61 @@
+"""Unit tests for timing instrumentation."""
+
+import pandas as pd
+from src.derived_tables import zero_usage_summary
+from src.perf import start_run, timed, write_run, read_runs
+
+
+class TestPerfRun:
+    """Tests for per-rerun sections."""
+
+    def test_section_records_rows(self):
+        """Test a section keeps its name, timing and row count."""
+        run = start_run('test')
+
+        with run.section('load:bills') as section:
+            section.rows = pd.DataFrame({'a': [1, 2, 3]})
+
+        record = run.to_record()
+        assert record['sections'][0]['section'] == 'load:bills'
+        assert record['sections'][0]['rows'] == 3
+        assert record['sections'][0]['seconds'] >= 0
+
+    def test_call_and_timed(self):
+        """Test calls are recorded into the active run."""
+        @timed('build')
+        def build(n):
+            return pd.DataFrame({'a': range(n)})
+
+        run = start_run('test')
+        run.call('direct', build, 2)
+        build(5)
+
+        rows = {s['section']: s['rows'] for s in run.sections}
+        assert rows['direct'] == 2
+        assert rows['build'] == 5
+
+
+    def test_analytics_helpers_are_timed(self):
+        """Test instrumented helpers called inside a page land in its run."""
+        zero_usage = pd.DataFrame({
+            'site_id': ['A'] * 3, 'yymm': [202401, 202402, 202403],
+            'site_name': ['A'] * 3, 'region': ['서울'] * 3, 'site_type': ['기지국'] * 3
+        })
+        run = start_run('test')
+        zero_usage_summary(zero_usage, months=3)
+
+        assert run.sections[0]['section'] == 'derived:zero_usage_summary'
+        assert run.sections[0]['rows'] == 1
+
+class TestPerfLog:
+    """Tests for the JSONL log."""
+
+    def test_round_trip(self, tmp_path):
+        """Test runs are appended and read back per page."""
+        log_path = tmp_path / 'perf.jsonl'
+        for page in ['a', 'b', 'a']:
+            write_run(start_run(page), log_path)
+
+        assert len(read_runs(log_path)) == 3
+        assert len(read_runs(log_path, page='a')) == 2
+        assert read_runs(tmp_path / 'missing.jsonl') == []
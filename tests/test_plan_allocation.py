@@ -0,0 +1,117 @@
+"""Unit tests for the fleet-to-site plan allocation."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.site_matrix import SiteMonthMatrix, month_range
+from src.plan_allocation import allocate_plan, allocation_weights, reference_columns
+from src.plan_engine import build_plan_performance
+
+
+def _data():
+    months = np.array(month_range(202401, 202512))
+    site_ids = np.array(['A', 'B', 'C'], dtype=object)
+    kwh = np.array([
+        np.full(24, 100.0),
+        np.full(24, 300.0),
+        np.r_[np.full(12, 600.0), np.full(12, 0.0)]
+    ])
+    kwh[0, 13] = np.nan
+    matrix = SiteMonthMatrix(
+        site_ids=site_ids,
+        months=months,
+        values={'kwh_bill': kwh.astype(np.float32), 'cost_bill': (kwh * 100).astype(np.float32)}
+    )
+    plan = pd.DataFrame({
+        'yymm': [202401, 202501, 202601],
+        'site_id': [None] * 3,
+        'kwh_plan': [1000.0, 2000.0, 3000.0],
+        'cost_plan': [100000.0, 200000.0, 300000.0]
+    })
+    return matrix, plan
+
+
+class TestReferenceColumns:
+    """Tests for reference_columns."""
+
+    def test_previous_year_same_month(self):
+        """Test plan months use last year's same month, the first year itself."""
+        months = np.array(month_range(202401, 202512))
+        refs = reference_columns(months, [202401, 202503, 202607])
+
+        assert months[refs].tolist() == [202401, 202403, 202507]
+
+
+class TestAllocatePlan:
+    """Tests for allocate_plan."""
+
+    def test_site_plans_sum_to_fleet(self):
+        """Test each month's site plans add back to the fleet plan."""
+        matrix, plan = _data()
+        site_plan = allocate_plan(plan, matrix)
+        monthly = site_plan.groupby('yymm')[['kwh_plan', 'cost_plan']].sum()
+
+        np.testing.assert_allclose(monthly['kwh_plan'], plan['kwh_plan'])
+        np.testing.assert_allclose(monthly['cost_plan'], plan['cost_plan'])
+        assert len(site_plan) == 3 * 3
+
+    def test_shares_follow_last_year(self):
+        """Test 2025 uses the 2024 mix and 2026 the 2025 mix (site C closed)."""
+        matrix, plan = _data()
+        site_plan = allocate_plan(plan, matrix).set_index(['yymm', 'site_id'])['kwh_plan']
+
+        assert site_plan[(202501, 'A')] == pytest.approx(2000.0 * 100 / 1000)
+        assert site_plan[(202501, 'C')] == pytest.approx(2000.0 * 600 / 1000)
+        assert site_plan[(202601, 'C')] == pytest.approx(0.0)
+        assert site_plan[(202601, 'B')] == pytest.approx(3000.0 * 300 / 400)
+
+    def test_gaps_are_filled(self):
+        """Test a missing reference month borrows the site's other year."""
+        matrix, _ = _data()
+        weights = allocation_weights(matrix, 'kwh_bill', np.array([202602]))
+
+        assert weights[0, 0] == pytest.approx(100.0)
+
+    def test_forecast_share_for_future_months(self):
+        """Test forecast shares are used after the data and sum to the fleet."""
+        matrix, plan = _data()
+        site_plan = allocate_plan(plan, matrix, method='forecast_share')
+        future = site_plan[site_plan['yymm'] == 202601].set_index('site_id')['kwh_plan']
+
+        assert future.sum() == pytest.approx(3000.0)
+        assert future['C'] == pytest.approx(0.0, abs=1e-6)
+
+    def test_site_rows_kept(self):
+        """Test plan rows that already name a site are added as they are."""
+        matrix, plan = _data()
+        plan = pd.concat([plan, pd.DataFrame({
+            'yymm': [202501], 'site_id': ['B'], 'kwh_plan': [50.0], 'cost_plan': [5000.0]
+        })], ignore_index=True)
+        site_plan = allocate_plan(plan, matrix).set_index(['yymm', 'site_id'])['kwh_plan']
+
+        assert site_plan[(202501, 'B')] == pytest.approx(2000.0 * 300 / 1000 + 50.0)
+
+    def test_unknown_method(self):
+        """Test unsupported allocation methods are rejected."""
+        matrix, plan = _data()
+        with pytest.raises(ValueError):
+            allocate_plan(plan, matrix, method='budget')
+
+
+class TestScopedPlanPerformance:
+    """Tests for plan performance of a site scope."""
+
+    def test_scope_uses_allocated_plan(self):
+        """Test a site scope compares its actuals with its share of the plan."""
+        matrix, plan = _data()
+        site_plan = allocate_plan(plan, matrix)
+        bills = pd.DataFrame({
+            'yymm': [202501, 202501, 202501],
+            'site_id': ['A', 'B', 'C'],
+            'kwh_bill': [100.0, 300.0, 0.0],
+            'cost_bill': [10000.0, 30000.0, 0.0]
+        })
+        table = build_plan_performance(bills, site_plan, site_ids=['A']).set_index('yymm')
+
+        assert table.loc[202501, 'kwh_plan'] == pytest.approx(200.0)
+        assert table.loc[202501, 'kwh_actual'] == pytest.approx(100.0)
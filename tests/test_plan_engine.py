@@ -0,0 +1,107 @@
+"""Unit tests for the vectorized plan engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.analytics import calculate_plan_variance
+from src.plan_engine import build_plan_performance, summarize_plan_performance
+
+
+def _data():
+    months = [202411, 202412, 202501, 202502, 202503]
+    bills = pd.DataFrame({
+        'yymm': np.repeat(months, 2),
+        'site_id': ['S1', 'S2'] * len(months),
+        'kwh_bill': [10.0, 20.0, 12.0, 18.0, 15.0, 15.0, 9.0, 21.0, 14.0, 14.0],
+        'cost_bill': [100.0, 200.0, 120.0, 180.0, 150.0, 150.0, 90.0, 210.0, 140.0, 140.0]
+    })
+    plan = pd.DataFrame({
+        'yymm': months + [202504],
+        'site_id': [None] * 6,
+        'kwh_plan': [30.0, 32.0, 28.0, 30.0, 30.0, 32.0],
+        'cost_plan': [300.0, 320.0, 280.0, 300.0, 300.0, 320.0]
+    })
+    return bills, plan
+
+
+class TestPlanPerformance:
+    """Tests for build_plan_performance."""
+
+    def test_monthly_matches_scalar_variance(self):
+        """Test each month equals calculate_plan_variance on its totals."""
+        bills, plan = _data()
+        table = build_plan_performance(bills, plan).set_index('yymm')
+
+        for yymm in [202411, 202501, 202503]:
+            expected = calculate_plan_variance(
+                bills.loc[bills['yymm'] == yymm, 'cost_bill'].sum(),
+                plan.loc[plan['yymm'] == yymm, 'cost_plan'].sum()
+            )
+            row = table.loc[yymm]
+            assert row['cost_variance'] == pytest.approx(expected['variance'])
+            assert row['cost_variance_pct'] == pytest.approx(expected['variance_pct'])
+            assert row['cost_achievement'] == pytest.approx(expected['achievement_rate'])
+
+    def test_ytd_resets_each_year(self):
+        """Test cumulative sums restart in January."""
+        bills, plan = _data()
+        table = build_plan_performance(bills, plan).set_index('yymm')
+
+        assert table.loc[202412, 'kwh_actual_ytd'] == pytest.approx(60.0)
+        assert table.loc[202501, 'kwh_actual_ytd'] == pytest.approx(30.0)
+        assert table.loc[202502, 'kwh_plan_ytd'] == pytest.approx(58.0)
+        assert table.loc[202502, 'kwh_ytd_achievement'] == pytest.approx(60.0 / 58.0 * 100)
+
+    def test_runrate_projects_remaining_plan(self):
+        """Test run-rate adds the remaining plan scaled by recent achievement."""
+        bills, plan = _data()
+        table = build_plan_performance(bills, plan).set_index('yymm')
+
+        # 2025 plan: 28+30+30+32 = 120; as of 202503 YTD actual 88 (plan 88), last 3 months 88/88
+        row = table.loc[202503]
+        assert row['kwh_plan_fy'] == pytest.approx(120.0)
+        assert row['kwh_runrate'] == pytest.approx(88.0 + (120.0 - 88.0) * (88.0 / 88.0))
+
+    def test_plan_only_month_kept(self):
+        """Test months with a plan but no actuals stay in the table."""
+        bills, plan = _data()
+        table = build_plan_performance(bills, plan)
+
+        assert table['yymm'].tolist()[-1] == 202504
+        assert np.isnan(table['cost_actual'].iloc[-1])
+
+    def test_zero_plan_gives_zero_pct(self):
+        """Test zero plan follows calculate_plan_variance (0%)."""
+        bills, plan = _data()
+        plan.loc[0, ['kwh_plan', 'cost_plan']] = 0.0
+        table = build_plan_performance(bills, plan)
+
+        assert table.loc[0, 'cost_variance_pct'] == 0.0
+        assert table.loc[0, 'cost_achievement'] == 0.0
+
+    def test_site_scope(self):
+        """Test actuals can be restricted to a site subset."""
+        bills, plan = _data()
+        table = build_plan_performance(bills, plan, site_ids=['S1']).set_index('yymm')
+
+        assert table.loc[202411, 'kwh_actual'] == pytest.approx(10.0)
+
+
+class TestSummarizePlanPerformance:
+    """Tests for period summaries."""
+
+    def test_period_totals(self):
+        """Test totals over a period and run-rate as of its last month."""
+        bills, plan = _data()
+        table = build_plan_performance(bills, plan)
+        summary = summarize_plan_performance(table, [202501, 202502])
+
+        assert summary['cost']['actual'] == pytest.approx(600.0)
+        assert summary['cost']['plan'] == pytest.approx(580.0)
+        assert summary['cost']['achievement'] == pytest.approx(600.0 / 580.0 * 100)
+        assert summary['cost']['ytd_achievement'] == pytest.approx(600.0 / 580.0 * 100)
+
+    def test_no_matching_month(self):
+        """Test an unmatched period gives an empty summary."""
+        bills, plan = _data()
+        assert summarize_plan_performance(build_plan_performance(bills, plan), [209901]) == {}
@@ -0,0 +1,46 @@
+"""Unit tests for precompute artifact store."""
+
+import pandas as pd
+from src.data_access import DataAccessLayer, DATASET_FILES
+from src.precompute import ArtifactStore, build_artifacts
+
+
+class TestArtifactStore:
+    """Tests for versioned artifact storage."""
+
+    def test_round_trip(self, tmp_path):
+        """Test saved artifacts load back for the same version only."""
+        store = ArtifactStore(tmp_path)
+        table = pd.DataFrame({'site_id': ['SITE0001'], 'savings_est': [1000.0]})
+
+        store.save('abc123', {'contract_optimization': table}, {'contract_optimization': 0.5})
+
+        pd.testing.assert_frame_equal(store.load('contract_optimization', 'abc123'), table)
+        assert store.load('contract_optimization', 'other') is None
+        assert store.load_manifest('abc123')['artifacts']['contract_optimization']['rows'] == 1
+
+    def test_incomplete_version_ignored(self, tmp_path):
+        """Test artifacts without a manifest are not served."""
+        store = ArtifactStore(tmp_path)
+        store.version_dir('abc123').mkdir(parents=True)
+        pd.DataFrame({'a': [1]}).to_parquet(store.version_dir('abc123') / 'rollups.parquet')
+
+        assert store.load('rollups', 'abc123') is None
+
+
+class TestBuildArtifacts:
+    """Tests for the offline table builds."""
+
+    def test_matrix_tables_match_in_process_builds(self, small_data_dir):
+        """Test matrix-driven artifacts equal what the app builds when no artifact exists."""
+        # A site-master site without bills or actuals must still get its matrix row
+        for name in ['bills', 'actual']:
+            path = small_data_dir / DATASET_FILES[name]
+            df = pd.read_parquet(path)
+            df[df['site_id'] != df['site_id'].iloc[0]].to_parquet(path, index=False)
+        dal = DataAccessLayer(small_data_dir, generate_missing=False)
+
+        tables, _ = build_artifacts(dal.read_all().as_dict(), n_workers=1)
+
+        for name in ['forecast', 'site_plan', 'tariff_recommendation']:
+            pd.testing.assert_frame_equal(tables[name], dal.load_derived_table(name))
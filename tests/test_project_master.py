@@ -0,0 +1,68 @@
+"""Unit tests for the cached project registry."""
+
+import os
+import pandas as pd
+import pytest
+from src.project_master import ProjectMasterManager
+
+
+class TestProjectRegistry:
+    """Tests for ProjectMasterManager keyed access."""
+
+    def test_lookups_do_not_read_disk(self, tmp_path, monkeypatch):
+        """Test lookups and domain listings are served from the registry."""
+        manager = ProjectMasterManager(tmp_path)
+        manager.load_projects()
+        monkeypatch.setattr(pd, 'read_parquet', lambda *a, **k: pytest.fail("parquet re-read"))
+
+        assert manager.get_project('PRJ_CORE_002')['project_name'] == 'Server Power Saving'
+        assert manager.get_project('PRJ_NONE_001') is None
+        assert [p['project_id'] for p in manager.list_projects('Core/전송')] == ['PRJ_CORE_001', 'PRJ_CORE_002']
+        assert len(manager.list_projects()) == 12
+
+    def test_next_id_per_domain(self, tmp_path):
+        """Test new IDs continue each domain's numbering."""
+        manager = ProjectMasterManager(tmp_path)
+
+        assert manager.add_project('AI 냉방 제어', '설비분야') == 'PRJ_FACILITY_005'
+        assert manager.add_project('전송 장비 절전', 'Core/전송') == 'PRJ_CORE_003'
+        assert manager.add_project('기타 과제', '기타') == 'PRJ_OTHER_001'
+        assert manager.add_project('AI 냉방 제어 2', '설비분야') == 'PRJ_FACILITY_006'
+
+    def test_malformed_ids_are_ignored(self, tmp_path):
+        """Test IDs outside the PRJ_<PREFIX>_<NNN> pattern do not break numbering."""
+        manager = ProjectMasterManager(tmp_path)
+        df = manager.load_projects()
+        df.loc[df['project_id'] == 'PRJ_CORE_002', 'project_id'] = 'legacy-core'
+        df.to_parquet(manager.file_path, index=False)
+
+        assert manager.add_project('전송 장비 절전', 'Core/전송') == 'PRJ_CORE_002'
+
+    def test_write_through(self, tmp_path):
+        """Test updates are visible to a new manager and persisted."""
+        manager = ProjectMasterManager(tmp_path)
+        manager.update_project('PRJ_ACCESS_001', verified_savings_krw=1_000_000, status='완료')
+
+        assert ProjectMasterManager(tmp_path).get_project('PRJ_ACCESS_001')['status'] == '완료'
+        on_disk = pd.read_parquet(manager.file_path).set_index('project_id')
+        assert on_disk.loc['PRJ_ACCESS_001', 'verified_savings_krw'] == 1_000_000
+        assert not manager.update_project('PRJ_NONE_001', status='완료')
+
+    def test_external_change_invalidates(self, tmp_path):
+        """Test a project file changed elsewhere is re-read."""
+        manager = ProjectMasterManager(tmp_path)
+        df = manager.load_projects()
+        df.loc[df['project_id'] == 'PRJ_ACCESS_001', 'project_name'] = '변경됨'
+        df.to_parquet(manager.file_path, index=False)
+        os.utime(manager.file_path, ns=(1, 1))
+
+        assert manager.get_project('PRJ_ACCESS_001')['project_name'] == '변경됨'
+
+    def test_returned_records_are_copies(self, tmp_path):
+        """Test callers cannot mutate the cached registry."""
+        manager = ProjectMasterManager(tmp_path)
+        manager.get_project('PRJ_ACCESS_001')['status'] = '완료'
+        projects = manager.load_projects()
+        projects.loc[0, 'status'] = '완료'
+
+        assert manager.get_project('PRJ_ACCESS_001')['status'] != '완료'
@@ -0,0 +1,91 @@
+"""Unit tests for incrementally maintained rollups."""
+
+import os
+import pandas as pd
+import pytest
+from src.project_master import ProjectMasterManager
+from src.verified_savings import VerifiedSavingsManager
+
+
+class TestVerifiedSavingsRollups:
+    """Tests for the verified savings rollups."""
+
+    def _manager(self, tmp_path):
+        manager = VerifiedSavingsManager(tmp_path)
+        manager.create_verified_saving('202501', 'S1', '3G Phase-Out', 100.0, project_id='PRJ_ACCESS_001')
+        manager.create_verified_saving('202501', None, '계약전력 최적화', 250.0, project_id='PRJ_ACCESS_002')
+        manager.create_verified_saving('202502', 'S1', '3G Phase-Out', 50.0)
+        return manager
+
+    def test_rollups_match_records(self, tmp_path):
+        """Test incremental rollups equal a groupby over the records."""
+        manager = self._manager(tmp_path)
+        records = manager.load_savings()
+
+        assert manager.get_total_verified_savings() == pytest.approx(400.0)
+        for dimension in ['category', 'yymm', 'site_id', 'project_id']:
+            rollup = manager.get_savings_rollup(dimension).set_index(dimension)
+            expected = records.groupby(records[dimension].astype(str).where(records[dimension].notna()))
+            expected = expected['verified_savings_krw'].agg(['sum', 'count'])
+            assert rollup['verified_savings_krw'].to_dict() == pytest.approx(expected['sum'].to_dict())
+            assert rollup['count'].to_dict() == expected['count'].to_dict()
+
+    def test_totals_do_not_reload_records(self, tmp_path, monkeypatch):
+        """Test reads of an up-to-date rollup never touch the records."""
+        manager = self._manager(tmp_path)
+        monkeypatch.setattr(manager, 'load_savings', lambda: pytest.fail("records reloaded"))
+
+        assert manager.get_total_verified_savings() == pytest.approx(400.0)
+        assert len(manager.get_savings_rollup('category')) == 2
+
+    def test_rebuilt_when_records_change_elsewhere(self, tmp_path):
+        """Test a rollup is rebuilt when the records were written without it."""
+        manager = self._manager(tmp_path)
+        records = manager.load_savings()
+        records.iloc[:1].to_parquet(manager.savings_file, index=False)
+        os.utime(manager.savings_file, ns=(1, 1))
+
+        assert manager.get_total_verified_savings() == pytest.approx(100.0)
+        assert manager.get_savings_rollup('yymm')['yymm'].tolist() == ['202501']
+
+    def test_unknown_dimension(self, tmp_path):
+        """Test rollups exist only for the configured dimensions."""
+        with pytest.raises(ValueError):
+            self._manager(tmp_path).get_savings_rollup('notes')
+
+
+    def test_failed_write_leaves_rollups(self, tmp_path, monkeypatch):
+        """Test a record that could not be saved is not added to the totals."""
+        manager = self._manager(tmp_path)
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(pd.DataFrame, 'to_parquet', fail)
+
+        assert manager.create_verified_saving('202503', 'S2', '3G Phase-Out', 999.0) is None
+        assert manager.get_total_verified_savings() == pytest.approx(400.0)
+
+class TestProjectRollups:
+    """Tests for the project KPI rollups."""
+
+    def test_updates_move_between_groups(self, tmp_path):
+        """Test adds and updates keep status/domain rollups equal to the projects."""
+        manager = ProjectMasterManager(tmp_path)
+        new_id = manager.add_project('AI 냉방 제어', '설비분야', target_savings_krw=5_000_000)
+        manager.update_project('PRJ_ACCESS_001', verified_savings_krw=1_000_000, status='완료')
+        manager.update_project(new_id, actual_savings_krw=2_000_000, status='진행 중')
+        projects = manager.load_projects()
+
+        totals = manager.get_totals()
+        assert totals['count'] == len(projects)
+        assert totals['verified_savings_krw'] == pytest.approx(projects['verified_savings_krw'].sum())
+
+        for dimension in ['status', 'domain']:
+            rollup = manager.get_rollup(dimension).set_index(dimension)
+            expected = projects.groupby(dimension)[['target_savings_krw', 'actual_savings_krw', 'verified_savings_krw']].sum()
+            pd.testing.assert_frame_equal(
+                rollup[expected.columns].sort_index(), expected.sort_index().astype(float),
+                check_names=False
+            )
+            assert rollup['count'].to_dict() == projects[dimension].value_counts().to_dict()
@@ -0,0 +1,90 @@
+"""Unit tests for bootstrap savings intervals."""
+
+import numpy as np
+import pytest
+from src.savings_validation import estimate_savings
+from src.savings_uncertainty import bootstrap_savings_ci, resample_counts
+from src.verified_savings import VerifiedSavingsManager
+from tests.test_savings_validation import _fleet
+
+
+class TestResampleCounts:
+    """Tests for resample_counts."""
+
+    def test_counts_match_draws(self):
+        """Test counts equal per-row bincounts of the index matrix."""
+        index = np.random.default_rng(0).integers(0, 5, (4, 7))
+        counts = resample_counts(index, 5)
+
+        expected = np.stack([np.bincount(row, minlength=5) for row in index])
+        np.testing.assert_array_equal(counts, expected)
+        assert (counts.sum(axis=1) == 7).all()
+
+
+class TestBootstrapSavingsCI:
+    """Tests for bootstrap_savings_ci."""
+
+    def test_interval_covers_estimate(self):
+        """Test the interval brackets the point estimate and the injected saving."""
+        matrix, site_master, treated, expected = _fleet()
+        estimate = estimate_savings(matrix, site_master, treated, 202501)
+        interval = bootstrap_savings_ci(estimate, n_resamples=2000)
+
+        assert interval.kwh_lower < estimate.kwh_savings_per_month < interval.kwh_upper
+        assert interval.krw_lower < estimate.krw_savings_per_month < interval.krw_upper
+        assert interval.kwh_lower < expected < interval.kwh_upper
+        assert not interval.includes_zero
+
+    def test_chunking_is_consistent(self, monkeypatch):
+        """Test small chunks give the same interval for a fixed seed."""
+        matrix, site_master, treated, _ = _fleet(n_sites=80)
+        estimate = estimate_savings(matrix, site_master, treated, 202501)
+        full = bootstrap_savings_ci(estimate, n_resamples=500, seed=3)
+
+        monkeypatch.setattr('src.savings_uncertainty.BOOTSTRAP_CHUNK_ELEMENTS', 100)
+        chunked = bootstrap_savings_ci(estimate, n_resamples=500, seed=3)
+
+        # Draw order differs between chunkings, so only the spread is comparable
+        assert chunked.krw_upper - chunked.krw_lower == pytest.approx(full.krw_upper - full.krw_lower, rel=0.3)
+
+    def test_higher_confidence_is_wider(self):
+        """Test a 95% interval contains the 80% interval."""
+        matrix, site_master, treated, _ = _fleet(n_sites=80)
+        estimate = estimate_savings(matrix, site_master, treated, 202501)
+        narrow = bootstrap_savings_ci(estimate, n_resamples=1000, confidence=0.8)
+        wide = bootstrap_savings_ci(estimate, n_resamples=1000, confidence=0.95)
+
+        assert wide.krw_lower <= narrow.krw_lower
+        assert wide.krw_upper >= narrow.krw_upper
+
+    def test_no_effect_includes_zero(self):
+        """Test an untreated period gives an interval around zero."""
+        matrix, site_master, treated, _ = _fleet(saving=0.0)
+        estimate = estimate_savings(matrix, site_master, treated, 202501)
+
+        assert bootstrap_savings_ci(estimate, n_resamples=1000, confidence=0.95).includes_zero
+
+    def test_invalid_confidence(self):
+        """Test confidence levels outside (0, 1) are rejected."""
+        matrix, site_master, treated, _ = _fleet(n_sites=40)
+        estimate = estimate_savings(matrix, site_master, treated, 202501)
+        with pytest.raises(ValueError):
+            bootstrap_savings_ci(estimate, confidence=95)
+
+
+class TestVerifiedSavingsInterval:
+    """Tests for storing intervals with verified savings records."""
+
+    def test_interval_stored_with_record(self, tmp_path):
+        """Test interval columns persist and older records keep NaN."""
+        manager = VerifiedSavingsManager(tmp_path)
+        manager.create_verified_saving('202501', None, '3G Phase-Out', 1000.0)
+        manager.create_verified_saving(
+            '202502', None, '3G Phase-Out', 2000.0,
+            interval={'ci_lower_krw': 1500.0, 'ci_upper_krw': 2500.0, 'ci_level': 0.9, 'ci_resamples': 10000}
+        )
+        records = manager.load_savings().set_index('id')
+
+        assert records.loc['SAV0002', 'ci_lower_krw'] == 1500.0
+        assert records.loc['SAV0002', 'ci_level'] == 0.9
+        assert np.isnan(records.loc['SAV0001', 'ci_upper_krw'])
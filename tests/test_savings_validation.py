@@ -0,0 +1,101 @@
+"""Unit tests for the difference-in-differences savings validator."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.site_matrix import SiteMonthMatrix, month_range
+from src.savings_validation import estimate_savings, nearest_neighbours, seasonal_factors
+
+
+def _fleet(n_sites=400, saving=0.1, seed=0):
+    """Seasonal fleet; the first quarter of sites saves `saving` from 202501 on."""
+    rng = np.random.default_rng(seed)
+    months = np.array(month_range(202301, 202512))
+    season = 1 + 0.3 * np.sin(2 * np.pi * (months % 100) / 12)
+    kwh = rng.lognormal(8, 0.5, n_sites)[:, None] * season[None, :] * rng.normal(1, 0.02, (n_sites, len(months)))
+    go_live = list(months).index(202501)
+    treated = n_sites // 4
+    expected = (kwh[:treated, go_live:go_live + 6] * saving).mean(axis=1).sum()
+    kwh[:treated, go_live:] *= (1 - saving)
+
+    site_ids = np.array([f"SITE{i:04d}" for i in range(n_sites)], dtype=object)
+    matrix = SiteMonthMatrix(
+        site_ids=site_ids,
+        months=months,
+        values={'kwh_bill': kwh.astype(np.float32), 'cost_bill': (kwh * 120).astype(np.float32)}
+    )
+    site_master = pd.DataFrame({
+        'site_id': site_ids,
+        'site_type': np.where(np.arange(n_sites) % 2 == 0, '기지국', '중계국')
+    })
+    return matrix, site_master, site_ids[:treated], expected
+
+
+class TestNearestNeighbours:
+    """Tests for the chunked nearest-neighbour search."""
+
+    def test_matches_brute_force(self, monkeypatch):
+        """Test chunked search equals a full distance matrix."""
+        monkeypatch.setattr('src.savings_validation.NN_CHUNK_ELEMENTS', 50)
+        rng = np.random.default_rng(1)
+        treated, candidates = rng.normal(size=(37, 2)), rng.normal(size=(11, 2))
+
+        expected = ((treated[:, None, :] - candidates[None, :, :]) ** 2).sum(axis=2).argmin(axis=1)
+        np.testing.assert_array_equal(nearest_neighbours(treated, candidates), expected)
+
+
+class TestEstimateSavings:
+    """Tests for estimate_savings."""
+
+    def test_recovers_injected_savings(self):
+        """Test the DiD estimate recovers a 10% reduction in kWh and KRW."""
+        matrix, site_master, treated, expected = _fleet()
+        result = estimate_savings(matrix, site_master, treated, 202501)
+
+        assert len(result.treated_ids) == len(treated)
+        assert result.kwh_savings_per_month == pytest.approx(expected, rel=0.05)
+        assert result.krw_savings_per_month == pytest.approx(expected * 120, rel=0.05)
+        assert result.kwh_savings_total == pytest.approx(result.kwh_savings_per_month * 6)
+
+    def test_no_effect_is_near_zero(self):
+        """Test an untreated period shows no savings."""
+        matrix, site_master, treated, expected = _fleet(saving=0.0)
+        result = estimate_savings(matrix, site_master, treated, 202501)
+
+        assert abs(result.kwh_savings_per_month) < 0.01 * matrix.measure('kwh_bill')[:100, 24].sum()
+
+    def test_controls_share_attributes(self):
+        """Test controls are untreated sites of the same site type."""
+        matrix, site_master, treated, _ = _fleet()
+        result = estimate_savings(matrix, site_master, treated, 202501)
+        site_type = site_master.set_index('site_id')['site_type']
+
+        assert not set(result.control_ids) & set(treated)
+        np.testing.assert_array_equal(
+            site_type.loc[result.treated_ids].to_numpy(),
+            site_type.loc[result.control_ids].to_numpy()
+        )
+
+    def test_incomplete_treated_sites_excluded(self):
+        """Test treated sites with gaps are excluded and counted."""
+        matrix, site_master, treated, _ = _fleet()
+        matrix.values['kwh_bill'][0, 20] = np.nan
+        result = estimate_savings(matrix, site_master, treated, 202501)
+
+        assert result.n_excluded == 1
+        assert treated[0] not in result.treated_ids
+
+    def test_go_live_outside_range(self):
+        """Test a go-live month without pre-period data gives None."""
+        matrix, site_master, treated, _ = _fleet()
+
+        assert estimate_savings(matrix, site_master, treated, 202301) is None
+        assert estimate_savings(matrix, site_master, treated, 209901) is None
+
+    def test_seasonal_factors_average_one(self):
+        """Test month-of-year factors are centred on 1."""
+        matrix, _, _, _ = _fleet()
+        factors = seasonal_factors(matrix)
+
+        assert factors.mean() == pytest.approx(1.0, abs=0.01)
+        assert factors[0] == pytest.approx(factors[12])
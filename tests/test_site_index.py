@@ -0,0 +1,53 @@
+"""Unit tests for site index module."""
+
+import pytest
+import pandas as pd
+from src.site_index import SiteIndex
+
+
+@pytest.fixture
+def bills_df():
+    """Unsorted long-format bills for three sites."""
+    return pd.DataFrame([
+        {'site_id': 'SITE002', 'yymm': 202402, 'kwh_bill': 220},
+        {'site_id': 'SITE001', 'yymm': 202402, 'kwh_bill': 120},
+        {'site_id': 'SITE003', 'yymm': 202401, 'kwh_bill': 310},
+        {'site_id': 'SITE001', 'yymm': 202401, 'kwh_bill': 110},
+        {'site_id': 'SITE002', 'yymm': 202401, 'kwh_bill': 210},
+    ])
+
+
+class TestSiteIndex:
+    """Tests for site offset index."""
+
+    def test_single_site_slice(self, bills_df):
+        """Test one site's history is returned sorted by month."""
+        index = SiteIndex(bills_df)
+
+        history = index.get('SITE001')
+
+        assert history['yymm'].tolist() == [202401, 202402]
+        assert history['kwh_bill'].tolist() == [110, 120]
+        assert index.row_range('SITE001') == (0, 2)
+
+    def test_unknown_site(self, bills_df):
+        """Test unknown site returns an empty frame."""
+        index = SiteIndex(bills_df)
+
+        assert len(index.get('SITE999')) == 0
+        assert 'SITE999' not in index
+
+    def test_many_sites(self, bills_df):
+        """Test histories for a list of sites keep the requested order."""
+        index = SiteIndex(bills_df)
+
+        result = index.get_many(['SITE003', 'SITE001', 'SITE999', 'SITE003'])
+
+        assert result['site_id'].tolist() == ['SITE003', 'SITE001', 'SITE001']
+
+    def test_empty_frame(self):
+        """Test index over an empty frame."""
+        index = SiteIndex(pd.DataFrame(columns=['site_id', 'yymm', 'kwh_bill']))
+
+        assert len(index) == 0
+        assert len(index.get_many(['SITE001'])) == 0
@@ -0,0 +1,60 @@
+"""Unit tests for site x month matrix store."""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.site_matrix import build_site_month_matrix, month_range
+
+
+class TestMonthRange:
+    """Tests for contiguous month range."""
+    
+    def test_year_boundary(self):
+        """Test range across a year boundary."""
+        assert month_range(202411, 202502) == [202411, 202412, 202501, 202502]
+
+
+class TestSiteMonthMatrix:
+    """Tests for matrix store construction and access."""
+    
+    @pytest.fixture
+    def matrix(self):
+        bills_df = pd.DataFrame([
+            {'site_id': 'SITE002', 'yymm': 202401, 'kwh_bill': 200, 'cost_bill': 24000, 'contract_power_kw': 10},
+            {'site_id': 'SITE001', 'yymm': 202401, 'kwh_bill': 100, 'cost_bill': 12000, 'contract_power_kw': 5},
+            {'site_id': 'SITE001', 'yymm': 202403, 'kwh_bill': 130, 'cost_bill': 15600, 'contract_power_kw': 5},
+        ])
+        actual_df = pd.DataFrame([
+            {'site_id': 'SITE001', 'yymm': 202401, 'kwh_actual': 98},
+        ])
+        return build_site_month_matrix(bills_df, actual_df)
+    
+    def test_axes(self, matrix):
+        """Test site and month axes (months are contiguous)."""
+        assert list(matrix.site_ids) == ['SITE001', 'SITE002']
+        assert list(matrix.months) == [202401, 202402, 202403]
+        assert matrix.measure('kwh_bill').dtype == np.float32
+    
+    def test_gaps_are_masked(self, matrix):
+        """Test missing site-months are NaN and unobserved."""
+        kwh = matrix.measure('kwh_bill')
+        
+        assert kwh[0, 0] == 100
+        assert np.isnan(kwh[0, 1])
+        assert not matrix.observed['kwh_bill'][0, 1]
+        assert matrix.observed['kwh_actual'].sum() == 1
+        assert np.isnan(matrix.measure('gb_traffic')).all()
+    
+    def test_lag(self, matrix):
+        """Test shifting along the month axis."""
+        lagged = matrix.lag('kwh_bill', 2)
+        
+        assert lagged[0, 2] == 100
+        assert np.isnan(lagged[0, :2]).all()
+    
+    def test_site_series(self, matrix):
+        """Test one site's series lookup."""
+        series = matrix.site_series('SITE002', 'cost_bill')
+        
+        assert series.loc[202401] == 24000
+        assert len(matrix.site_series('SITE999', 'cost_bill')) == 0
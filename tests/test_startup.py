@@ -0,0 +1,49 @@
+"""Unit tests for startup helpers."""
+
+import subprocess
+import sys
+from src.data_access import DataAccessLayer, DATASET_FILES
+from src.startup import ensure_data_ready, record_timing, get_startup_timings, warm_up
+
+
+class TestStartup:
+    """Tests for data readiness and start timings."""
+
+    def test_existing_data_is_ready(self, tmp_path):
+        """Test no generation is started when all datasets exist."""
+        for file_name in DATASET_FILES.values():
+            (tmp_path / file_name).touch()
+
+        assert ensure_data_ready(tmp_path) == 'ready'
+
+    def test_timing_recorded_once(self):
+        """Test a step keeps its first (cold) timing."""
+        record_timing('test_step', 1.5)
+        record_timing('test_step', 0.1)
+
+        assert get_startup_timings()['test_step'] == 1.5
+
+    def test_gate_imports_stay_light(self):
+        """Test the modules a page imports before the data gate do not load pandas."""
+        code = (
+            "import sys\n"
+            "import components.data_gate, components.perf_panel, styles\n"
+            "print(sorted({'pandas', 'src.data_access', 'src.analytics'} & set(sys.modules)))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "[]"
+
+
+class TestWarmUp:
+    """Tests for cache warm-up."""
+
+    def test_all_steps_timed(self, small_data_dir):
+        """Test every dataset and derived table step reports a timing."""
+        dal = DataAccessLayer(small_data_dir, generate_missing=False)
+
+        timings = warm_up(dal)
+
+        assert 'load_site_master' in timings
+        assert 'derived:risk_frame' in timings
+        assert timings['total'] >= max(v for k, v in timings.items() if k != 'total')
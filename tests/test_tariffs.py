@@ -0,0 +1,187 @@
+"""Unit tests for the tariff model and fleet bill engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.site_matrix import SiteMonthMatrix, month_range
+from src.tariffs import (
+    Tariff,
+    compute_bills,
+    load_tariff_book,
+    recommend_tariffs,
+    simulate_fleet_bills,
+    site_tariff_ids
+)
+
+
+CONFIG = {
+    'demand_hours_per_month': 720,
+    'contract_type_tariffs': {'정액': 'fixed', '종량': 'volume'},
+    'tariffs': {
+        'fixed': {
+            'name': '정액',
+            'basic_charge_krw_per_kw': 8000,
+            'energy_charge_krw_per_kwh': 80,
+            'penalty_krw_per_kw': 12000
+        },
+        'volume': {
+            'name': '종량',
+            'energy_charge_krw_per_kwh': 120
+        },
+        'tou': {
+            'name': '계절·시간대별',
+            'basic_charge_krw_per_kw': 8000,
+            'seasons': {'summer': {'months': [7], 'multiplier': 1.5}},
+            'time_of_use': {
+                'off_peak': {'share': 0.5, 'energy_charge_krw_per_kwh': 60},
+                'on_peak': {'share': 0.5, 'energy_charge_krw_per_kwh': 100}
+            }
+        }
+    }
+}
+
+
+class TestTariff:
+    """Tests for Tariff and the tariff book."""
+
+    def test_seasonal_time_of_use_rates(self):
+        """Test the energy rate is the TOU blend times the seasonal multiplier."""
+        tariff = load_tariff_book(CONFIG).tariffs['tou']
+        rates = tariff.monthly_energy_rates()
+
+        assert tariff.base_energy_rate == pytest.approx(80.0)
+        assert rates[6] == pytest.approx(120.0)
+        assert rates[0] == pytest.approx(80.0)
+
+    def test_shares_must_sum_to_one(self):
+        """Test time-of-use shares that do not add up are rejected."""
+        spec = {'time_of_use': {'peak': {'share': 0.6, 'energy_charge_krw_per_kwh': 100}}}
+        with pytest.raises(ValueError):
+            Tariff.from_config('bad', spec)
+
+    def test_unknown_mapped_tariff(self):
+        """Test a contract type mapped to an undefined tariff is rejected."""
+        config = dict(CONFIG, contract_type_tariffs={'정액': 'missing'})
+        with pytest.raises(ValueError):
+            load_tariff_book(config)
+
+    def test_default_book_matches_current_rates(self):
+        """Test the shipped tariff book carries the current flat rates."""
+        book = load_tariff_book()
+
+        assert book.tariff_for('정액').basic_charge_krw_per_kw == 8000
+        assert book.tariff_for('정액').base_energy_rate == 80
+        assert book.tariff_for('종량').base_energy_rate == 120
+
+
+class TestComputeBills:
+    """Tests for compute_bills."""
+
+    def test_components(self):
+        """Test basic, energy and penalty charges of fixed and volume sites."""
+        book = load_tariff_book(CONFIG)
+        kwh = np.array([[7200.0, np.nan], [1000.0, 2000.0]])
+        contract = np.array([[5.0, 5.0], [np.nan, np.nan]])
+        bills = compute_bills(kwh, contract, [202401, 202402], ['fixed', 'volume'], book)
+
+        assert bills.basic[0, 0] == pytest.approx(5 * 8000)
+        assert bills.energy[0, 0] == pytest.approx(7200 * 80)
+        assert bills.penalty[0, 0] == pytest.approx((10 - 5) * 12000)
+        assert np.isnan(bills.total[0, 1])
+        np.testing.assert_allclose(bills.total[1], [120000.0, 240000.0])
+
+    def test_missing_and_unknown_tariffs(self):
+        """Test sites without a tariff are NaN and undefined tariffs raise."""
+        book = load_tariff_book(CONFIG)
+        kwh = np.ones((2, 1))
+        contract = np.ones((2, 1))
+        bills = compute_bills(kwh, contract, [202401], ['fixed', None], book)
+
+        assert np.isnan(bills.total[1]).all()
+        with pytest.raises(ValueError):
+            compute_bills(kwh, contract, [202401], ['fixed', 'missing'], book)
+
+    def test_scaled_scenario(self):
+        """Test a rate-change scenario scales each component."""
+        book = load_tariff_book(CONFIG)
+        kwh = np.array([[7200.0]])
+        contract = np.array([[5.0]])
+        base = compute_bills(kwh, contract, [202407], ['tou'], book)
+        scenario = compute_bills(kwh, contract, [202407], ['tou'], book.scaled(10, -20, 0))
+
+        assert scenario.basic[0, 0] == pytest.approx(base.basic[0, 0] * 1.1)
+        assert scenario.energy[0, 0] == pytest.approx(base.energy[0, 0] * 0.8)
+
+
+class TestFleetSimulation:
+    """Tests for fleet-level simulation."""
+
+    def test_fleet_bills_over_selected_months(self):
+        """Test site tariffs come from the master and months can be restricted."""
+        book = load_tariff_book(CONFIG)
+        months = np.array(month_range(202401, 202403))
+        matrix = SiteMonthMatrix(
+            site_ids=np.array(['A', 'B', 'C'], dtype=object),
+            months=months,
+            values={
+                'kwh_bill': np.full((3, 3), 1000.0, dtype=np.float32),
+                'contract_power_kw': np.full((3, 3), 5.0, dtype=np.float32)
+            }
+        )
+        site_master = pd.DataFrame({'site_id': ['A', 'B'], 'contract_type': ['정액', '종량']})
+        tariff_ids = site_tariff_ids(matrix.site_ids, site_master, book)
+        bills = simulate_fleet_bills(matrix, tariff_ids, book, months=[202402, 202403])
+
+        assert tariff_ids.tolist() == ['fixed', 'volume', None]
+        assert bills.total.shape == (3, 2)
+        np.testing.assert_allclose(bills.total[0], 5 * 8000 + 1000 * 80)
+        np.testing.assert_allclose(bills.total[1], 1000 * 120)
+        assert np.isnan(bills.total[2]).all()
+
+
+class TestRecommendTariffs:
+    """Tests for recommend_tariffs."""
+
+    def _matrix(self):
+        months = np.array(month_range(202401, 202412))
+        kwh = np.array([
+            np.full(12, 3600.0),   # high load factor: fixed is cheaper
+            np.full(12, 100.0),    # low usage: volume is cheaper
+            np.full(12, 7200.0)    # demand over contract: penalty-free TOU is cheaper
+        ])
+        kwh[0, :6] = np.nan
+        return SiteMonthMatrix(
+            site_ids=np.array(['A', 'B', 'C'], dtype=object),
+            months=months,
+            values={
+                'kwh_bill': kwh.astype(np.float32),
+                'contract_power_kw': np.full((3, 12), 5.0, dtype=np.float32)
+            }
+        )
+
+    def test_cheapest_eligible_tariff(self):
+        """Test each site gets its cheapest eligible tariff and the annual saving."""
+        site_master = pd.DataFrame({
+            'site_id': ['A', 'B', 'C'],
+            'contract_type': ['종량', '정액', '종량'],
+            'voltage': ['저압', '저압', '고압']
+        })
+        config = dict(CONFIG)
+        config['tariffs'] = dict(CONFIG['tariffs'], tou=dict(CONFIG['tariffs']['tou'], eligible_voltages=['고압']))
+        result = recommend_tariffs(self._matrix(), site_master, load_tariff_book(config)).set_index('site_id')
+
+        assert result.loc['A', 'recommended_tariff'] == 'fixed'
+        # 6 observed months annualized: (3600 * 120 - 5 * 8000 - 3600 * 80) * 12
+        assert result.loc['A', 'savings_annual_est'] == pytest.approx((432000 - 328000) * 12)
+        assert result.loc['B', 'recommended_tariff'] == 'volume'
+        # TOU costs 40/kWh more in July but has no penalty; only open to high voltage
+        assert result.loc['C', 'recommended_tariff'] == 'tou'
+
+    def test_current_kept_without_saving(self):
+        """Test sites already on their cheapest tariff keep it with zero saving."""
+        site_master = pd.DataFrame({'site_id': ['B'], 'contract_type': ['종량'], 'voltage': ['저압']})
+        result = recommend_tariffs(self._matrix(), site_master, load_tariff_book(CONFIG))
+
+        assert result['site_id'].tolist() == ['B']
+        assert result.loc[0, 'recommendation'] == '현행 유지'
+        assert result.loc[0, 'savings_annual_est'] == 0